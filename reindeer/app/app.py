@@ -1,8 +1,9 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from app.router import product_router
+from app.router import product_router, image_router
 from browser.task.search import init, cleanup
+from browser.task.metrics import get_metrics
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -58,6 +59,7 @@ app.add_middleware(
 
 # 라우터 등록
 app.include_router(product_router)
+app.include_router(image_router)
 
 # 간단한 헬스체크 엔드포인트
 @app.get("/health")
@@ -65,6 +67,11 @@ async def health_check():
     """간단한 헬스체크 - 200 상태 반환"""
     return {"status": "OK"}
 
+@app.get("/metrics", tags=["health"])
+async def metrics():
+    """캐시 적중률 등 내부 컴포넌트 통계"""
+    return await get_metrics()
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -89,6 +96,10 @@ def custom_openapi():
             "name": "products",
             "description": "제품 검색 및 관리 API",
         },
+        {
+            "name": "images",
+            "description": "이미지 처리 상태 API",
+        },
         {
             "name": "health",
             "description": "서비스 상태 확인 API",
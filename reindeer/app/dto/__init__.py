@@ -1,3 +1,10 @@
 from app.dto.product_dto import ProductResponse, SearchRequest, SearchResponse
+from app.dto.image_dto import ImageStatusResponse, ImageStatusListResponse
 
-__all__ = ["ProductResponse", "SearchRequest", "SearchResponse"] 
\ No newline at end of file
+__all__ = [
+    "ProductResponse",
+    "SearchRequest",
+    "SearchResponse",
+    "ImageStatusResponse",
+    "ImageStatusListResponse",
+]
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class ImageStatusResponse(BaseModel):
+    """이미지 처리 상태 응답 DTO"""
+    image_url: str = Field(..., description="원본 이미지 URL", example="https://shopping-phinf.pstatic.net/main_8864667/88646679621.jpg")
+    image_id: Optional[str] = Field(None, description="이미지 고유 ID", example="3f2a9c1d0b8e4f6a7c5d2e1b0a9f8e7d")
+    status: str = Field(..., description="처리 상태 (pending, processing, completed, failed, unknown)", example="completed")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지", example=None)
+
+
+class ImageStatusListResponse(BaseModel):
+    """이미지 처리 상태 목록 응답 DTO"""
+    images: List[ImageStatusResponse] = Field(
+        ..., 
+        description="이미지별 처리 상태 목록"
+    )
+    total_count: int = Field(
+        ..., 
+        description="조회한 이미지 개수",
+        example=1
+    )
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "images": [
+                    {
+                        "image_url": "https://shopping-phinf.pstatic.net/main_8864667/88646679621.jpg",
+                        "image_id": "3f2a9c1d0b8e4f6a7c5d2e1b0a9f8e7d",
+                        "status": "completed",
+                        "error": None
+                    }
+                ],
+                "total_count": 1
+            }
+        }
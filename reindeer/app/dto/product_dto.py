@@ -54,13 +54,27 @@ class SearchRequest(BaseModel):
         description="배경 제거 여부", 
         example=True
     )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="페이지 크기",
+        example=10
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="이전 응답의 next_cursor (첫 페이지면 생략)",
+        example=None
+    )
     
     class Config:
         schema_extra = {
             "example": {
                 "query": "아이폰 14",
                 "use_cache": True,
-                "remove_background": True
+                "remove_background": True,
+                "limit": 10,
+                "cursor": None
             }
         }
 
@@ -73,9 +87,14 @@ class SearchResponse(BaseModel):
     )
     total_count: int = Field(
         ..., 
-        description="검색된 제품 총 개수",
+        description="이 페이지의 제품 개수",
         example=10
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="다음 페이지를 요청할 때 cursor로 전달할 값 (마지막 페이지면 null)",
+        example="WzEwLCJQUkQxMjM0NTYiXQ"
+    )
     query: str = Field(
         ..., 
         description="검색어",
@@ -109,6 +128,7 @@ class SearchResponse(BaseModel):
                     }
                 ],
                 "total_count": 1,
+                "next_cursor": None,
                 "query": "아이폰 14",
                 "use_cache": True,
                 "remove_background": True
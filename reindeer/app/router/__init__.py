@@ -1,3 +1,4 @@
 from app.router.product_router import router as product_router
+from app.router.image_router import router as image_router
 
-__all__ = ["product_router"] 
\ No newline at end of file
+__all__ = ["product_router", "image_router"]
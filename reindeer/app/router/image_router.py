@@ -0,0 +1,56 @@
+from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from app.dto.image_dto import ImageStatusListResponse, ImageStatusResponse
+from browser.task.image import get_image_jobs
+
+router = APIRouter(
+    prefix="/api/v1/images",
+    tags=["images"],
+    responses={
+        500: {"description": "서버 내부 오류가 발생했습니다"},
+    },
+)
+
+
+@router.get("/status",
+           response_model=ImageStatusListResponse,
+           summary="이미지 처리 상태 조회",
+           description="검색 후 백그라운드에서 처리되는 이미지들의 저장/배경 제거 상태를 조회합니다.",
+           response_description="이미지별 처리 상태 목록")
+async def get_image_status(
+    image_url: List[str] = Query(...,
+                                 description="상태를 조회할 원본 이미지 URL (여러 개 지정 가능)",
+                                 max_length=100),
+):
+    """
+    ## 이미지 처리 상태를 조회합니다.
+    
+    ### 파라미터 설명
+    - **image_url**: 검색 결과의 `image_url` 값 (반복 지정 가능)
+    
+    ### 상태 값
+    - **pending**: 처리 대기 중
+    - **processing**: 다운로드/배경 제거/저장 진행 중
+    - **completed**: 저장 완료
+    - **failed**: 처리 실패 (`error`에 사유 포함)
+    - **unknown**: 처리 기록이 없는 이미지
+    """
+    try:
+        jobs = await get_image_jobs(image_url)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"이미지 상태 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+    images = [
+        ImageStatusResponse(
+            image_url=url,
+            image_id=job.image_id,
+            status=job.status.value,
+            error=job.error
+        ) if job else ImageStatusResponse(image_url=url, status="unknown")
+        for url, job in zip(image_url, jobs)
+    ]
+
+    return ImageStatusListResponse(images=images, total_count=len(images))
@@ -1,14 +1,65 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.dto.product_dto import SearchRequest, SearchResponse, ProductResponse
-from browser.task.search import search_product
+import logging
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from app.dto.product_dto import SearchRequest, SearchResponse
+from browser.core.entity.product_page import ProductPage, SearchResultCursor
+from browser.core.infra.http_cache import HttpCachePolicy
+from browser.core.port.product_fetcher import ProductFetchError
+from browser.task.search import get_search_http_cache_policy, get_search_response_cache, search_product_page
+
+logger = logging.getLogger(__name__)
+
+def _encode_search_response(request: SearchRequest, page: ProductPage) -> bytes:
+    """
+    검색 결과 페이지를 SearchResponse 형식의 JSON 본문으로 인코딩합니다.
+
+    Product는 dataclass이므로 ProductResponse/SearchResponse 모델을 만들지 않고 orjson으로 바로 직렬화합니다.
+    (SearchResponse는 응답 스키마 문서화에만 사용)
+    """
+    return orjson.dumps({
+        "products": page.products,
+        "total_count": len(page.products),
+        "next_cursor": page.next_cursor.encode() if page.next_cursor else None,
+        "query": request.query,
+        "use_cache": request.use_cache,
+        "remove_background": request.remove_background,
+    })
+
+
+def _search_etag(request: SearchRequest, page: ProductPage) -> str:
+    """
+    검색 결과 페이지의 ETag를 계산합니다.
+
+    제품 내용이 바뀌면 updated_at도 바뀌므로 본문을 인코딩하지 않고 제품 ID와 갱신 시각,
+    그리고 본문에 함께 들어가는 요청 값만으로 계산합니다.
+    """
+    return HttpCachePolicy.etag(
+        request.query,
+        request.use_cache,
+        request.remove_background,
+        page.next_cursor.encode() if page.next_cursor else None,
+        [product.id for product in page.products],
+        page.updated_at,
+    )
+
+
+def _search_response(body: Optional[bytes], etag: str, cache_control: str) -> Response:
+    """캐시 헤더를 붙인 검색 응답을 만듭니다. (body가 None이면 본문 없는 304)"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if body is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 router = APIRouter(
     prefix="/api/v1/products",
     tags=["products"],
     responses={
+        400: {"description": "잘못된 요청입니다"},
         404: {"description": "리소스를 찾을 수 없습니다"},
         500: {"description": "서버 내부 오류가 발생했습니다"},
-        503: {"description": "데이터베이스 서비스를 사용할 수 없습니다"},
+        503: {"description": "데이터베이스 또는 외부 검색 API를 사용할 수 없습니다"},
     },
 )
 
@@ -17,7 +68,8 @@ router = APIRouter(
            response_model=SearchResponse,
            summary="제품 검색 (GET)",
            description="쿼리 파라미터를 사용하여 제품을 검색합니다.",
-           response_description="검색된 제품 목록과 관련 정보")
+           response_description="검색된 제품 목록과 관련 정보",
+           responses={304: {"description": "결과가 If-None-Match의 ETag와 같습니다 (본문 없음)"}})
 async def search_products_get(
     query: str = Query(..., 
                       description="검색어", 
@@ -30,6 +82,14 @@ async def search_products_get(
     remove_background: bool = Query(True, 
                                     description="배경 제거 여부", 
                                     example=True),
+    limit: int = Query(10,
+                       description="페이지 크기",
+                       ge=1,
+                       le=100),
+    cursor: Optional[str] = Query(None,
+                                  description="이전 응답의 next_cursor (첫 페이지면 생략)"),
+    if_none_match: Optional[str] = Header(None,
+                                          description="이전 응답의 ETag (결과가 같으면 304)"),
 
 ):
     """
@@ -39,40 +99,70 @@ async def search_products_get(
     - **query**: 검색할 제품명 또는 키워드
     - **use_cache**: 캐시 사용 여부
     - **remove_background**: 배경 제거 여부
+    - **limit**: 페이지 크기 (1-100)
+    - **cursor**: 다음 페이지를 요청할 때 이전 응답의 `next_cursor` 값
     
     ### 응답 정보
-    - 검색된 제품 목록
+    - 검색된 제품 목록 (외부 검색 API 결과 순서)
     - 각 제품의 상세 정보 (이름, 가격, 이미지, URL 등)
-    - 검색 메타데이터 (총 개수, 현재 페이지 등)
+    - 검색 메타데이터 (이 페이지의 개수, 다음 페이지 커서 등)
+    
+    첫 페이지 요청은 검색 결과를 갱신(캐시 미스면 외부 API 조회)하고, 다음 페이지는 검색어별로 캐시한
+    결과 순서에서 커서 이후만 조회하므로 페이지 깊이와 상관없이 응답 시간이 일정합니다.
+    
+    use_cache이면 같은 검색어/페이지/옵션의 응답 본문을 잠시(SEARCH_RESPONSE_CACHE_TTL) 캐시해
+    검색과 직렬화 없이 그대로 반환합니다.
+    
+    응답에는 제품 ID와 갱신 시각으로 계산한 `ETag`와 `Cache-Control`(SEARCH_HTTP_CACHE_MAX_AGE,
+    SEARCH_HTTP_STALE_WHILE_REVALIDATE)을 붙이며, `If-None-Match`가 같으면 본문 없이 304로 응답합니다.
     """
     request = SearchRequest(
         query=query,
         use_cache=use_cache,
-        remove_background=remove_background
+        remove_background=remove_background,
+        limit=limit,
+        cursor=cursor
     )
     
+    try:
+        product_cursor = SearchResultCursor.decode(request.cursor) if request.cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # 응답 본문에 그대로 들어가는 값이 같은 요청끼리 본문을 공유
+    cache_key = (request.query, request.limit, request.cursor, request.remove_background)
+    response_cache = await get_search_response_cache()
+    http_cache = await get_search_http_cache_policy()
+    if request.use_cache:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            body, etag = cached
+            if http_cache.is_not_modified(if_none_match, etag):
+                body = None
+            return _search_response(body, etag, http_cache.cache_control)
+    
     try:
         # 제품 검색 실행
-        products = await search_product(
+        page = await search_product_page(
             query=request.query,
+            limit=request.limit,
+            cursor=product_cursor,
             use_cache=request.use_cache,
             remove_background=request.remove_background
         )
         
-        # DTO 변환
-        product_responses = [
-            ProductResponse.model_validate(product)
-            for product in products
-        ]
-        
-        return SearchResponse(
-            products=product_responses,
-            total_count=len(product_responses),
-            query=request.query,
-            use_cache=request.use_cache,
-            remove_background=request.remove_background
+    except ProductFetchError as e:
+        if not e.retryable:
+            # 키 설정이나 요청 자체의 문제이므로 다시 시도하라고 알리지 않음
+            logger.error(f"외부 검색 API 요청 오류: {e}")
+            raise HTTPException(status_code=500, detail=f"외부 검색 API 요청 오류: {e}")
+        # 빈 결과로 응답하지 않고, 잠시 후 다시 시도하도록 알림
+        headers = {"Retry-After": str(max(1, round(e.retry_after)))} if e.retry_after else None
+        raise HTTPException(
+            status_code=503,
+            detail=f"외부 검색 API를 일시적으로 사용할 수 없습니다: {e}",
+            headers=headers,
         )
-        
     except Exception as e:
         error_msg = str(e)
         if "connection" in error_msg.lower() or "pool" in error_msg.lower():
@@ -85,5 +175,22 @@ async def search_products_get(
                 status_code=500, 
                 detail=f"검색 중 오류가 발생했습니다: {str(e)}"
             )
+    
+    # 빈 결과는 조회 실패일 수 있고, use_cache=false는 최신 결과를 원하는 요청이므로
+    # 서버/CDN/클라이언트 모두 캐시하지 않음 (ETag로 재검증은 가능)
+    cacheable = request.use_cache and bool(page.products)
+    cache_control = http_cache.cache_control if cacheable else "no-cache"
+    
+    # 클라이언트가 가진 결과와 같으면 인코딩 없이 304
+    etag = _search_etag(request, page)
+    if http_cache.is_not_modified(if_none_match, etag):
+        return _search_response(None, etag, cache_control)
+    
+    body = _encode_search_response(request, page)
+    if cacheable:
+        response_cache.set(cache_key, (body, etag))
+    
+    # 이미 인코딩한 본문을 반환하므로 response_model 검증/직렬화를 다시 거치지 않음
+    return _search_response(body, etag, cache_control)
 
 
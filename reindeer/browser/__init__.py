@@ -1,3 +1,3 @@
-from browser.task.search import init, search_product
+from browser.task.search import init, search_product, search_product_page
 
-__all__ = ["init", "search_product"]
\ No newline at end of file
+__all__ = ["init", "search_product", "search_product_page"]
\ No newline at end of file
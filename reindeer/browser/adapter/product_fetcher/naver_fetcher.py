@@ -1,37 +1,95 @@
 import aiohttp
+import asyncio
+import random
 import urllib.parse
 import re
 import logging
-from typing import List
-from browser.core.port.product_fetcher import ProductFetcher
+import orjson
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from browser.core.port.product_fetcher import ProductFetcher, ProductFetchError
 from browser.core.entity.product import Product
+from browser.core.infra.naver_credential_pool import NaverCredential, NaverCredentialPool
 from html import unescape
 
 logger = logging.getLogger(__name__)
 
+# 네이버 쇼핑 검색 API 제한 (한 번에 최대 100개, start 최대 1000)
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+# 잠시 후 다시 요청(또는 다른 키로 요청)하면 성공할 수 있는 응답 상태
+RETRYABLE_STATUSES = frozenset({401, 429, 500, 502, 503, 504})
+
+# 응답 파싱에 쓰는 패턴 (아이템마다 여러 번 쓰이므로 미리 컴파일)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_NON_PRICE_PATTERN = re.compile(r'[^\d.]')
+_CATEGORY_KEYS = ("category1", "category2", "category3", "category4")
+
+# 429 응답 중 일일 호출 한도 초과를 나타내는 네이버 오류 코드 (초당 한도 초과와 구분)
+QUOTA_EXCEEDED_ERROR_CODE = "010"
+
+
+class _RetryableResponse(Exception):
+    """재시도할 응답 상태를 받았을 때 _request_page 내부에서 사용합니다."""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None, quota_exceeded: bool = False):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+        self.quota_exceeded = quota_exceeded
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초)를 읽습니다. 날짜 형식이나 잘못된 값은 무시합니다."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
 
 class NaverFetcher(ProductFetcher):
-    def __init__(self, naver_client: aiohttp.ClientSession, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        naver_client: aiohttp.ClientSession,
+        credential_pool: NaverCredentialPool,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.2,
+        retry_max_delay: float = 5.0,
+        request_deadline: float = 10.0,
+    ):
         self.naver_client = naver_client
-        self.client_id = client_id
-        self.client_secret = client_secret
+        self.credential_pool = credential_pool
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.request_deadline = request_deadline
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.quota_exceeded = 0
+        self.failures = 0
     
     def _clean_html_tags(self, text: str) -> str:
         """HTML 태그를 제거하고 HTML 엔티티를 디코딩합니다."""
         if not text:
             return ""
         
-        text = re.sub(r'<[^>]+>', '', text)
-        text = unescape(text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        # 대부분의 값(몰 이름, 카테고리 등)에는 태그나 엔티티가 없으므로 필요할 때만 처리
+        if "<" in text:
+            text = _TAG_PATTERN.sub('', text)
+        if "&" in text:
+            text = unescape(text)
         
-        return text
+        # 연속 공백을 하나로 합치고 양끝 공백 제거 (re.sub(r'\s+', ' ', text).strip()과 같음)
+        return " ".join(text.split())
     
     def _extract_categories(self, item: dict) -> List[str]:
         """카테고리 정보를 추출합니다."""
         categories = []
-        for i in range(1, 5):
-            category = item.get(f"category{i}")
+        for key in _CATEGORY_KEYS:
+            category = item.get(key)
             if category:
                 categories.append(self._clean_html_tags(category))
             else:
@@ -43,23 +101,31 @@ class NaverFetcher(ProductFetcher):
         if not price_str:
             return 0.0
         
+        # 네이버 응답의 가격은 보통 숫자만 있는 문자열
+        if price_str.isascii() and price_str.isdigit():
+            return float(price_str)
+        
         try:
-            price_str = re.sub(r'[^\d.]', '', price_str)
+            price_str = _NON_PRICE_PATTERN.sub('', price_str)
             return float(price_str) if price_str else 0.0
         except ValueError:
             return 0.0
     
     def _create_product(self, item: dict) -> Product:
-        """API 응답 아이템을 Product 객체로 변환합니다."""
+        """
+        API 응답 아이템을 Product 객체로 변환합니다.
+        
+        Product는 검증하지 않으므로 값이 없거나 null인 문자열 필드는 여기서 빈 문자열로 맞춥니다.
+        """
         return Product(
-            id=item.get("productId", ""),
-            name=self._clean_html_tags(item.get("title", "")),
-            price=self._parse_price(item.get("lprice", "0")),
-            image_url=item.get("image", ""),
-            url=item.get("link", ""),
-            mall_name=self._clean_html_tags(item.get("mallName", "")),
-            product_type=item.get("productType", ""),
-            maker=self._clean_html_tags(item.get("maker", "")),
+            id=str(item.get("productId") or ""),
+            name=self._clean_html_tags(item.get("title")),
+            price=self._parse_price(item.get("lprice")),
+            image_url=item.get("image") or "",
+            url=item.get("link") or "",
+            mall_name=self._clean_html_tags(item.get("mallName")),
+            product_type=str(item.get("productType") or ""),
+            maker=self._clean_html_tags(item.get("maker")),
             categories=self._extract_categories(item)
         )
     
@@ -74,52 +140,239 @@ class NaverFetcher(ProductFetcher):
             sort: 정렬 방식 (sim, date, asc, dsc)
         
         Returns:
-            Product 객체 리스트
+            Product 객체 리스트 (검색 결과가 없으면 빈 리스트)
+        
+        Raises:
+            ProductFetchError: 재시도와 대기 기한 안에 결과를 받지 못한 경우
         """
+        products, _ = await self._fetch_page(query, display, start, sort)
+        logger.info(f"{len(products)}개의 제품을 가져왔습니다.")
+        return products
+    
+    async def iter_products(self, query: str, max_results: int = 1000, sort: str = "sim") -> AsyncIterator[List[Product]]:
+        """
+        여러 페이지에 걸친 검색 결과를 페이지가 도착하는 대로 내보냅니다.
+        
+        첫 페이지로 전체 결과 수를 확인한 뒤 나머지 start 오프셋을 max_concurrency개씩
+        동시에 요청합니다. 이미 내보낸 productId는 다시 내보내지 않으며, 실패한 페이지는 건너뜁니다.
+        
+        Args:
+            query: 검색 쿼리
+            max_results: 가져올 최대 결과 수 (API 제한으로 최대 1000)
+            sort: 정렬 방식 (sim, date, asc, dsc)
+        
+        Yields:
+            페이지별 새 Product 객체 리스트 (도착 순서)
+        
+        Raises:
+            ProductFetchError: 첫 페이지를 받지 못한 경우
+        """
+        max_results = max(1, min(max_results, MAX_START))
+        seen_ids = set()
+        
+        def unseen(products: List[Product]) -> List[Product]:
+            new_products = [product for product in products if product.id not in seen_ids]
+            seen_ids.update(product.id for product in new_products)
+            return new_products
+        
+        products, total = await self._fetch_page(query, min(MAX_DISPLAY, max_results), 1, sort)
+        yield unseen(products)
+        
+        last = min(max_results, total)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(start: int) -> List[Product]:
+            async with semaphore:
+                try:
+                    products, _ = await self._fetch_page(query, min(MAX_DISPLAY, last - start + 1), start, sort)
+                    return products
+                except ProductFetchError as e:
+                    logger.warning(f"네이버 API 페이지 요청 실패 (start={start}): {e}")
+                    return []
+        
+        tasks = [
+            asyncio.ensure_future(fetch(start))
+            for start in range(1 + MAX_DISPLAY, last + 1, MAX_DISPLAY)
+        ]
         try:
-            display = max(1, min(100, display))
-            start = max(1, start)
+            for task in asyncio.as_completed(tasks):
+                products = unseen(await task)
+                if products:
+                    yield products
+        finally:
+            # 호출자가 중간에 멈추면 남은 페이지 요청을 취소
+            for task in tasks:
+                task.cancel()
+    
+    async def _fetch_page(self, query: str, display: int, start: int, sort: str) -> Tuple[List[Product], int]:
+        """
+        검색 결과 한 페이지를 요청합니다.
+        
+        요청마다 키 풀에서 키를 고르고 그 키의 토큰을 받은 뒤 보냅니다. 429/5xx 응답이나
+        네트워크 오류는 지터를 준 지수 백오프로 최대 max_retries번 다시 시도하되, 키 문제
+        (429, 일일 한도 초과, 인증 실패)이고 다른 키가 있으면 기다리지 않고 다른 키로 보냅니다.
+        키 대기와 재시도를 합쳐 request_deadline(초) 안에 끝나지 않으면 더 기다리지 않고 실패합니다.
+        
+        Returns:
+            (Product 객체 리스트, 전체 결과 수)
+        
+        Raises:
+            ProductFetchError: 재시도와 대기 기한 안에 결과를 받지 못한 경우,
+                또는 다시 시도해도 실패하는 오류인 경우 (retryable=False)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.request_deadline
+        attempt = 0
+        
+        while True:
+            credential = await self.credential_pool.acquire(timeout=deadline - loop.time())
+            if credential is None:
+                self.failures += 1
+                if all(credential.disabled for credential in self.credential_pool.credentials):
+                    raise ProductFetchError("모든 네이버 API 키가 인증에 실패했습니다. 키 설정을 확인하세요.", retryable=False)
+                raise ProductFetchError(
+                    "사용할 수 있는 네이버 API 키가 없거나, 요청 한도로 대기 기한 안에 요청하지 못했습니다.",
+                    retry_after=self.credential_pool.estimated_wait() or None,
+                )
             
-            encoded_query = urllib.parse.quote(query)
-            url = f"/v1/search/shop.json?query={encoded_query}&display={display}&start={start}&sort={sort}"
+            retry_after = None
+            throttled = False
+            rotate = False
+            try:
+                self.requests += 1
+                return await asyncio.wait_for(
+                    self._request_page(credential, query, display, start, sort),
+                    timeout=max(0.0, deadline - loop.time()),
+                )
+            except _RetryableResponse as e:
+                error = e
+                retry_after = e.retry_after
+                if e.status == 401:
+                    logger.error(f"네이버 API 인증 실패, 이 키는 더 이상 사용하지 않습니다: {credential.name}")
+                    self.credential_pool.mark_invalid(credential)
+                    rotate = True
+                elif e.quota_exceeded:
+                    logger.warning(f"네이버 API 일일 호출 한도 초과, 다음 초기화까지 다른 키를 사용합니다: {credential.name}")
+                    self.quota_exceeded += 1
+                    self.credential_pool.mark_quota_exceeded(credential)
+                    rotate = True
+                elif e.status == 429:
+                    self.throttled += 1
+                    throttled = True
+                    rotate = len(self.credential_pool) > 1
+                else:
+                    credential.failures += 1
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                credential.failures += 1
+            except ProductFetchError:
+                self.failures += 1
+                raise
             
-            headers = {
-                "X-Naver-Client-Id": self.client_id,
-                "X-Naver-Client-Secret": self.client_secret
-            }
+            attempt += 1
+            reason = str(error) or type(error).__name__
+            # full jitter: 0 ~ min(최대, 기본 * 2^시도) 사이에서 무작위로 기다려 재시도가 몰리지 않게 함
+            backoff = retry_after if retry_after is not None else random.uniform(
+                0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+            )
+            if throttled:
+                # 초당 한도를 넘은 키는 이 요청뿐 아니라 같은 키를 쓰는 다른 요청도 늦춤
+                self.credential_pool.mark_throttled(credential, backoff)
+            # 키 문제이고 다른 키로 보낼 수 있으면 기다리지 않음
+            delay = 0.0 if rotate else backoff
             
-            logger.debug(f"네이버 API 요청: {url}")
-            logger.debug(f"Client ID: {self.client_id[:10]}..." if self.client_id else "Client ID: 없음")
+            if attempt > self.max_retries or loop.time() + delay >= deadline:
+                self.failures += 1
+                raise ProductFetchError(
+                    f"네이버 API 요청 실패 (시도 {attempt}번): {reason}",
+                    retry_after=backoff or None,
+                ) from error
             
-            async with self.naver_client.get(url, headers=headers) as response:
-                logger.debug(f"응답 상태: {response.status}")
-                if response.status == 401:
-                    logger.error("네이버 API 인증 실패: Client ID 또는 Secret이 올바르지 않습니다.")
-                    return []
-                
-                response.raise_for_status()
-                data = await response.json()
-                
-                items = data.get("items", [])
-                products = []
-                
-                for item in items:
+            self.retries += 1
+            logger.warning(f"네이버 API 요청 재시도 ({attempt}/{self.max_retries}, {delay:.2f}s 후): {reason}")
+            await asyncio.sleep(delay)
+    
+    async def _request_page(
+        self,
+        credential: NaverCredential,
+        query: str,
+        display: int,
+        start: int,
+        sort: str,
+    ) -> Tuple[List[Product], int]:
+        """검색 결과 한 페이지를 주어진 키로 한 번 요청합니다. (재시도 없음)"""
+        display = max(1, min(MAX_DISPLAY, display))
+        start = max(1, min(MAX_START, start))
+        
+        encoded_query = urllib.parse.quote(query)
+        url = f"/v1/search/shop.json?query={encoded_query}&display={display}&start={start}&sort={sort}"
+        
+        headers = {
+            "X-Naver-Client-Id": credential.client_id,
+            "X-Naver-Client-Secret": credential.client_secret
+        }
+        
+        logger.debug(f"네이버 API 요청: {url}")
+        logger.debug(f"Client ID: {credential.name}")
+        
+        async with self.naver_client.get(url, headers=headers) as response:
+            logger.debug(f"응답 상태: {response.status}")
+            if response.status in RETRYABLE_STATUSES:
+                quota_exceeded = False
+                if response.status == 429:
                     try:
-                        product = self._create_product(item)
-                        products.append(product)
-                    except Exception as e:
-                        logger.warning(f"제품 파싱 실패: {e}")
-                        continue
-                
-                logger.info(f"{len(products)}개의 제품을 가져왔습니다.")
-                return products
-                
-        except aiohttp.ClientError as e:
-            logger.error(f"네이버 API 요청 실패: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"예상치 못한 오류: {e}")
-            return []
+                        error_body = orjson.loads(await response.read())
+                        quota_exceeded = error_body.get("errorCode") == QUOTA_EXCEEDED_ERROR_CODE
+                    except (aiohttp.ClientError, ValueError, AttributeError):
+                        pass
+                raise _RetryableResponse(
+                    response.status,
+                    _parse_retry_after(response.headers.get("Retry-After")),
+                    quota_exceeded=quota_exceeded,
+                )
+            if response.status >= 400:
+                # 잘못된 요청이나 권한 문제처럼 다시 보내도 같은 결과인 오류는 재시도하지 않음
+                body = await response.text(errors="replace")
+                logger.error(f"네이버 API 요청 오류 (재시도하지 않음): HTTP {response.status} {body[:200]}")
+                raise ProductFetchError(f"네이버 API 요청 실패: HTTP {response.status}", retryable=False)
+            
+            return self._parse_response(await response.read())
+    
+    def _parse_response(self, body: bytes) -> Tuple[List[Product], int]:
+        """
+        검색 응답 본문을 Product 목록으로 변환합니다. (본문을 orjson으로 바로 디코딩)
+        
+        Returns:
+            (Product 객체 리스트, 전체 결과 수)
+        """
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise ProductFetchError(f"네이버 API 응답을 해석할 수 없습니다: {e}") from e
+        
+        items = data.get("items", [])
+        products = []
+        
+        for item in items:
+            try:
+                product = self._create_product(item)
+                products.append(product)
+            except Exception as e:
+                logger.warning(f"제품 파싱 실패: {e}")
+                continue
+        
+        return products, int(data.get("total", len(products)))
+    
+    def stats(self) -> Dict[str, Any]:
+        """요청/재시도/429/일일 한도 초과/실패 횟수와 키별 사용량 통계를 반환합니다."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "quota_exceeded": self.quota_exceeded,
+            "failures": self.failures,
+            "credentials": self.credential_pool.stats(),
+        }
     
     async def close(self):
         """세션을 닫습니다."""
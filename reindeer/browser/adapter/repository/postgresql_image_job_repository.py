@@ -0,0 +1,85 @@
+import asyncpg
+import logging
+from typing import List
+from browser.core.port.image_job_repository import ImageJobRepository
+from browser.core.entity.image_job import ImageJob, ImageJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class PostgreSQLImageJobRepository(ImageJobRepository):
+    def __init__(self, connection_pool: asyncpg.Pool):
+        self.connection_pool = connection_pool
+
+    async def save_jobs(self, jobs: List[ImageJob]) -> None:
+        """이미지 작업 상태를 배치로 저장합니다."""
+        if not jobs:
+            return
+
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            INSERT INTO image_jobs (
+                image_id, image_url, remove_background, status, error,
+                attempts, created_at, updated_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, NOW(), NOW())
+            ON CONFLICT (image_id) DO UPDATE SET
+                image_url = EXCLUDED.image_url,
+                remove_background = EXCLUDED.remove_background,
+                status = EXCLUDED.status,
+                error = EXCLUDED.error,
+                attempts = EXCLUDED.attempts,
+                updated_at = NOW()
+            """
+
+            batch_data = [
+                (
+                    job.image_id,
+                    job.image_url,
+                    job.remove_background,
+                    job.status.value,
+                    job.error,
+                    job.attempts,
+                )
+                for job in jobs
+            ]
+
+            await conn.executemany(query, batch_data)
+
+    async def get_jobs(self, image_ids: List[str]) -> List[ImageJob]:
+        """이미지 ID 목록으로 작업 상태를 조회합니다."""
+        if not image_ids:
+            return []
+
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            SELECT image_id, image_url, remove_background, status, error, attempts
+            FROM image_jobs
+            WHERE image_id = ANY($1)
+            """
+
+            results = await conn.fetch(query, image_ids)
+            return [self._create_job_from_db(result) for result in results]
+
+    async def get_unfinished_jobs(self) -> List[ImageJob]:
+        """대기 중이거나 처리 중인 작업을 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            SELECT image_id, image_url, remove_background, status, error, attempts
+            FROM image_jobs
+            WHERE status IN ('pending', 'processing')
+            ORDER BY created_at
+            """
+
+            results = await conn.fetch(query)
+            return [self._create_job_from_db(result) for result in results]
+
+    def _create_job_from_db(self, result: asyncpg.Record) -> ImageJob:
+        """데이터베이스 결과를 ImageJob 객체로 변환합니다."""
+        return ImageJob(
+            image_id=result['image_id'],
+            image_url=result['image_url'],
+            remove_background=result['remove_background'],
+            status=ImageJobStatus(result['status']),
+            error=result['error'],
+            attempts=result['attempts'],
+        )
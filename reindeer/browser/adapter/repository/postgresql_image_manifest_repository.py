@@ -0,0 +1,122 @@
+import asyncpg
+import logging
+from typing import List, Optional, Set
+from browser.core.port.image_manifest_repository import ImageManifestRepository
+from browser.core.entity.image_manifest import ImageManifestEntry
+
+logger = logging.getLogger(__name__)
+
+
+class PostgreSQLImageManifestRepository(ImageManifestRepository):
+    def __init__(self, connection_pool: asyncpg.Pool):
+        self.connection_pool = connection_pool
+
+    async def save_entries(self, entries: List[ImageManifestEntry]) -> None:
+        """저장된 이미지 기록을 배치로 추가하거나 갱신합니다."""
+        if not entries:
+            return
+
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            INSERT INTO images (
+                image_id, variant, s3_key, source_url, byte_size, content_hash, stored_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, COALESCE($7, NOW()))
+            ON CONFLICT (image_id, variant) DO UPDATE SET
+                s3_key = EXCLUDED.s3_key,
+                source_url = COALESCE(EXCLUDED.source_url, images.source_url),
+                byte_size = EXCLUDED.byte_size,
+                content_hash = EXCLUDED.content_hash,
+                stored_at = EXCLUDED.stored_at
+            """
+
+            batch_data = [
+                (
+                    entry.image_id,
+                    entry.variant,
+                    entry.s3_key,
+                    entry.source_url,
+                    entry.byte_size,
+                    entry.content_hash,
+                    entry.stored_at,
+                )
+                for entry in entries
+            ]
+
+            await conn.executemany(query, batch_data)
+
+    async def get_entry(self, image_id: str, variant: str) -> Optional[ImageManifestEntry]:
+        """이미지 ID와 변형으로 기록을 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            SELECT image_id, variant, s3_key, source_url, byte_size, content_hash, stored_at
+            FROM images
+            WHERE image_id = $1 AND variant = $2
+            """
+
+            result = await conn.fetchrow(query, image_id, variant)
+
+            if result:
+                return ImageManifestEntry(**dict(result))
+
+            return None
+
+    async def get_existing_image_ids(self, image_ids: List[str], variant: str) -> Set[str]:
+        """이미지 ID 목록 중 기록이 있는 ID를 한 번의 쿼리로 조회합니다."""
+        if not image_ids:
+            return set()
+
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            SELECT image_id
+            FROM images
+            WHERE image_id = ANY($1) AND variant = $2
+            """
+
+            results = await conn.fetch(query, image_ids, variant)
+            return {result['image_id'] for result in results}
+
+    async def get_s3_keys(self, variant: str) -> Set[str]:
+        """변형별로 기록된 모든 객체 키를 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            results = await conn.fetch(
+                "SELECT s3_key FROM images WHERE variant = $1", variant
+            )
+            return {result['s3_key'] for result in results}
+
+    async def delete_entries(self, s3_keys: List[str]) -> None:
+        """객체 키에 해당하는 기록을 삭제합니다."""
+        if not s3_keys:
+            return
+
+        async with self.connection_pool.acquire() as conn:
+            await conn.execute("DELETE FROM images WHERE s3_key = ANY($1)", s3_keys)
+
+    async def is_complete(self) -> bool:
+        """정합성 맞춤 이후 기록 누락이 없었는지 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            return bool(await conn.fetchval("SELECT complete FROM image_manifest_state"))
+
+    async def get_generation(self) -> int:
+        """기록 누락 번호를 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            return await conn.fetchval("SELECT generation FROM image_manifest_state") or 0
+
+    async def mark_complete(self, generation: int) -> bool:
+        """번호가 그대로일 때만 기록이 완전하다고 기록합니다."""
+        async with self.connection_pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE image_manifest_state
+                SET complete = TRUE, reconciled_at = NOW()
+                WHERE generation = $1
+                """,
+                generation,
+            )
+            return result.endswith(" 1")
+
+    async def mark_incomplete(self) -> None:
+        """기록을 불완전으로 바꾸고 번호를 늘립니다."""
+        async with self.connection_pool.acquire() as conn:
+            await conn.execute(
+                "UPDATE image_manifest_state SET complete = FALSE, generation = generation + 1"
+            )
@@ -0,0 +1,191 @@
+import asyncpg
+import logging
+from typing import List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# 여러 워커가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+_MIGRATION_LOCK_KEY = 7_140_225_001
+
+
+class Migration(NamedTuple):
+    """
+    버전이 붙은 스키마 변경 하나입니다.
+
+    optional이 True인 마이그레이션은 실패해도 나머지를 계속 적용하고, 기록하지 않아
+    다음 실행 때 다시 시도합니다. (예: 설치 권한이 필요한 확장)
+    """
+    version: int
+    description: str
+    sql: str
+    optional: bool = False
+
+
+# 적용 순서대로 나열합니다. 이미 배포된 마이그레이션은 수정하지 말고 새 버전을 추가하세요.
+# 기존 테이블이 있는 DB에서도 적용되도록 IF NOT EXISTS를 사용합니다.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "제품 테이블", """
+    CREATE TABLE IF NOT EXISTS products (
+        id VARCHAR(255) PRIMARY KEY,
+        name VARCHAR(1000) NOT NULL,
+        price DECIMAL(10, 2) DEFAULT 0.00,
+        image_url TEXT,
+        url TEXT,
+        mall_name VARCHAR(255),
+        product_type VARCHAR(255),
+        maker VARCHAR(255),
+        categories JSONB,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);
+    CREATE INDEX IF NOT EXISTS idx_products_mall_name ON products(mall_name);
+    CREATE INDEX IF NOT EXISTS idx_products_updated_at ON products(updated_at);
+    """),
+    Migration(2, "제품 내용 해시", """
+    ALTER TABLE products ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32);
+    """),
+    # 한국어 사전이 없으므로 'simple' 설정으로 어절 단위 토큰화
+    Migration(3, "제품 전문 검색 인덱스", """
+    ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', lower(coalesce(name, '') || ' ' || coalesce(maker, '')))
+        ) STORED;
+
+    CREATE INDEX IF NOT EXISTS idx_products_search_vector ON products USING GIN (search_vector);
+    """),
+    # 실패하면 기록하지 않고 매번 다시 시도하는 선택 마이그레이션이었으므로, 마이그레이션 10 이후에
+    # 인덱스를 다시 만들지 않도록 아무것도 하지 않게 바꿨습니다 (이미 만든 인덱스는 10에서 삭제)
+    Migration(4, "제품명 pg_trgm 인덱스 (사용 안 함)", """
+    SELECT 1;
+    """),
+    Migration(5, "이미지 작업 테이블", """
+    CREATE TABLE IF NOT EXISTS image_jobs (
+        image_id VARCHAR(64) PRIMARY KEY,
+        image_url TEXT NOT NULL,
+        remove_background BOOLEAN NOT NULL DEFAULT TRUE,
+        status VARCHAR(20) NOT NULL,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_image_jobs_unfinished
+        ON image_jobs(created_at)
+        WHERE status IN ('pending', 'processing');
+    """),
+    Migration(6, "이미지 매니페스트 테이블", """
+    CREATE TABLE IF NOT EXISTS images (
+        image_id VARCHAR(64) NOT NULL,
+        variant VARCHAR(20) NOT NULL,
+        s3_key TEXT NOT NULL,
+        source_url TEXT,
+        byte_size BIGINT NOT NULL DEFAULT 0,
+        content_hash VARCHAR(64),
+        stored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (image_id, variant)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_images_s3_key ON images(s3_key);
+    """),
+    Migration(7, "presigned URL 캐시 테이블", """
+    CREATE TABLE IF NOT EXISTS presigned_urls (
+        cache_key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        expires_at TIMESTAMPTZ NOT NULL
+    );
+    """),
+    Migration(8, "검색 결과 캐시 테이블", """
+    CREATE TABLE IF NOT EXISTS search_cache (
+        query VARCHAR(255) PRIMARY KEY,
+        product_ids TEXT[] NOT NULL,
+        fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    """),
+    # 검색 결과 keyset 페이지네이션 (ORDER BY updated_at DESC, id DESC) 용, updated_at 단일 인덱스를 대체
+    Migration(9, "제품 갱신 순 인덱스", """
+    CREATE INDEX IF NOT EXISTS idx_products_updated_at_id ON products(updated_at DESC, id DESC);
+    DROP INDEX IF EXISTS idx_products_updated_at;
+    """),
+    # 제품 테이블을 이름으로 검색하는 경로가 없으므로 저장할 때마다 갱신되는 검색 인덱스를 삭제
+    Migration(10, "사용하지 않는 제품 검색 인덱스 삭제", """
+    DROP INDEX IF EXISTS idx_products_name_trgm;
+    DROP INDEX IF EXISTS idx_products_search_vector;
+    ALTER TABLE products DROP COLUMN IF EXISTS search_vector;
+    DROP INDEX IF EXISTS idx_products_updated_at_id;
+    """),
+    # 정합성 맞춤(reconcile_images)을 마치기 전에는 기록이 없는 이미지를 S3에서 다시 확인하도록
+    # 매니페스트가 완전한지 기록하는 한 행짜리 테이블
+    Migration(11, "이미지 매니페스트 상태 테이블", """
+    CREATE TABLE IF NOT EXISTS image_manifest_state (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        complete BOOLEAN NOT NULL DEFAULT FALSE,
+        generation BIGINT NOT NULL DEFAULT 0,
+        reconciled_at TIMESTAMPTZ
+    );
+
+    INSERT INTO image_manifest_state (id) VALUES (TRUE) ON CONFLICT DO NOTHING;
+    """),
+]
+
+
+async def get_schema_version(connection_pool: asyncpg.Pool) -> int:
+    """적용된 마지막 스키마 버전을 반환합니다. (마이그레이션 전이면 0)"""
+    async with connection_pool.acquire() as conn:
+        exists = await conn.fetchval("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not exists:
+            return 0
+        return await conn.fetchval("SELECT coalesce(max(version), 0) FROM schema_migrations")
+
+
+async def migrate(connection_pool: asyncpg.Pool, migrations: List[Migration] = MIGRATIONS) -> List[int]:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 적용하고 schema_migrations에 기록합니다.
+
+    마이그레이션마다 트랜잭션 하나로 적용하며, 여러 프로세스가 동시에 실행해도
+    advisory lock으로 한 프로세스만 적용합니다.
+
+    :return: 이번에 적용한 버전 목록
+    """
+    applied_versions = []
+
+    async with connection_pool.acquire() as conn:
+        await conn.execute("SELECT pg_advisory_lock($1)", _MIGRATION_LOCK_KEY)
+        try:
+            await conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+            """)
+            applied = {
+                record['version']
+                for record in await conn.fetch("SELECT version FROM schema_migrations")
+            }
+
+            for migration in sorted(migrations, key=lambda migration: migration.version):
+                if migration.version in applied:
+                    continue
+
+                logger.info(f"마이그레이션 적용 중: {migration.version} {migration.description}")
+                try:
+                    async with conn.transaction():
+                        await conn.execute(migration.sql)
+                        await conn.execute(
+                            "INSERT INTO schema_migrations (version, description) VALUES ($1, $2)",
+                            migration.version, migration.description,
+                        )
+                except asyncpg.PostgresError as e:
+                    if not migration.optional:
+                        raise
+                    logger.warning(f"선택 마이그레이션을 건너뜁니다: {migration.version} {migration.description} ({e})")
+                    continue
+
+                applied_versions.append(migration.version)
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", _MIGRATION_LOCK_KEY)
+
+    return applied_versions
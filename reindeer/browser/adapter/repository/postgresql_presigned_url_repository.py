@@ -0,0 +1,48 @@
+import asyncpg
+import logging
+from typing import Optional, Tuple
+from browser.core.port.presigned_url_repository import PresignedUrlRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PostgreSQLPresignedUrlRepository(PresignedUrlRepository):
+    """여러 uvicorn 워커가 presigned URL을 공유하기 위한 PostgreSQL 저장소입니다."""
+
+    def __init__(self, connection_pool: asyncpg.Pool):
+        self.connection_pool = connection_pool
+
+    async def get_url(self, cache_key: str) -> Optional[Tuple[str, float]]:
+        """아직 유효한 presigned URL과 남은 유효 시간을 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            SELECT url, EXTRACT(EPOCH FROM (expires_at - NOW()))::float8 AS remaining_seconds
+            FROM presigned_urls
+            WHERE cache_key = $1 AND expires_at > NOW()
+            """
+
+            result = await conn.fetchrow(query, cache_key)
+
+            if result:
+                return result['url'], result['remaining_seconds']
+
+            return None
+
+    async def save_url(self, cache_key: str, url: str, ttl_seconds: float) -> None:
+        """presigned URL을 저장합니다. 만료된 항목은 같은 키로 덮어씁니다."""
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            INSERT INTO presigned_urls (cache_key, url, expires_at)
+            VALUES ($1, $2, NOW() + make_interval(secs => $3))
+            ON CONFLICT (cache_key) DO UPDATE SET
+                url = EXCLUDED.url,
+                expires_at = EXCLUDED.expires_at
+            """
+
+            await conn.execute(query, cache_key, url, float(ttl_seconds))
+
+    async def delete_expired(self) -> int:
+        """만료된 presigned URL을 삭제하고 삭제한 수를 반환합니다."""
+        async with self.connection_pool.acquire() as conn:
+            result = await conn.execute("DELETE FROM presigned_urls WHERE expires_at <= NOW()")
+            return int(result.split()[-1])
@@ -1,192 +1,283 @@
 import asyncpg
 import os
 import logging
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from browser.core.port.product_repository import ProductRepository
 from browser.core.entity.product import Product
-import json
-import asyncio
+from browser.core.entity.product_page import ProductPage
+from browser.core.infra.postgresql_router import PostgreSQLPoolRouter
+import orjson
+import hashlib
+import time
 
 logger = logging.getLogger(__name__)
 
+# 제품 저장 시 입력하는 컬럼 (순서는 _create_product_record와 동일)
+_PRODUCT_COLUMNS = (
+    "id", "name", "price", "image_url", "url", "mall_name",
+    "product_type", "maker", "categories", "content_hash",
+)
+
+# source(스테이징 테이블 또는 unnest)의 제품을 한 번에 병합하고 실제로 쓴 행 수를 반환하는 쿼리
+# categories는 COPY/배열 파라미터로 보내기 위해 orjson으로 인코딩한 JSON 텍스트로 받아 변환합니다
+# 내용 해시가 같은 기존 제품은 갱신하지 않아 불필요한 행 버전(WAL, dead tuple)을 만들지 않습니다
+_MERGE_PRODUCTS_QUERY = """
+WITH merged AS (
+    INSERT INTO products (
+        id, name, price, image_url, url, mall_name, 
+        product_type, maker, categories, content_hash, created_at, updated_at
+    )
+    SELECT id, name, price, image_url, url, mall_name,
+           product_type, maker, categories::jsonb, content_hash, NOW(), NOW()
+    FROM {source}
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        price = EXCLUDED.price,
+        image_url = EXCLUDED.image_url,
+        url = EXCLUDED.url,
+        mall_name = EXCLUDED.mall_name,
+        product_type = EXCLUDED.product_type,
+        maker = EXCLUDED.maker,
+        categories = EXCLUDED.categories,
+        content_hash = EXCLUDED.content_hash,
+        updated_at = NOW()
+    WHERE products.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING 1
+)
+SELECT count(*) FROM merged
+"""
+
+# 자주 쓰는 쿼리 (SQL 문자열이 같으므로 커넥션의 statement 캐시로 커넥션마다 한 번만 prepare)
+_SELECT_PRODUCT_COLUMNS = """
+SELECT id, name, price, image_url, url, mall_name, 
+       product_type, maker, categories
+"""
+
+_GET_PRODUCT = _SELECT_PRODUCT_COLUMNS + """
+FROM products 
+WHERE id = $1
+"""
+
+# 마지막 컬럼 updated_at은 페이지 응답의 ETag를 만들 때 사용합니다
+_GET_PRODUCTS = _SELECT_PRODUCT_COLUMNS + """
+     , updated_at
+FROM products 
+WHERE id = ANY($1::varchar[])
+"""
+
+_MERGE_PRODUCTS = _MERGE_PRODUCTS_QUERY.format(source="""
+unnest(
+    $1::varchar[], $2::varchar[], $3::numeric[], $4::text[], $5::text[],
+    $6::varchar[], $7::varchar[], $8::varchar[], $9::text[], $10::varchar[]
+) AS source(id, name, price, image_url, url, mall_name, product_type, maker, categories, content_hash)
+""")
+
 
 class PostgreSQLRepository(ProductRepository):
-    def __init__(self, connection_pool: asyncpg.Pool):
+    def __init__(
+        self,
+        connection_pool: asyncpg.Pool,
+        copy_threshold: int = 1000,
+        replica_pools: Optional[List[asyncpg.Pool]] = None,
+        replica_strategy: str = "round_robin",
+        read_after_write_seconds: float = 1.0,
+    ):
+        """
+        :param connection_pool: 주 DB 연결 풀 (쓰기와 쓰기 직후 읽기)
+        :param replica_pools: 읽기 복제본 연결 풀 목록 (없으면 모든 쿼리를 주 풀로)
+        :param replica_strategy: 복제본 선택 방식 (round_robin, least_busy)
+        :param read_after_write_seconds: 이 프로세스가 쓴 뒤 이 시간(초) 동안은 복제 지연을 피해 주 풀에서 읽음
+        """
         self.connection_pool = connection_pool
-        self._initialized = False
-        self._init_lock = asyncio.Lock()
+        self.copy_threshold = copy_threshold
+        self.read_after_write_seconds = read_after_write_seconds
+        self.written_rows = 0
+        self.skipped_rows = 0
+        self.primary_fallbacks = 0
+        self._router = PostgreSQLPoolRouter(connection_pool, replica_pools, replica_strategy)
+        self._last_write_at = float("-inf")
     
-    async def _ensure_initialized(self):
-        """데이터베이스 초기화를 보장합니다."""
-        if not self._initialized:
-            async with self._init_lock:
-                if not self._initialized:
-                    await self.create_table()
-                    self._initialized = True
+    def _read_from_replica(self) -> bool:
+        """복제본에서 읽어도 되는지 여부입니다. (최근에 쓴 적이 없을 때만)"""
+        return (
+            self._router.has_replicas
+            and time.monotonic() - self._last_write_at >= self.read_after_write_seconds
+        )
     
     async def save_product(self, product: Product) -> None:
         """제품 정보를 데이터베이스에 저장합니다."""
         await self.save_products([product])
     
     async def save_products(self, products: List[Product]) -> None:
-        """여러 제품을 배치로 저장합니다."""
+        """
+        여러 제품을 하나의 쿼리로 저장합니다.
+        
+        copy_threshold 미만이면 배열 파라미터를 unnest해 INSERT ... ON CONFLICT 한 번으로,
+        그 이상이면 COPY로 임시 스테이징 테이블에 적재한 뒤 한 번에 병합합니다.
+        내용이 바뀌지 않은 제품은 쓰지 않고 건너뜁니다.
+        """
         if not products:
             return
         
-        await self._ensure_initialized()
+        # 한 쿼리 안에서 같은 ID를 두 번 갱신할 수 없으므로 마지막 값만 남김
+        records = [
+            self._create_product_record(product)
+            for product in {product.id: product for product in products}.values()
+        ]
+        
+        async with self._router.acquire() as conn:
+            if len(records) >= self.copy_threshold:
+                written = await self._merge_products_with_copy(conn, records)
+            else:
+                written = await self._merge_products_with_unnest(conn, records)
+        
+        self._last_write_at = time.monotonic()
+        self.written_rows += written
+        self.skipped_rows += len(records) - written
+    
+    def _create_product_record(self, product: Product) -> tuple:
+        """Product 객체를 내용 해시를 포함한 저장용 레코드로 변환합니다."""
+        record = (
+            product.id,
+            product.name,
+            product.price,
+            product.image_url,
+            product.url,
+            product.mall_name,
+            product.product_type,
+            product.maker,
+            orjson.dumps(product.categories).decode(),
+        )
+        content_hash = hashlib.md5(orjson.dumps(record)).hexdigest()
+        return (*record, content_hash)
+    
+    async def _merge_products_with_unnest(self, conn: asyncpg.Connection, records: List[tuple]) -> int:
+        """컬럼별 배열 파라미터를 unnest해 한 번의 왕복으로 병합하고 쓴 행 수를 반환합니다."""
+        return await conn.fetchval(_MERGE_PRODUCTS, *zip(*records))
+    
+    async def _merge_products_with_copy(self, conn: asyncpg.Connection, records: List[tuple]) -> int:
+        """COPY로 임시 스테이징 테이블에 적재한 뒤 한 번에 병합하고 쓴 행 수를 반환합니다."""
+        async with conn.transaction():
+            await conn.execute("""
+            CREATE TEMP TABLE products_staging (
+                id VARCHAR(255),
+                name VARCHAR(1000),
+                price DECIMAL(10, 2),
+                image_url TEXT,
+                url TEXT,
+                mall_name VARCHAR(255),
+                product_type VARCHAR(255),
+                maker VARCHAR(255),
+                categories TEXT,
+                content_hash VARCHAR(32)
+            ) ON COMMIT DROP
+            """)
+            await conn.copy_records_to_table(
+                "products_staging", records=records, columns=_PRODUCT_COLUMNS
+            )
+            return await conn.fetchval(_MERGE_PRODUCTS_QUERY.format(source="products_staging"))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        제품 저장 시 실제로 쓴 행과 내용이 같아 건너뛴 행 수,
+        복제본에 없거나 복제본 조회가 실패해 주 풀에서 다시 읽은 횟수와 풀별 지연 시간을 반환합니다.
+        """
+        return {
+            "written_rows": self.written_rows,
+            "skipped_rows": self.skipped_rows,
+            "primary_fallbacks": self.primary_fallbacks,
+            "pools": self._router.stats(),
+        }
+    
+    async def _read(self, method: str, query: str, *args: Any) -> Tuple[Any, bool]:
+        """
+        읽기 쿼리를 실행하고 (결과, 복제본에서 읽었는지)를 반환합니다.
+        
+        복제본에서 읽을 수 있으면 복제본 풀로 보내고, 복제본 연결이나 쿼리가 실패하면
+        주 풀에서 다시 실행합니다.
+        """
+        if self._read_from_replica():
+            try:
+                async with self._router.acquire(read_only=True) as conn:
+                    return await getattr(conn, method)(query, *args), True
+            except Exception as e:
+                logger.warning(f"복제본 조회 실패, 주 풀에서 다시 조회합니다: {e}")
+                self.primary_fallbacks += 1
         
-        async with self.connection_pool.acquire() as conn:
-            query = """
-            INSERT INTO products (
-                id, name, price, image_url, url, mall_name, 
-                product_type, maker, categories, created_at, updated_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW(), NOW())
-            ON CONFLICT (id) DO UPDATE SET
-                name = EXCLUDED.name,
-                price = EXCLUDED.price,
-                image_url = EXCLUDED.image_url,
-                url = EXCLUDED.url,
-                mall_name = EXCLUDED.mall_name,
-                product_type = EXCLUDED.product_type,
-                maker = EXCLUDED.maker,
-                categories = EXCLUDED.categories,
-                updated_at = NOW()
-            """
-            
-            batch_data = []
-            for product in products:
-                batch_data.append((
-                    product.id,
-                    product.name,
-                    product.price,
-                    product.image_url,
-                    product.url,
-                    product.mall_name,
-                    product.product_type,
-                    product.maker,
-                    json.dumps(product.categories, ensure_ascii=False)
-                ))
-            
-            await conn.executemany(query, batch_data)
+        async with self._router.acquire() as conn:
+            return await getattr(conn, method)(query, *args), False
     
     async def get_product(self, product_id: str) -> Optional[Product]:
-        """제품 ID로 제품 정보를 조회합니다."""
-        await self._ensure_initialized()
+        """제품 ID로 제품 정보를 조회합니다. 복제본에 아직 없거나 복제본 조회가 실패하면 주 풀에서 다시 조회합니다."""
+        result, read_only = await self._read("fetchrow", _GET_PRODUCT, product_id)
+        
+        if result is None and read_only:
+            self.primary_fallbacks += 1
+            async with self._router.acquire() as conn:
+                result = await conn.fetchrow(_GET_PRODUCT, product_id)
         
-        async with self.connection_pool.acquire() as conn:
-            query = """
-            SELECT id, name, price, image_url, url, mall_name, 
-                   product_type, maker, categories
-            FROM products 
-            WHERE id = $1
-            """
-            
-            result = await conn.fetchrow(query, product_id)
-            
-            if result:
-                return self._create_product_from_db(dict(result))
-            
-            return None
+        if result:
+            return self._create_product_from_record(result)
+        
+        return None
     
     async def get_products(self, product_ids: List[str]) -> List[Product]:
         """여러 제품 ID로 제품 정보를 배치 조회합니다."""
+        results = await self._fetch_product_records(product_ids)
+        return [self._create_product_from_record(result) for result in results]
+    
+    async def get_product_page(self, product_ids: List[str]) -> ProductPage:
+        """여러 제품 ID로 제품 정보와 갱신 시각을 배치 조회해 product_ids 순서대로 반환합니다."""
+        records = {result[0]: result for result in await self._fetch_product_records(product_ids)}
+        results = [records[product_id] for product_id in product_ids if product_id in records]
+        return ProductPage(
+            products=[self._create_product_from_record(result) for result in results],
+            updated_at=[result[9] for result in results],
+        )
+    
+    async def _fetch_product_records(self, product_ids: List[str]) -> List[asyncpg.Record]:
+        """
+        여러 제품 ID의 행을 조회합니다. (순서는 보장하지 않음)
+        
+        다른 워커가 방금 저장한 제품은 복제 지연으로 복제본에 없을 수 있으므로,
+        복제본에서 찾지 못한 ID만 주 풀에서 다시 조회합니다.
+        복제본 조회 자체가 실패하면 전체를 주 풀에서 조회합니다.
+        """
         if not product_ids:
             return []
         
-        await self._ensure_initialized()
+        results, read_only = await self._read("fetch", _GET_PRODUCTS, product_ids)
         
-        async with self.connection_pool.acquire() as conn:
-            query = """
-            SELECT id, name, price, image_url, url, mall_name, 
-                   product_type, maker, categories
-            FROM products 
-            WHERE id = ANY($1)
-            """
-            
-            results = await conn.fetch(query, product_ids)
-            
-            products = []
-            for result in results:
-                product = self._create_product_from_db(dict(result))
-                if product:
-                    products.append(product)
-            
-            return products
-    
-    async def search_products(self, query: str, limit: int = 50, offset: int = 0) -> List[Product]:
-        """제품명으로 제품을 검색합니다."""
-        await self._ensure_initialized()
+        if read_only and len(results) < len(set(product_ids)):
+            found_ids = {result[0] for result in results}
+            missing_ids = [product_id for product_id in set(product_ids) if product_id not in found_ids]
+            self.primary_fallbacks += 1
+            async with self._router.acquire() as conn:
+                results.extend(await conn.fetch(_GET_PRODUCTS, missing_ids))
         
-        async with self.connection_pool.acquire() as conn:
-            search_query = """
-            SELECT id, name, price, image_url, url, mall_name, 
-                   product_type, maker, categories
-            FROM products 
-            WHERE name ILIKE $1
-            ORDER BY updated_at DESC
-            LIMIT $2 OFFSET $3
-            """
-            
-            search_term = f"%{query}%"
-            results = await conn.fetch(search_query, search_term, limit, offset)
-            
-            products = []
-            for result in results:
-                product = self._create_product_from_db(dict(result))
-                if product:
-                    products.append(product)
-            
-            return products
-    
-    def _create_product_from_db(self, result: dict) -> Optional[Product]:
-        """데이터베이스 결과를 Product 객체로 변환합니다."""
-        try:
-            categories = json.loads(result['categories']) if result['categories'] else []
-            
-            return Product(
-                id=result['id'],
-                name=result['name'],
-                price=result['price'],
-                image_url=result['image_url'],
-                url=result['url'],
-                mall_name=result['mall_name'],
-                product_type=result['product_type'],
-                maker=result['maker'],
-                categories=categories
-            )
-        except Exception as e:
-            logger.error(f"제품 생성 중 오류: {e}")
-            return None
+        return results
     
-    async def create_table(self):
-        """제품 테이블을 생성합니다."""
-        logger.info("PostgreSQL 테이블 초기화 중...")
+    def _create_product_from_record(self, result: asyncpg.Record) -> Product:
+        """
+        데이터베이스 결과를 Product 객체로 변환합니다.
         
-        async with self.connection_pool.acquire() as conn:
-            create_query = """
-            CREATE TABLE IF NOT EXISTS products (
-                id VARCHAR(255) PRIMARY KEY,
-                name VARCHAR(1000) NOT NULL,
-                price DECIMAL(10, 2) DEFAULT 0.00,
-                image_url TEXT,
-                url TEXT,
-                mall_name VARCHAR(255),
-                product_type VARCHAR(255),
-                maker VARCHAR(255),
-                categories JSONB,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);
-            CREATE INDEX IF NOT EXISTS idx_products_mall_name ON products(mall_name);
-            CREATE INDEX IF NOT EXISTS idx_products_updated_at ON products(updated_at);
-            """
-            
-            await conn.execute(create_query)
-            logger.info("PostgreSQL 테이블 초기화 완료")
+        categories는 커넥션의 JSONB 코덱이 list로 디코딩하고, 저장 시 이미 검증된 값이므로
+        중간 dict 생성 없이 컬럼 순서대로 바로 만듭니다.
+        (SELECT 컬럼 순서: id, name, price, image_url, url, mall_name, product_type, maker, categories)
+        """
+        return Product(
+            id=result[0],
+            name=result[1],
+            price=float(result[2] or 0),
+            image_url=result[3] or "",
+            url=result[4] or "",
+            mall_name=result[5] or "",
+            product_type=result[6] or "",
+            maker=result[7] or "",
+            categories=result[8] or [],
+        )
     
     async def close(self):
         """연결 풀을 닫습니다."""
         if self.connection_pool:
-            await self.connection_pool.close() 
\ No newline at end of file
+            await self.connection_pool.close()
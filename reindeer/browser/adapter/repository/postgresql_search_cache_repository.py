@@ -0,0 +1,42 @@
+import asyncpg
+import logging
+from typing import Optional
+from browser.core.port.search_cache_repository import SearchCacheRepository
+from browser.core.entity.search_cache import SearchCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class PostgreSQLSearchCacheRepository(SearchCacheRepository):
+    def __init__(self, connection_pool: asyncpg.Pool, ttl_seconds: int = 3600):
+        self.connection_pool = connection_pool
+        self.ttl_seconds = ttl_seconds
+
+    async def get_entry(self, query: str) -> Optional[SearchCacheEntry]:
+        """TTL 안에 가져온 검색 결과 캐시를 조회합니다."""
+        async with self.connection_pool.acquire() as conn:
+            select_query = """
+            SELECT query, product_ids, fetched_at
+            FROM search_cache
+            WHERE query = $1 AND fetched_at > NOW() - make_interval(secs => $2)
+            """
+
+            result = await conn.fetchrow(select_query, query, float(self.ttl_seconds))
+
+            if result:
+                return SearchCacheEntry(**dict(result))
+
+            return None
+
+    async def save_entry(self, entry: SearchCacheEntry) -> None:
+        """검색 결과 캐시를 저장합니다. 같은 검색어는 최신 결과로 덮어씁니다."""
+        async with self.connection_pool.acquire() as conn:
+            query = """
+            INSERT INTO search_cache (query, product_ids, fetched_at)
+            VALUES ($1, $2, COALESCE($3, NOW()))
+            ON CONFLICT (query) DO UPDATE SET
+                product_ids = EXCLUDED.product_ids,
+                fetched_at = EXCLUDED.fetched_at
+            """
+
+            await conn.execute(query, entry.query, entry.product_ids, entry.fetched_at)
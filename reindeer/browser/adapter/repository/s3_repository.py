@@ -1,35 +1,270 @@
-import boto3
 import aiohttp
-import os
 import logging
-from typing import Optional
+from collections import OrderedDict
+from datetime import timezone
+from typing import List, Optional, Set
 from browser.core.port.image_repository import ImageRepository
+from browser.core.port.image_manifest_repository import ImageManifestRepository
+from browser.core.port.presigned_url_repository import PresignedUrlRepository
+from browser.core.entity.image_manifest import ImageManifestEntry
 import hashlib
 import asyncio
+import time
 from botocore.exceptions import ClientError
-from PIL import Image
-from rembg import remove
-import io
+from browser.core.infra.background_removal_pool import BackgroundRemovalPool
+from browser.core.infra.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# 존재가 확인된 S3 키를 기억해 두는 로컬 캐시의 최대 크기
+MAX_KNOWN_KEYS = 100000
+
+# 매니페스트가 완전한지(정합성 맞춤 완료) 다시 조회하기 전까지 결과를 재사용하는 시간 (초)
+MANIFEST_STATE_TTL = 60
+
+ORIGINAL_VARIANT = "original"
+NO_BG_VARIANT = "no-bg"
+
 
 class S3Repository(ImageRepository):
-    def __init__(self, s3_client, bucket_name: str, http_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        http_session: aiohttp.ClientSession,
+        background_remover: BackgroundRemovalPool,
+        image_manifest: Optional[ImageManifestRepository] = None,
+        presigned_url_cache: Optional[TTLCache] = None,
+        presigned_url_repository: Optional[PresignedUrlRepository] = None,
+        presigned_url_expires: int = 3600,
+        presigned_url_refresh_ratio: float = 0.8,
+    ):
         self.s3_client = s3_client
         self.bucket_name = bucket_name
         self.session = http_session
+        self.background_remover = background_remover
+        self.image_manifest = image_manifest
+        self._known_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._manifest_complete = False
+        self._manifest_state_expires_at = 0.0
+        self.presigned_url_cache = presigned_url_cache
+        self.presigned_url_repository = presigned_url_repository
+        self.presigned_url_expires = presigned_url_expires
+        # URL이 만료되기 전에 캐시에서 먼저 빠지도록 유효 시간의 일부만 캐시합니다
+        self.presigned_url_cache_ttl = presigned_url_expires * min(max(presigned_url_refresh_ratio, 0.0), 1.0)
     
     def _generate_image_id(self, image_url: str) -> str:
         """이미지 URL을 기반으로 고유한 이미지 ID를 생성합니다."""
         return hashlib.md5(image_url.encode()).hexdigest()
     
+    def get_image_id(self, image_url: str) -> str:
+        """이미지 URL에 해당하는 이미지 ID를 반환합니다."""
+        return self._generate_image_id(image_url)
+    
+    def _get_variant(self, with_background: bool = True) -> str:
+        """이미지 변형 이름을 반환합니다."""
+        return ORIGINAL_VARIANT if with_background else NO_BG_VARIANT
+    
+    def _get_s3_prefix(self, with_background: bool = True) -> str:
+        """이미지 변형별 S3 키 prefix를 반환합니다."""
+        return f"images/{self._get_variant(with_background)}/"
+    
     def _get_s3_key(self, image_id: str, with_background: bool = True) -> str:
         """S3 키를 생성합니다."""
-        if with_background:
-            return f"images/original/{image_id}.jpg"
-        else:
-            return f"images/no-bg/{image_id}.png"
+        extension = "jpg" if with_background else "png"
+        return f"{self._get_s3_prefix(with_background)}{image_id}.{extension}"
+    
+    def _remember_key(self, s3_key: str) -> None:
+        """존재가 확인된 S3 키를 로컬 캐시에 기록합니다."""
+        self._known_keys[s3_key] = None
+        self._known_keys.move_to_end(s3_key)
+        if len(self._known_keys) > MAX_KNOWN_KEYS:
+            self._known_keys.popitem(last=False)
+    
+    async def _object_exists(self, s3_key: str) -> bool:
+        """S3에 직접 객체가 존재하는지 확인합니다."""
+        try:
+            await self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        
+        self._remember_key(s3_key)
+        return True
+    
+    async def _image_exists(self, image_id: str, with_background: bool = True) -> bool:
+        """이미지 한 건이 저장되어 있는지 확인합니다."""
+        return image_id in await self.get_existing_image_ids([image_id], with_background=with_background)
+    
+    async def _put_object(
+        self,
+        image_id: str,
+        body: bytes,
+        source_url: str,
+        with_background: bool = True,
+    ) -> None:
+        """S3에 이미지를 업로드하고 매니페스트에 기록합니다."""
+        s3_key = self._get_s3_key(image_id, with_background=with_background)
+        await self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            Body=body,
+            ContentType='image/jpeg' if with_background else 'image/png'
+        )
+        self._remember_key(s3_key)
+        
+        if self.image_manifest:
+            # 매니페스트 기록이 실패해도 S3 저장은 유지하고, 정합성 맞춤 시 복구합니다
+            try:
+                await self.image_manifest.save_entries([
+                    ImageManifestEntry(
+                        image_id=image_id,
+                        variant=self._get_variant(with_background),
+                        s3_key=s3_key,
+                        source_url=source_url,
+                        byte_size=len(body),
+                        content_hash=hashlib.md5(body).hexdigest(),
+                    )
+                ])
+            except Exception as e:
+                logger.error(f"이미지 매니페스트 기록 실패: {s3_key} ({e})")
+                await self._mark_manifest_incomplete()
+    
+    async def _is_manifest_complete(self) -> bool:
+        """매니페스트가 S3 객체를 빠짐없이 반영하는지 조회합니다. (MANIFEST_STATE_TTL 동안 재사용)"""
+        if time.monotonic() < self._manifest_state_expires_at:
+            return self._manifest_complete
+        
+        try:
+            self._manifest_complete = await self.image_manifest.is_complete()
+        except Exception as e:
+            logger.warning(f"이미지 매니페스트 상태 조회 실패: {e}")
+            self._manifest_complete = False
+        self._manifest_state_expires_at = time.monotonic() + MANIFEST_STATE_TTL
+        return self._manifest_complete
+    
+    async def _mark_manifest_incomplete(self) -> None:
+        """기록하지 못한 객체가 생겼으므로 다음 정합성 맞춤까지 매니페스트에 없는 이미지를 S3에서 확인합니다."""
+        self._manifest_complete = False
+        self._manifest_state_expires_at = time.monotonic() + MANIFEST_STATE_TTL
+        try:
+            await self.image_manifest.mark_incomplete()
+        except Exception as e:
+            logger.error(f"이미지 매니페스트 상태 기록 실패: {e}")
+    
+    async def get_existing_image_ids(self, image_ids: List[str], with_background: bool = True) -> Set[str]:
+        """
+        이미지 ID 목록 중 이미 저장된 이미지의 ID를 한 번에 조회합니다.
+        
+        로컬 캐시에 있는 키는 바로 판정하고, 나머지는 이미지 매니페스트 한 번의
+        조회로 판정합니다. 매니페스트가 없거나 조회에 실패하면 S3에 동시에 확인합니다.
+        매니페스트가 아직 완전하지 않으면(정합성 맞춤 전이거나 이후 기록 누락이 있었으면)
+        매니페스트에 없는 이미지만 S3에 동시에 확인합니다.
+        
+        Args:
+            image_ids: 확인할 이미지 ID 목록
+            with_background: True면 원본, False면 배경 제거 이미지 기준
+        
+        Returns:
+            이미 저장된 이미지 ID 집합
+        """
+        s3_keys = {
+            image_id: self._get_s3_key(image_id, with_background=with_background)
+            for image_id in image_ids
+        }
+        existing_ids = {
+            image_id for image_id, s3_key in s3_keys.items()
+            if s3_key in self._known_keys
+        }
+        unknown_ids = [image_id for image_id in s3_keys if image_id not in existing_ids]
+        
+        if not unknown_ids:
+            return existing_ids
+        
+        if self.image_manifest:
+            try:
+                found_ids = await self.image_manifest.get_existing_image_ids(
+                    unknown_ids, self._get_variant(with_background)
+                )
+            except Exception as e:
+                logger.warning(f"이미지 매니페스트 조회 실패, S3에서 확인합니다: {e}")
+            else:
+                for image_id in found_ids:
+                    self._remember_key(s3_keys[image_id])
+                existing_ids |= found_ids
+                unknown_ids = [image_id for image_id in unknown_ids if image_id not in found_ids]
+                if not unknown_ids or await self._is_manifest_complete():
+                    return existing_ids
+        
+        results = await asyncio.gather(
+            *(self._object_exists(s3_keys[image_id]) for image_id in unknown_ids),
+            return_exceptions=True
+        )
+        for image_id, exists in zip(unknown_ids, results):
+            if isinstance(exists, Exception):
+                logger.warning(f"이미지 존재 여부 확인 실패: {image_id} ({exists})")
+            elif exists:
+                existing_ids.add(image_id)
+        
+        return existing_ids
+    
+    async def reconcile_manifest(self) -> dict:
+        """
+        S3 객체 목록을 기준으로 이미지 매니페스트를 맞춥니다.
+        
+        S3에는 있지만 기록이 없는 객체는 추가하고, S3에서 사라진 객체의 기록은 삭제합니다.
+        맞추는 동안 새로 기록하지 못한 객체가 없었다면 매니페스트가 완전하다고 기록하며,
+        그 뒤로는 매니페스트에 없는 이미지를 S3에서 다시 확인하지 않습니다.
+        
+        Returns:
+            추가/삭제된 기록 수와 매니페스트가 완전하다고 기록했는지 여부
+        """
+        if not self.image_manifest:
+            raise RuntimeError("이미지 매니페스트가 설정되지 않았습니다.")
+        
+        generation = await self.image_manifest.get_generation()
+        result = {"added": 0, "removed": 0}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        
+        for with_background in (True, False):
+            variant = self._get_variant(with_background)
+            prefix = self._get_s3_prefix(with_background)
+            recorded_keys = await self.image_manifest.get_s3_keys(variant)
+            stored_keys = set()
+            
+            async for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                missing_entries = []
+                for obj in page.get("Contents", []):
+                    s3_key = obj["Key"]
+                    stored_keys.add(s3_key)
+                    if s3_key in recorded_keys:
+                        continue
+                    missing_entries.append(ImageManifestEntry(
+                        image_id=s3_key[len(prefix):].rsplit(".", 1)[0],
+                        variant=variant,
+                        s3_key=s3_key,
+                        byte_size=obj["Size"],
+                        content_hash=obj["ETag"].strip('"'),
+                        stored_at=obj["LastModified"].astimezone(timezone.utc).replace(tzinfo=None),
+                    ))
+                
+                await self.image_manifest.save_entries(missing_entries)
+                result["added"] += len(missing_entries)
+            
+            stale_keys = list(recorded_keys - stored_keys)
+            await self.image_manifest.delete_entries(stale_keys)
+            result["removed"] += len(stale_keys)
+            for s3_key in stale_keys:
+                self._known_keys.pop(s3_key, None)
+                if self.presigned_url_cache is not None:
+                    self.presigned_url_cache.pop(self._get_presigned_url_cache_key(s3_key, variant))
+        
+        result["complete"] = await self.image_manifest.mark_complete(generation)
+        self._manifest_complete = result["complete"]
+        self._manifest_state_expires_at = time.monotonic() + MANIFEST_STATE_TTL
+        logger.info(f"이미지 매니페스트 정합성 맞춤 완료: {result}")
+        return result
     
     async def _remove_background(self, image_data: bytes) -> Optional[bytes]:
         """
@@ -42,29 +277,27 @@ class S3Repository(ImageRepository):
             배경이 제거된 PNG 이미지 바이트 데이터
         """
         try:
-            input_image = Image.open(io.BytesIO(image_data))
-            
-            output_image = await asyncio.get_event_loop().run_in_executor(
-                None, remove, input_image
-            )
-            
-            output_buffer = io.BytesIO()
-            output_image.save(output_buffer, format='PNG')
-            output_buffer.seek(0)
-            
-            return output_buffer.getvalue()
+            # 배경 제거는 CPU 집약적이므로 전용 워커 풀에서 배치로 실행
+            return await self.background_remover.remove_background(image_data)
             
         except Exception as e:
             logger.error(f"배경 제거 중 오류 발생: {e}")
             return None
     
-    async def save_image(self, image_url: str, remove_background: bool = True) -> bool:
+    async def save_image(
+        self,
+        image_url: str,
+        remove_background: bool = True,
+        original_exists: Optional[bool] = None,
+    ) -> bool:
         """
         이미지를 다운로드하고 S3에 저장합니다.
         
         Args:
             image_url: 이미지 URL
             remove_background: 배경 제거 여부
+            original_exists: 호출자가 get_existing_image_ids로 이미 확인한 원본 저장 여부
+                (주어지면 저장 여부를 다시 확인하지 않고 요청한 변형 중 없는 것만 저장, None이면 직접 확인)
         
         Returns:
             저장 성공 여부
@@ -72,53 +305,26 @@ class S3Repository(ImageRepository):
         try:
             image_id = self._generate_image_id(image_url)
             
-            original_key = self._get_s3_key(image_id, with_background=True)
-            
-            no_bg_key = self._get_s3_key(image_id, with_background=False) if remove_background else None
-            
-            try:
-                self.s3_client.head_object(Bucket=self.bucket_name, Key=original_key)
-                if remove_background and no_bg_key:
-                    try:
-                        self.s3_client.head_object(Bucket=self.bucket_name, Key=no_bg_key)
-                        return True
-                    except ClientError as e:
-                        if e.response['Error']['Code'] != '404':
-                            raise
-                else:
+            if original_exists is None:
+                original_exists = await self._image_exists(image_id, with_background=True)
+                if original_exists and (not remove_background or await self._image_exists(image_id, with_background=False)):
                     return True
-            except ClientError as e:
-                if e.response['Error']['Code'] != '404':
-                    raise
+            elif original_exists and not remove_background:
+                return True
             
             async with self.session.get(image_url) as response:
                 if response.status == 200:
                     image_data = await response.read()
                     
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.s3_client.put_object(
-                            Bucket=self.bucket_name,
-                            Key=original_key,
-                            Body=image_data,
-                            ContentType='image/jpeg'
-                        )
-                    )
+                    if not original_exists:
+                        await self._put_object(image_id, image_data, image_url, with_background=True)
                     
-                    if remove_background and no_bg_key:
+                    if remove_background:
                         logger.info(f"배경 제거 중: {image_url}")
                         no_bg_data = await self._remove_background(image_data)
                         
                         if no_bg_data:
-                            await asyncio.get_event_loop().run_in_executor(
-                                None,
-                                lambda: self.s3_client.put_object(
-                                    Bucket=self.bucket_name,
-                                    Key=no_bg_key,
-                                    Body=no_bg_data,
-                                    ContentType='image/png'
-                                )
-                            )
+                            await self._put_object(image_id, no_bg_data, image_url, with_background=False)
                             logger.info(f"배경 제거 완료: {image_url}")
                         else:
                             logger.warning(f"배경 제거 실패: {image_url}")
@@ -144,10 +350,52 @@ class S3Repository(ImageRepository):
         """
         return await self.save_image(image_url, remove_background=True)
     
+    def _get_presigned_url_cache_key(self, s3_key: str, variant: str) -> tuple:
+        """presigned URL 캐시 키를 생성합니다."""
+        return (self.bucket_name, s3_key, variant)
+    
+    async def _get_cached_presigned_url(self, cache_key: tuple) -> Optional[str]:
+        """로컬 캐시, 공유 저장소 순으로 아직 유효한 presigned URL을 조회합니다."""
+        if self.presigned_url_cache is not None:
+            url = self.presigned_url_cache.get(cache_key)
+            if url:
+                return url
+        
+        if self.presigned_url_repository:
+            try:
+                cached = await self.presigned_url_repository.get_url(":".join(cache_key))
+            except Exception as e:
+                logger.warning(f"공유 presigned URL 캐시 조회 실패: {e}")
+                return None
+            
+            if cached:
+                url, remaining_seconds = cached
+                if self.presigned_url_cache is not None:
+                    self.presigned_url_cache.set(cache_key, url, ttl_seconds=remaining_seconds)
+                return url
+        
+        return None
+    
+    async def _cache_presigned_url(self, cache_key: tuple, url: str) -> None:
+        """새로 서명한 presigned URL을 로컬 캐시와 공유 저장소에 기록합니다."""
+        if self.presigned_url_cache is not None:
+            self.presigned_url_cache.set(cache_key, url, ttl_seconds=self.presigned_url_cache_ttl)
+        
+        if self.presigned_url_repository:
+            try:
+                await self.presigned_url_repository.save_url(
+                    ":".join(cache_key), url, self.presigned_url_cache_ttl
+                )
+            except Exception as e:
+                logger.warning(f"공유 presigned URL 캐시 저장 실패: {e}")
+    
     async def get_image(self, image_id: str, with_background: bool = True) -> Optional[str]:
         """
         이미지 ID로 S3에서 이미지 URL을 조회합니다.
         
+        서명한 URL은 만료되기 전까지 캐시해 두고 재사용하므로, 캐시 적중 시에는
+        존재 확인과 서명을 모두 건너뜁니다.
+        
         Args:
             image_id: 이미지 ID
             with_background: 배경 포함 여부
@@ -157,19 +405,21 @@ class S3Repository(ImageRepository):
         """
         try:
             s3_key = self._get_s3_key(image_id, with_background=with_background)
+            cache_key = self._get_presigned_url_cache_key(s3_key, self._get_variant(with_background))
             
-            try:
-                self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-            except ClientError as e:
-                if e.response['Error']['Code'] == '404':
-                    return None
-                raise
+            url = await self._get_cached_presigned_url(cache_key)
+            if url:
+                return url
+            
+            if not await self._image_exists(image_id, with_background=with_background):
+                return None
             
-            url = self.s3_client.generate_presigned_url(
+            url = await self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=3600
+                ExpiresIn=self.presigned_url_expires
             )
+            await self._cache_presigned_url(cache_key, url)
             
             return url
             
@@ -0,0 +1,40 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ImageJobStatus(str, Enum):
+    """이미지 처리 작업의 상태입니다."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImageJob(BaseModel):
+    """
+    이미지 저장 작업을 나타내는 클래스입니다.
+    
+    속성:
+        image_id (str): 이미지의 고유 식별자
+        image_url (str): 원본 이미지 URL
+        remove_background (bool): 배경 제거 여부
+        status (ImageJobStatus): 작업 처리 상태
+        error (str | None): 실패 시 오류 메시지
+        attempts (int): 처리 시도 횟수
+        original_stored (bool | None): 큐에 넣을 때 일괄 확인한 원본 저장 여부
+            (확인하지 못했으면 None, 처리할 때 저장 여부를 다시 확인하지 않는 데 사용하며 영속화하지 않음)
+    """
+    image_id: str
+    image_url: str
+    remove_background: bool = True
+    status: ImageJobStatus = ImageJobStatus.PENDING
+    error: Optional[str] = None
+    attempts: int = 0
+    original_stored: Optional[bool] = Field(default=None, exclude=True)
+
+    @property
+    def is_active(self) -> bool:
+        """대기 중이거나 처리 중인 작업인지 여부입니다."""
+        return self.status in (ImageJobStatus.PENDING, ImageJobStatus.PROCESSING)
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ImageManifestEntry(BaseModel):
+    """
+    저장소에 저장된 이미지 한 건의 기록입니다.
+    
+    속성:
+        image_id (str): 이미지의 고유 식별자
+        variant (str): 이미지 변형 (original, no-bg)
+        s3_key (str): 저장된 객체 키
+        source_url (str | None): 원본 이미지 URL
+        byte_size (int): 저장된 객체 크기 (바이트)
+        content_hash (str | None): 저장된 내용의 MD5 해시
+        stored_at (datetime | None): 저장 시각
+    """
+    image_id: str
+    variant: str
+    s3_key: str
+    source_url: Optional[str] = None
+    byte_size: int = 0
+    content_hash: Optional[str] = None
+    stored_at: Optional[datetime] = None
@@ -1,10 +1,16 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import List
 
 
-class Product(BaseModel):
+@dataclass(slots=True)
+class Product:
     """
     제품 정보를 나타내는 클래스입니다.
     
+    외부 API 파싱 결과와 DB 조회 결과처럼 이미 형식이 정해진 값으로만 만들기 때문에
+    검증 없이 가볍게 만들 수 있도록 slots dataclass로 정의합니다.
+    API 응답에는 필드가 그대로 직렬화되며, 응답 스키마는 DTO(ProductResponse)로 문서화합니다.
+    
     속성:
         id (str): 제품의 고유 식별자
         name (str): 제품의 이름
@@ -24,4 +30,4 @@ class Product(BaseModel):
     mall_name: str
     product_type: str
     maker: str
-    categories: list[str]
\ No newline at end of file
+    categories: List[str]
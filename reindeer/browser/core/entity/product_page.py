@@ -0,0 +1,57 @@
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import orjson
+from pydantic import BaseModel
+
+from browser.core.entity.product import Product
+
+
+class SearchResultCursor(BaseModel):
+    """
+    검색 결과(검색어별로 캐시한 외부 API 결과 순서) 안의 다음 페이지 위치입니다.
+
+    속성:
+        offset (int): 다음 페이지가 시작하는 결과 목록 내 위치
+        id (str): 이전 페이지 마지막 제품의 ID (결과 목록이 다시 조회되어 순서가 바뀐 경우 이 제품 다음부터 이어 읽음)
+    """
+    offset: int
+    id: str
+
+    def encode(self) -> str:
+        """클라이언트에 전달할 불투명한 커서 문자열로 인코딩합니다."""
+        payload = orjson.dumps([self.offset, self.id])
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "SearchResultCursor":
+        """
+        커서 문자열을 디코딩합니다.
+
+        :raises ValueError: 형식이 잘못된 커서
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            offset, product_id = orjson.loads(payload)
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError(offset)
+            return cls(offset=offset, id=product_id)
+        except Exception as e:
+            raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+@dataclass(slots=True)
+class ProductPage:
+    """
+    제품 검색 결과 한 페이지입니다.
+
+    속성:
+        products (list[Product]): 이 페이지의 제품 목록
+        next_cursor (SearchResultCursor | None): 다음 페이지 위치 (마지막 페이지면 None)
+        updated_at (list[datetime]): products와 같은 순서의 제품별 갱신 시각 (응답 ETag 계산에 사용)
+    """
+    products: List[Product]
+    next_cursor: Optional[SearchResultCursor] = None
+    updated_at: List[datetime] = field(default_factory=list)
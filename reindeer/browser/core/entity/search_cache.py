@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class SearchCacheEntry(BaseModel):
+    """
+    검색어 한 건의 외부 API 검색 결과 캐시입니다.
+    
+    속성:
+        query (str): 정규화된 검색어
+        product_ids (list[str]): 외부 API가 반환한 순서대로의 제품 ID 목록
+        fetched_at (datetime | None): 외부 API에서 가져온 시각
+    """
+    query: str
+    product_ids: List[str]
+    fetched_at: Optional[datetime] = None
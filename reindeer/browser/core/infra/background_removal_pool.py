@@ -0,0 +1,324 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import BrokenBarrierError
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+from PIL import Image
+from rembg.bg import fix_image_orientation, naive_cutout
+from rembg.sessions.silueta import SiluetaSession
+from rembg.sessions.u2net import U2netSession
+from rembg.sessions.u2netp import U2netpSession
+
+from browser.core.infra.rembg_session import SUPPORTED_MODELS, RembgSessionManager, SessionLoadStats
+
+logger = logging.getLogger(__name__)
+
+# 여러 장을 한 번에 추론할 수 있는 세션과 그 predict()의 전처리 파라미터 (mean, std, 입력 크기)
+# rembg 세션 구현과 같은 값이어야 하므로, 여기에 없는 세션(다른 모델이나 predict를 바꾼 하위 클래스)은
+# session.predict로 한 장씩 추론합니다
+_U2NET_PREPROCESSING = ((0.485, 0.456, 0.406), (0.229, 0.224, 0.225), (320, 320))
+_BATCH_PREPROCESSING = {
+    U2netSession: _U2NET_PREPROCESSING,
+    U2netpSession: _U2NET_PREPROCESSING,
+    SiluetaSession: _U2NET_PREPROCESSING,
+}
+
+# 워커 프로세스마다 한 번만 로드되어 재사용되는 rembg 세션 관리자
+_worker_session_manager: Optional[RembgSessionManager] = None
+_worker_warmup_barrier = None
+_worker_batch_supported = True
+
+# 워밍업 시 모든 워커가 모일 때까지 기다리는 최대 시간 (초)
+WARMUP_BARRIER_TIMEOUT = 120
+
+
+def _init_worker(model_name: str, warmup_barrier) -> None:
+    """워커 프로세스 시작 시 rembg 세션을 로드합니다."""
+    global _worker_session_manager, _worker_warmup_barrier
+    _worker_warmup_barrier = warmup_barrier
+    _worker_session_manager = RembgSessionManager(model_name)
+    _worker_session_manager.load()
+
+
+def _worker_session_stats() -> SessionLoadStats:
+    """워커의 세션 로드 정보를 반환합니다."""
+    # 모든 워커가 모일 때까지 기다려 각 워커가 정확히 한 번씩 응답하도록 합니다
+    try:
+        _worker_warmup_barrier.wait(timeout=WARMUP_BARRIER_TIMEOUT)
+    except BrokenBarrierError:
+        pass
+    return _worker_session_manager.load()
+
+
+def _predict_masks(images: List[Image.Image]) -> List[Image.Image]:
+    """여러 이미지의 마스크를 한 번의 ONNX 추론으로 계산합니다."""
+    global _worker_batch_supported
+    session = _worker_session_manager.get_session()
+    preprocessing = _BATCH_PREPROCESSING.get(type(session))
+
+    if len(images) > 1 and preprocessing and _worker_batch_supported:
+        input_name = session.inner_session.get_inputs()[0].name
+        try:
+            batch = np.concatenate([
+                session.normalize(image, *preprocessing)[input_name]
+                for image in images
+            ])
+            predictions = session.inner_session.run(None, {input_name: batch})[0][:, 0, :, :]
+        except Exception as e:
+            # 배치 차원이 고정된 모델은 이후 요청부터 한 장씩 추론합니다
+            logger.warning(f"배치 추론 미지원 모델, 단건 추론으로 전환: {e}")
+            _worker_batch_supported = False
+        else:
+            masks = []
+            for image, prediction in zip(images, predictions):
+                value_range = float(prediction.max() - prediction.min()) or 1.0
+                prediction = (prediction - prediction.min()) / value_range
+                mask = Image.fromarray((prediction * 255).astype("uint8"), mode="L")
+                masks.append(mask.resize(image.size, Image.LANCZOS))
+            return masks
+
+    return [session.predict(image)[0] for image in images]
+
+
+def _remove_background_batch(images_data: List[bytes]) -> List[Optional[bytes]]:
+    """
+    워커 프로세스에서 이미지 묶음의 배경을 제거합니다.
+
+    Args:
+        images_data: 원본 이미지 바이트 데이터 목록
+
+    Returns:
+        배경이 제거된 PNG 바이트 데이터 목록 (실패한 이미지는 None)
+    """
+    results: List[Optional[bytes]] = [None] * len(images_data)
+    images = []
+    indexes = []
+
+    for index, image_data in enumerate(images_data):
+        try:
+            image = fix_image_orientation(Image.open(io.BytesIO(image_data)))
+            image.load()
+            images.append(image)
+            indexes.append(index)
+        except Exception as e:
+            logger.error(f"이미지 디코딩 실패: {e}")
+
+    if not images:
+        return results
+
+    masks = _predict_masks(images)
+
+    for index, image, mask in zip(indexes, images, masks):
+        try:
+            output_buffer = io.BytesIO()
+            naive_cutout(image, mask).save(output_buffer, format="PNG")
+            results[index] = output_buffer.getvalue()
+        except Exception as e:
+            logger.error(f"배경 제거 결과 생성 실패: {e}")
+
+    return results
+
+
+class BackgroundRemovalPool:
+    """
+    배경 제거 전용 프로세스 풀입니다.
+
+    워커 프로세스마다 rembg 세션을 시작 시점에 한 번만 로드해 두고, 짧은 시간 동안 모인
+    요청들을 하나의 배치로 묶어 추론합니다. 동시에 실행되는 배치 수는
+    워커 수로 제한되므로 요청이 몰려도 ONNX 세션이 코어를 두고 경쟁하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "u2net",
+        max_workers: int = 2,
+        max_batch_size: int = 8,
+        max_batch_wait_ms: int = 20,
+    ):
+        # 워커 프로세스의 초기화 실패는 첫 요청에서야 BrokenProcessPool로 드러나므로 미리 확인
+        if model_name not in SUPPORTED_MODELS:
+            raise ValueError(
+                f"지원하지 않는 배경 제거 모델입니다: {model_name} "
+                f"(지원 모델: {', '.join(SUPPORTED_MODELS)})"
+            )
+        self.model_name = model_name
+        self.max_workers = max(1, max_workers)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_wait = max(0, max_batch_wait_ms) / 1000
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self.session_stats: List[SessionLoadStats] = []
+        self.executor_restarts = 0
+
+    async def start(self) -> None:
+        """워커 프로세스 풀과 배치 디스패처를 시작합니다."""
+        if self._dispatcher:
+            return
+
+        self._executor = self._create_executor()
+        self._queue = asyncio.Queue()
+        self._batch_slots = asyncio.Semaphore(self.max_workers)
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """세션을 로드하는 워커 프로세스 풀을 만듭니다."""
+        # fork는 이벤트 루프와 스레드 상태를 복제하므로 spawn으로 워커를 띄웁니다
+        mp_context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.model_name, mp_context.Barrier(self.max_workers)),
+        )
+
+    def _replace_broken_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        워커가 비정상 종료되어(ONNX 추론 중 OOM 등) 사용할 수 없게 된 프로세스 풀을 새로 만듭니다.
+
+        같은 풀에서 실패한 여러 배치가 동시에 호출해도 한 번만 교체합니다.
+        """
+        if self._executor is not executor:
+            return
+        self.executor_restarts += 1
+        logger.error(f"배경 제거 워커 프로세스가 비정상 종료되어 워커 풀을 다시 만듭니다 ({self.executor_restarts}회)")
+        self._executor = self._create_executor()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def warmup(self) -> List[SessionLoadStats]:
+        """
+        모든 워커 프로세스를 띄워 세션을 미리 로드합니다.
+
+        Returns:
+            워커별 세션 로드 정보 목록
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _worker_session_stats)
+            for _ in range(self.max_workers)
+        ])
+        self.session_stats = list({stats.pid: stats for stats in results}.values())
+        return self.session_stats
+
+    async def remove_background(self, image_data: bytes) -> Optional[bytes]:
+        """
+        이미지의 배경 제거를 요청하고 결과를 기다립니다.
+
+        Args:
+            image_data: 원본 이미지 바이트 데이터
+
+        Returns:
+            배경이 제거된 PNG 이미지 바이트 데이터 (실패 시 None)
+        """
+        if not self._dispatcher:
+            raise RuntimeError("BackgroundRemovalPool이 시작되지 않았습니다.")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((image_data, future))
+        return await future
+
+    async def _dispatch_loop(self) -> None:
+        """큐에 쌓인 요청을 배치로 묶어 워커에 전달합니다."""
+        while True:
+            batch = [await self._queue.get()]
+
+            try:
+                # 배치가 차지 않았다면 잠시 기다려 뒤따르는 요청을 함께 묶습니다
+                if self._queue.qsize() < self.max_batch_size - 1 and self.max_batch_wait:
+                    await asyncio.sleep(self.max_batch_wait)
+
+                await self._batch_slots.acquire()
+            except asyncio.CancelledError:
+                # 워커에 넘기기 전에 멈추면(close) 큐에서 꺼낸 요청이 결과를 영원히 기다리지 않도록 취소합니다
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+
+            # 빈 워커를 기다리는 동안 들어온 요청도 같은 배치에 포함합니다
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[bytes, asyncio.Future]]) -> None:
+        """하나의 배치를 워커 프로세스에서 실행하고 결과를 분배합니다."""
+        executor = self._executor
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                executor,
+                _remove_background_batch,
+                [image_data for image_data, _ in batch],
+            )
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except BrokenProcessPool as e:
+            # 이 배치는 실패로 처리하고, 다음 요청부터는 새 워커 풀에서 처리합니다
+            self._replace_broken_executor(executor)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        except Exception as e:
+            logger.error(f"배경 제거 배치 처리 실패: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._batch_slots.release()
+
+    async def close(self) -> None:
+        """디스패처를 멈추고 워커 프로세스를 종료합니다."""
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+        if self._queue:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+        if self._executor:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._executor.shutdown
+            )
+            self._executor = None
+
+
+async def create_background_removal_pool(
+    model_name: str = "u2net",
+    max_workers: int = 2,
+    max_batch_size: int = 8,
+    max_batch_wait_ms: int = 20,
+):
+    """배경 제거 프로세스 풀을 생성하고 적절히 정리하는 generator 함수입니다."""
+    pool = BackgroundRemovalPool(
+        model_name=model_name,
+        max_workers=max_workers,
+        max_batch_size=max_batch_size,
+        max_batch_wait_ms=max_batch_wait_ms,
+    )
+    await pool.start()
+    print(f"🔧 배경 제거 워커 풀 생성됨: model={model_name}, workers={pool.max_workers}, batch={pool.max_batch_size}")
+    try:
+        yield pool
+    finally:
+        await pool.close()
+        print("🔧 배경 제거 워커 풀 종료됨")
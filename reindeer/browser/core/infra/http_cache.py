@@ -0,0 +1,69 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+class HttpCachePolicy:
+    """
+    응답의 HTTP 캐시 헤더(Cache-Control, ETag)와 조건부 요청(If-None-Match) 처리를 담당합니다.
+
+    CDN과 클라이언트는 max_age 동안 응답을 그대로 쓰고, 그 뒤 stale_while_revalidate 동안은
+    이전 응답을 먼저 돌려주면서 ETag로 재검증합니다. 재검증 요청의 ETag가 같으면 본문 없이 304로 응답합니다.
+    """
+
+    def __init__(self, max_age: int = 30, stale_while_revalidate: int = 60):
+        """
+        :param max_age: 응답을 재검증 없이 사용할 수 있는 시간(초) (0이면 매번 재검증)
+        :param stale_while_revalidate: max_age가 지난 뒤 재검증하는 동안 이전 응답을 쓸 수 있는 시간(초)
+        """
+        self.max_age = max(0, max_age)
+        self.stale_while_revalidate = max(0, stale_while_revalidate)
+        self.cache_control = self._build_cache_control()
+        self.conditional_requests = 0
+        self.not_modified = 0
+
+    def _build_cache_control(self) -> str:
+        if self.max_age == 0:
+            return "no-cache"
+        cache_control = f"public, max-age={self.max_age}"
+        if self.stale_while_revalidate:
+            cache_control += f", stale-while-revalidate={self.stale_while_revalidate}"
+        return cache_control
+
+    @staticmethod
+    def etag(*parts: Any) -> str:
+        """
+        응답 본문을 결정하는 값들로 ETag를 만듭니다.
+
+        값은 orjson으로 직렬화할 수 있어야 하며 (datetime 포함), 같은 값이면 프로세스/워커와 상관없이 같은 ETag가 됩니다.
+        """
+        digest = hashlib.blake2b(orjson.dumps(parts), digest_size=16).hexdigest()
+        return f'"{digest}"'
+
+    def is_not_modified(self, if_none_match: Optional[str], etag: str) -> bool:
+        """
+        If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다.
+
+        CDN이 압축하면서 약한 ETag(W/"...")로 바꿔 보내는 경우가 있으므로 약한 비교를 사용합니다.
+        """
+        if not if_none_match:
+            return False
+
+        self.conditional_requests += 1
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        matched = "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+        if matched:
+            self.not_modified += 1
+        return matched
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 헤더 설정과 조건부 요청 수, 304로 응답한 수를 반환합니다."""
+        return {
+            "cache_control": self.cache_control,
+            "conditional_requests": self.conditional_requests,
+            "not_modified": self.not_modified,
+            "not_modified_rate": (
+                round(self.not_modified / self.conditional_requests, 4) if self.conditional_requests else 0.0
+            ),
+        }
@@ -0,0 +1,134 @@
+import aiohttp
+from typing import Any, Dict, Optional
+
+
+class HttpClientStats:
+    """
+    HTTP 세션 하나의 요청 수와 커넥션 재사용, DNS 캐시 적중을 집계합니다.
+
+    trace_config()를 세션에 등록하면 aiohttp가 요청/커넥션 이벤트마다 카운터를 올립니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.errors = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """이 통계에 이벤트를 기록하는 TraceConfig를 만듭니다."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.requests += 1
+
+        async def on_request_exception(session, context, params):
+            self.errors += 1
+
+        async def on_connection_create_end(session, context, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.connections_reused += 1
+
+        async def on_dns_cache_hit(session, context, params):
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, context, params):
+            self.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def stats(self) -> Dict[str, Any]:
+        """요청 수, 새로 연 커넥션/재사용한 커넥션 수와 재사용률, DNS 캐시 적중 수를 반환합니다."""
+        connections = self.connections_created + self.connections_reused
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_rate": round(self.connections_reused / connections, 4) if connections else 0.0,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+async def create_http_connector(
+    limit: int = 100,
+    limit_per_host: int = 20,
+    keepalive_timeout: float = 30.0,
+    ttl_dns_cache: int = 300,
+):
+    """
+    여러 HTTP 세션이 공유하는 TCP 커넥션 풀을 생성하고, 종료 시 닫는 generator 함수입니다.
+
+    Args:
+        limit: 전체 최대 동시 커넥션 수 (0이면 제한 없음)
+        limit_per_host: 호스트별 최대 동시 커넥션 수 (0이면 제한 없음)
+        keepalive_timeout: 응답 후 커넥션을 다시 쓰기 위해 열어 두는 시간(초)
+        ttl_dns_cache: DNS 조회 결과를 캐시하는 시간(초)
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+    print(f"🔧 HTTP 커넥션 풀 생성됨: limit={limit}, per_host={limit_per_host}, keepalive={keepalive_timeout}s")
+    try:
+        yield connector
+    finally:
+        await connector.close()
+        print("🔧 HTTP 커넥션 풀 닫힘")
+
+
+def new_http_session(
+    connector: aiohttp.TCPConnector,
+    base_url: Optional[str] = None,
+    timeout: int = 20,
+    client_stats: Optional[HttpClientStats] = None,
+) -> aiohttp.ClientSession:
+    """
+    공유 커넥션 풀을 사용하는 HTTP 세션을 만듭니다.
+
+    세션을 닫아도 커넥션 풀은 닫지 않습니다. (create_http_connector가 관리)
+
+    Args:
+        connector: create_http_connector로 만든 공유 커넥션 풀
+        base_url: 요청 경로의 기준 URL (예: https://openapi.naver.com)
+        timeout: 요청 하나의 전체 타임아웃(초)
+        client_stats: 요청/커넥션 재사용 통계를 기록할 객체
+    """
+    return aiohttp.ClientSession(
+        base_url=base_url,
+        connector=connector,
+        connector_owner=False,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        trace_configs=[client_stats.trace_config()] if client_stats else None,
+    )
+
+
+async def create_http_client(
+    connector: aiohttp.TCPConnector,
+    timeout: int = 20,
+    client_stats: Optional[HttpClientStats] = None,
+):
+    """공유 커넥션 풀을 사용하는 HTTP 세션(이미지 다운로드 등)을 생성하고, 종료 시 닫는 generator 함수입니다."""
+    session = new_http_session(connector, timeout=timeout, client_stats=client_stats)
+    name = client_stats.name if client_stats else id(session)
+    print(f"🔧 HTTP 세션 생성됨: {name}")
+    try:
+        yield session
+    finally:
+        await session.close()
+        print(f"🔧 HTTP 세션 닫힘: {name}")
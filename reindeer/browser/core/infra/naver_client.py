@@ -1,8 +1,23 @@
-from functools import lru_cache
+from typing import Optional
 import aiohttp
+from browser.core.infra.http_client import HttpClientStats, new_http_session
 
 
-@lru_cache
-async def create_naver_client(base_url: str, timeout: int = 10) -> aiohttp.ClientSession:
-    """네이버 클라이언트 세션을 생성합니다."""
-    return aiohttp.ClientSession(base_url=base_url, timeout=aiohttp.ClientTimeout(total=timeout))
\ No newline at end of file
+async def create_naver_client(
+    connector: aiohttp.TCPConnector,
+    base_url: str,
+    timeout: int = 10,
+    client_stats: Optional[HttpClientStats] = None,
+):
+    """
+    네이버 API 세션을 생성하고 종료 시 닫는 generator 함수입니다.
+
+    공유 커넥션 풀을 사용하므로 요청마다 TCP/TLS 연결을 새로 맺지 않고 keep-alive 커넥션을 재사용합니다.
+    """
+    session = new_http_session(connector, base_url=base_url, timeout=timeout, client_stats=client_stats)
+    print(f"🔧 네이버 API 세션 생성됨: {base_url}")
+    try:
+        yield session
+    finally:
+        await session.close()
+        print("🔧 네이버 API 세션 닫힘")
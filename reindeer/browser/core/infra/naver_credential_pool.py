@@ -0,0 +1,203 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from browser.core.infra.rate_limiter import TokenBucket
+
+# 네이버 API 일일 호출 한도는 한국 시간 자정에 초기화됨
+_KST = timezone(timedelta(hours=9))
+
+
+def _today() -> date:
+    return datetime.now(_KST).date()
+
+
+def _seconds_until_reset() -> float:
+    """다음 한국 시간 자정까지 남은 시간(초)을 반환합니다."""
+    now = datetime.now(_KST)
+    reset_at = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=_KST)
+    return (reset_at - now).total_seconds()
+
+
+class NaverCredential:
+    """
+    네이버 API 키 하나와 그 키의 요청 한도, 일일 사용량, 사용 통계입니다.
+
+    속성:
+        client_id (str): 네이버 애플리케이션 Client ID
+        client_secret (str): 네이버 애플리케이션 Client Secret
+        rate_limiter (TokenBucket): 이 키의 초당 요청 한도
+        daily_quota (int): 이 키의 일일 호출 한도 (0이면 제한 없음)
+    """
+
+    def __init__(self, client_id: str, client_secret: str, rate_limiter: TokenBucket, daily_quota: int = 0):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.rate_limiter = rate_limiter
+        self.daily_quota = daily_quota
+        self.day = _today()
+        self.used_today = 0
+        self.exhausted_until = 0.0
+        self.disabled = False
+        self.requests = 0
+        self.throttled = 0
+        self.quota_exceeded = 0
+        self.failures = 0
+
+    @property
+    def name(self) -> str:
+        """통계/로그에 표시할 이름 (Client ID 앞부분)"""
+        return f"{self.client_id[:6]}***"
+
+    def _roll_day(self) -> None:
+        today = _today()
+        if today != self.day:
+            self.day = today
+            self.used_today = 0
+
+    def available(self) -> bool:
+        """지금 이 키로 요청할 수 있는지 (비활성화, 일일 한도 소진이 아닌지) 반환합니다."""
+        if self.disabled or self.exhausted_until > time.monotonic():
+            return False
+        self._roll_day()
+        return not self.daily_quota or self.used_today < self.daily_quota
+
+    def record_request(self) -> None:
+        self._roll_day()
+        self.used_today += 1
+        self.requests += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """이 키의 사용량과 요청 한도 통계를 반환합니다."""
+        return {
+            "available": self.available(),
+            "disabled": self.disabled,
+            "used_today": self.used_today,
+            "daily_quota": self.daily_quota,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "quota_exceeded": self.quota_exceeded,
+            "failures": self.failures,
+            "rate_limiter": self.rate_limiter.stats(),
+        }
+
+
+class NaverCredentialPool:
+    """
+    여러 네이버 API 키에 요청을 나눠 보내는 키 풀입니다.
+
+    요청마다 사용할 수 있는 키 중 토큰 대기 시간이 가장 짧은(같으면 오늘 덜 쓴) 키를 고르므로,
+    429로 잠시 멈춘 키나 일일 한도를 다 쓴 키는 자동으로 건너뜁니다.
+    """
+
+    def __init__(self, credentials: List[NaverCredential]):
+        if not credentials:
+            raise ValueError("네이버 API 키가 없습니다. NAVER_CLIENT_ID/NAVER_CLIENT_SECRET 또는 NAVER_CREDENTIALS를 설정하세요.")
+        self.credentials = credentials
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def _available(self) -> List[NaverCredential]:
+        return [credential for credential in self.credentials if credential.available()]
+
+    async def acquire(self, timeout: Optional[float] = None) -> Optional[NaverCredential]:
+        """
+        요청에 사용할 키를 고르고 그 키의 토큰을 받을 때까지 기다립니다.
+
+        :param timeout: 최대 대기 시간(초), None이면 제한 없음
+        :return: 사용할 키, 사용할 수 있는 키가 없거나 timeout 안에 토큰을 받을 수 없으면 None
+        """
+        available = self._available()
+        if not available:
+            return None
+
+        credential = min(
+            available,
+            key=lambda credential: (credential.rate_limiter.estimated_wait(), credential.used_today),
+        )
+        if not await credential.rate_limiter.acquire(timeout=timeout):
+            return None
+        credential.record_request()
+        return credential
+
+    def estimated_wait(self) -> float:
+        """다음 요청을 보낼 수 있을 때까지 예상 대기 시간(초)을 반환합니다."""
+        available = self._available()
+        if available:
+            return min(credential.rate_limiter.estimated_wait() for credential in available)
+
+        waits = [
+            max(0.0, credential.exhausted_until - time.monotonic()) if credential.exhausted_until else _seconds_until_reset()
+            for credential in self.credentials
+            if not credential.disabled
+        ]
+        return min(waits) if waits else 0.0
+
+    def mark_throttled(self, credential: NaverCredential, seconds: float) -> None:
+        """초당 한도를 넘은(429) 키를 seconds 동안 쉬게 합니다."""
+        credential.throttled += 1
+        credential.rate_limiter.pause(seconds)
+
+    def mark_quota_exceeded(self, credential: NaverCredential) -> None:
+        """일일 한도를 다 쓴 키를 다음 초기화(한국 시간 자정)까지 쓰지 않습니다."""
+        credential.quota_exceeded += 1
+        credential.exhausted_until = time.monotonic() + _seconds_until_reset()
+
+    def mark_invalid(self, credential: NaverCredential) -> None:
+        """인증에 실패한(401) 키를 더 이상 쓰지 않습니다."""
+        credential.disabled = True
+
+    def stats(self) -> Dict[str, Any]:
+        """키별 사용량 통계를 반환합니다."""
+        return {credential.name: credential.stats() for credential in self.credentials}
+
+
+def parse_naver_credentials(client_id: str, client_secret: str, credentials: str) -> List[Tuple[str, str]]:
+    """
+    설정의 네이버 API 키 목록을 읽습니다.
+
+    :param client_id: 기본 키의 Client ID (비어 있으면 생략)
+    :param client_secret: 기본 키의 Client Secret
+    :param credentials: 쉼표로 구분한 추가 키 목록 (예: "id1:secret1,id2:secret2")
+    :return: (Client ID, Client Secret) 목록 (중복 Client ID 제외)
+    """
+    pairs = [(client_id, client_secret)] if client_id else []
+    for entry in filter(None, (entry.strip() for entry in (credentials or "").split(","))):
+        entry_id, separator, entry_secret = entry.partition(":")
+        if not separator or not entry_id or not entry_secret:
+            raise ValueError(f"잘못된 네이버 API 키 형식입니다 (Client ID:Client Secret): {entry_id}")
+        pairs.append((entry_id, entry_secret))
+
+    unique = {}
+    for pair_id, pair_secret in pairs:
+        unique.setdefault(pair_id, pair_secret)
+    return list(unique.items())
+
+
+def create_naver_credential_pool(
+    client_id: str,
+    client_secret: str,
+    credentials: str = "",
+    rate_limit_qps: float = 10.0,
+    rate_limit_burst: int = 10,
+    daily_quota: int = 25000,
+) -> NaverCredentialPool:
+    """
+    네이버 API 키 풀을 생성합니다. 키마다 별도의 요청 한도와 일일 한도를 가집니다.
+
+    Args:
+        credentials: 쉼표로 구분한 추가 키 목록 (예: "id1:secret1,id2:secret2")
+        rate_limit_qps: 키별 초당 요청 수 (0이면 제한 없음)
+        rate_limit_burst: 키별 순간 허용 요청 수
+        daily_quota: 키별 일일 호출 한도 (0이면 제한 없음)
+    """
+    return NaverCredentialPool([
+        NaverCredential(
+            pair_id,
+            pair_secret,
+            TokenBucket(rate=rate_limit_qps, burst=rate_limit_burst),
+            daily_quota=daily_quota,
+        )
+        for pair_id, pair_secret in parse_naver_credentials(client_id, client_secret, credentials)
+    ])
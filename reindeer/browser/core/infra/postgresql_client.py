@@ -1,34 +1,51 @@
 import asyncpg
-from functools import lru_cache
-import os
+import orjson
+from typing import Dict, Optional
 
 
-@lru_cache
-def get_postgresql_config():
-    """PostgreSQL 연결 설정을 반환합니다."""
-    config = {
-        'host': os.getenv('DB_HOST', 'localhost'),
-        'port': int(os.getenv('DB_PORT', 5432)),
-        'user': os.getenv('DB_USER', 'postgres'),
-        'password': os.getenv('DB_PASSWORD', ''),
-        'database': os.getenv('DB_NAME', 'product_db'),
-        'min_size': 5,
-        'max_size': 20,
-    }
-    
-    # 디버깅을 위한 연결 정보 출력 (비밀번호는 마스킹)
-    print(f"🔍 PostgreSQL 연결 설정:")
-    print(f"   호스트: {config['host']}")
-    print(f"   포트: {config['port']}")
-    print(f"   사용자: {config['user']}")
-    print(f"   비밀번호: {'*' * len(config['password']) if config['password'] else '(없음)'}")
-    print(f"   데이터베이스: {config['database']}")
-    
-    return config
+def _encode_jsonb(value) -> str:
+    """파이썬 객체를 JSONB 텍스트로 인코딩합니다."""
+    return orjson.dumps(value).decode()
+
+
+async def init_postgresql_connection(conn: asyncpg.Connection):
+    """
+    풀의 커넥션마다 한 번 실행되는 초기화 함수입니다.
 
+    JSONB를 orjson 기반 코덱으로 주고받도록 등록하므로, 저장소에서는
+    json.dumps/json.loads 없이 list/dict를 그대로 사용합니다.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+    )
 
-async def create_postgresql_pool(db_host: str, db_port: int, db_user: str, db_password: str, db_name: str):
-    """PostgreSQL 연결 풀을 생성합니다."""
+
+async def create_postgresql_pool(
+    db_host: str,
+    db_port: int,
+    db_user: str,
+    db_password: str,
+    db_name: str,
+    min_size: int = 5,
+    max_size: int = 20,
+    statement_cache_size: int = 100,
+    max_inactive_connection_lifetime: float = 300.0,
+    server_settings: Optional[Dict[str, str]] = None,
+):
+    """
+    PostgreSQL 연결 풀을 생성합니다.
+    
+    Args:
+        min_size: 풀이 유지하는 최소 커넥션 수
+        max_size: 풀의 최대 커넥션 수
+        statement_cache_size: 커넥션별 prepared statement 캐시 크기 (같은 SQL은 커넥션마다 한 번만 prepare,
+            pgbouncer transaction 모드에서는 0)
+        max_inactive_connection_lifetime: 이 시간(초) 동안 쓰이지 않은 커넥션은 닫음 (0이면 유지)
+        server_settings: 커넥션별 서버 설정 (예: search_path)
+    """
     config = {
         'host': db_host,
         'port': db_port,
@@ -39,10 +56,46 @@ async def create_postgresql_pool(db_host: str, db_port: int, db_user: str, db_pa
     
     try:
         print(f"🔌 PostgreSQL 연결 시도 중: {config['user']}@{config['host']}:{config['port']}/{config['database']}")
-        pool = await asyncpg.create_pool(**config)
-        print(f"✅ PostgreSQL 연결 성공")
+        pool = await asyncpg.create_pool(
+            **config,
+            min_size=min(min_size, max_size),
+            max_size=max_size,
+            statement_cache_size=statement_cache_size,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            server_settings=server_settings,
+            init=init_postgresql_connection,
+        )
+        print(f"✅ PostgreSQL 연결 성공 (pool: {min(min_size, max_size)}~{max_size})")
         return pool
     except Exception as e:
         print(f"❌ PostgreSQL 연결 실패: {e}")
         print(f"🔍 연결 시도한 설정: {config['host']}:{config['port']}")
-        raise e
\ No newline at end of file
+        raise e
+
+
+async def create_postgresql_replica_pools(
+    db_replica_hosts: str,
+    db_port: int,
+    db_user: str,
+    db_password: str,
+    db_name: str,
+    **pool_options,
+):
+    """
+    읽기 복제본마다 PostgreSQL 연결 풀을 생성하고, 종료 시 닫습니다.
+    
+    Args:
+        db_replica_hosts: 쉼표로 구분한 복제본 주소 목록 (예: "replica1:5432,replica2"), 포트를 생략하면 db_port
+        pool_options: create_postgresql_pool에 넘길 풀 설정
+    """
+    pools = []
+    try:
+        for address in filter(None, (address.strip() for address in (db_replica_hosts or "").split(","))):
+            host, _, port = address.partition(":")
+            pools.append(await create_postgresql_pool(
+                host, int(port or db_port), db_user, db_password, db_name, **pool_options
+            ))
+        yield pools
+    finally:
+        for pool in pools:
+            await pool.close()
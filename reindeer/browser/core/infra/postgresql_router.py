@@ -0,0 +1,111 @@
+import asyncpg
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+# 라우팅 방식
+# - round_robin: 복제본을 순서대로 돌아가며 사용
+# - least_busy: 진행 중인 쿼리가 가장 적은 복제본을 사용
+REPLICA_STRATEGIES = ("round_robin", "least_busy")
+
+
+class PoolLatency:
+    """풀 하나의 쿼리 지연 시간(커넥션 대기 포함)을 집계합니다."""
+
+    def __init__(self, window: int = 1000):
+        self.queries = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        self.queries += 1
+        self.errors += int(failed)
+        self.total_seconds += seconds
+        self._recent.append(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """쿼리 수, 오류 수, 평균/최근 p50/p95 지연 시간(ms)을 반환합니다."""
+        recent = sorted(self._recent)
+
+        def percentile(ratio: float) -> float:
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(len(recent) * ratio))] * 1000, 3)
+
+        return {
+            "queries": self.queries,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "mean_ms": round(self.total_seconds / self.queries * 1000, 3) if self.queries else 0.0,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+        }
+
+
+class PostgreSQLPoolRouter:
+    """
+    읽기 쿼리는 복제본 풀로, 쓰기 쿼리는 주 풀로 보내는 라우터입니다.
+
+    복제본이 없으면 모든 쿼리를 주 풀로 보냅니다. 풀별로 지연 시간을 집계합니다.
+    """
+
+    def __init__(
+        self,
+        primary_pool: asyncpg.Pool,
+        replica_pools: Optional[List[asyncpg.Pool]] = None,
+        strategy: str = "round_robin",
+    ):
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"지원하지 않는 복제본 라우팅 방식입니다: {strategy} (지원: {', '.join(REPLICA_STRATEGIES)})")
+
+        self.primary_pool = primary_pool
+        self.replica_pools = list(replica_pools or [])
+        self.strategy = strategy
+        self._names = {id(primary_pool): "primary"}
+        self._names.update({id(pool): f"replica-{index}" for index, pool in enumerate(self.replica_pools)})
+        self._latencies = {name: PoolLatency() for name in self._names.values()}
+        self._round_robin = itertools.cycle(self.replica_pools) if self.replica_pools else None
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replica_pools)
+
+    def _select_replica(self) -> asyncpg.Pool:
+        """라우팅 방식에 따라 복제본 풀 하나를 고릅니다."""
+        if self.strategy == "least_busy":
+            return min(
+                self.replica_pools,
+                key=lambda pool: self._latencies[self._names[id(pool)]].in_flight,
+            )
+        return next(self._round_robin)
+
+    @asynccontextmanager
+    async def acquire(self, read_only: bool = False) -> AsyncIterator[asyncpg.Connection]:
+        """
+        커넥션을 빌려 줍니다. read_only이고 복제본이 있으면 복제본 풀에서 빌립니다.
+
+        빌리는 대기 시간부터 반환할 때까지를 해당 풀의 지연 시간으로 기록합니다.
+        """
+        pool = self._select_replica() if read_only and self.replica_pools else self.primary_pool
+        latency = self._latencies[self._names[id(pool)]]
+
+        latency.in_flight += 1
+        started = time.perf_counter()
+        failed = False
+        try:
+            async with pool.acquire() as conn:
+                yield conn
+        except Exception:
+            failed = True
+            raise
+        finally:
+            latency.in_flight -= 1
+            latency.record(time.perf_counter() - started, failed)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀별 지연 시간 통계를 반환합니다."""
+        return {name: latency.stats() for name, latency in self._latencies.items()}
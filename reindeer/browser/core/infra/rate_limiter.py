@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓이는 요청 속도 제한기입니다.
+
+    같은 인스턴스를 공유하는 동시 호출은 토큰을 먼저 예약한 순서대로 기다리므로,
+    한꺼번에 몰린 요청도 rate에 맞춰 차례로 나갑니다. 대기해야 하는 시간이 호출자의
+    timeout보다 길면 토큰을 예약하지 않고 바로 False를 반환합니다.
+    rate가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self.acquired = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.paused = 0
+        self.total_wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 하나를 얻을 때까지 기다립니다.
+
+        :param timeout: 최대 대기 시간(초), None이면 제한 없음
+        :return: 토큰을 얻었으면 True, timeout 안에 얻을 수 없으면 False
+        """
+        if self.rate <= 0:
+            self.acquired += 1
+            return True
+
+        wait = self.estimated_wait()
+        if timeout is not None and wait > timeout:
+            self.rejected += 1
+            return False
+
+        # 기다리기 전에 예약해 두어야 뒤에 온 호출이 같은 토큰을 가져가지 않음
+        self._tokens -= 1
+        self.acquired += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait_seconds += wait
+            await asyncio.sleep(wait)
+        return True
+
+    def estimated_wait(self) -> float:
+        """지금 acquire하면 기다려야 하는 시간(초)을 반환합니다."""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(time.monotonic())
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """
+        앞으로 seconds 동안 새 토큰을 내주지 않습니다. (서버가 429로 속도를 늦추라고 할 때)
+
+        이미 예약된 대기 순서는 유지하고, 그 뒤에 오는 호출부터 늦춥니다.
+        """
+        if self.rate <= 0 or seconds <= 0:
+            return
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, -seconds * self.rate)
+        self.paused += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """토큰 발급/대기/거절 통계를 반환합니다."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "paused": self.paused,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
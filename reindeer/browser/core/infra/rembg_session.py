@@ -0,0 +1,77 @@
+import os
+import resource
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from rembg import new_session
+from rembg.sessions.base import BaseSession
+
+# 배치 추론이 가능한 u2net 계열 모델 (u2netp, silueta는 더 가볍고 빠름)
+SUPPORTED_MODELS = ("u2net", "u2netp", "silueta")
+
+
+@dataclass
+class SessionLoadStats:
+    """rembg 세션 로드 결과 정보입니다."""
+    model_name: str
+    pid: int
+    load_seconds: float
+    memory_mb: float
+    peak_rss_mb: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS를 MB 단위로 반환합니다."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 킬로바이트 단위로 보고합니다
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+class RembgSessionManager:
+    """
+    프로세스 단위로 rembg 세션을 한 번만 로드해 재사용하는 관리자입니다.
+
+    rembg.remove에 session을 넘기지 않으면 호출마다 모델을 다시 찾아 로드하므로,
+    세션을 미리 로드해 두고 모든 추론에서 같은 세션을 사용합니다.
+    """
+
+    def __init__(self, model_name: str = "u2net"):
+        if model_name not in SUPPORTED_MODELS:
+            raise ValueError(
+                f"지원하지 않는 배경 제거 모델입니다: {model_name} "
+                f"(지원 모델: {', '.join(SUPPORTED_MODELS)})"
+            )
+        self.model_name = model_name
+        self.stats: Optional[SessionLoadStats] = None
+        self._session: Optional[BaseSession] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> SessionLoadStats:
+        """세션을 로드하고 로드 시간과 메모리 사용량을 기록합니다."""
+        with self._lock:
+            if self._session is None:
+                rss_before = _peak_rss_mb()
+                started_at = time.perf_counter()
+                self._session = new_session(self.model_name)
+                self.stats = SessionLoadStats(
+                    model_name=self.model_name,
+                    pid=os.getpid(),
+                    load_seconds=round(time.perf_counter() - started_at, 3),
+                    memory_mb=round(_peak_rss_mb() - rss_before, 1),
+                    peak_rss_mb=round(_peak_rss_mb(), 1),
+                )
+            return self.stats
+
+    def get_session(self) -> BaseSession:
+        """로드된 세션을 반환합니다. 아직 로드되지 않았다면 먼저 로드합니다."""
+        if self._session is None:
+            self.load()
+        return self._session
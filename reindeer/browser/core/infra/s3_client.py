@@ -1,19 +1,42 @@
-import boto3
-import aiohttp
+import aioboto3
+from aiobotocore.config import AioConfig
 from functools import lru_cache
 import os
-from contextlib import asynccontextmanager
 
 
-@lru_cache
-def get_s3_client():
-    """S3 클라이언트를 생성합니다."""
-    return boto3.client(
-        's3',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION', 'us-east-1')
+async def create_s3_client(
+    aws_access_key_id: str = "",
+    aws_secret_access_key: str = "",
+    region: str = "us-east-1",
+    endpoint_url: str | None = None,
+    max_pool_connections: int = 50,
+    timeout: int = 20,
+):
+    """
+    비동기 S3 클라이언트를 생성하고 적절히 정리하는 generator 함수입니다.
+    
+    하나의 클라이언트(와 그 커넥션 풀)를 애플리케이션 전체에서 공유합니다.
+    endpoint_url을 지정하면 moto server, LocalStack 같은 로컬 S3 호환 서버에 연결합니다.
+    """
+    # 자격증명이 비어 있으면 기본 자격증명 체인(IAM 역할 등)을 사용
+    session = aioboto3.Session(
+        aws_access_key_id=aws_access_key_id or None,
+        aws_secret_access_key=aws_secret_access_key or None,
+        region_name=region,
+    )
+    config = AioConfig(
+        max_pool_connections=max_pool_connections,
+        connect_timeout=timeout,
+        read_timeout=timeout,
+        retries={"max_attempts": 3, "mode": "standard"},
     )
+    
+    async with session.client("s3", endpoint_url=endpoint_url or None, config=config) as client:
+        print(f"🔧 S3 클라이언트 생성됨: region={region}, endpoint={endpoint_url or 'AWS'}, pool={max_pool_connections}")
+        try:
+            yield client
+        finally:
+            print("🔧 S3 클라이언트 닫힘")
 
 
 @lru_cache
@@ -23,28 +46,3 @@ def get_s3_config():
         'bucket_name': os.getenv('S3_BUCKET_NAME', 'product-images'),
         'region': os.getenv('AWS_REGION', 'us-east-1')
     }
-
-
-@asynccontextmanager
-async def create_http_session_context(timeout: int = 20):
-    """HTTP 세션을 생성하고 적절히 정리하는 async context manager입니다."""
-    timeout_config = aiohttp.ClientTimeout(total=timeout)
-    session = aiohttp.ClientSession(timeout=timeout_config)
-    print(f"🔧 HTTP 세션 생성됨: {id(session)}")
-    try:
-        yield session
-    finally:
-        await session.close()
-        print(f"🔧 HTTP 세션 닫힘: {id(session)}")
-
-
-async def create_http_session(timeout: int = 20):
-    """HTTP 세션을 생성하고 적절히 정리하는 generator 함수입니다."""
-    timeout_config = aiohttp.ClientTimeout(total=timeout)
-    session = aiohttp.ClientSession(timeout=timeout_config)
-    print(f"🔧 HTTP 세션 생성됨: {id(session)}")
-    try:
-        yield session
-    finally:
-        await session.close()
-        print(f"🔧 HTTP 세션 닫힘: {id(session)}")
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 작업을 하나의 실행으로 합칩니다.
+
+    먼저 들어온 요청이 작업을 실행하고, 실행 중에 같은 키로 들어온 요청은
+    새로 실행하지 않고 그 결과(또는 예외)를 함께 받습니다. 기다리던 요청 하나가
+    취소되어도 다른 요청이 기다리는 실행은 취소되지 않습니다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        키에 해당하는 작업을 실행하거나, 이미 실행 중이면 그 결과를 기다립니다.
+
+        :param key: 작업 키
+        :param func: 실행할 작업 (코루틴 함수)
+        :return: 작업 결과
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        """실행/합쳐진 요청 수를 반환합니다."""
+        return {
+            "in_flight": len(self._in_flight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
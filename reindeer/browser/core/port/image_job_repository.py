@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List
+from browser.core.entity.image_job import ImageJob
+
+
+class ImageJobRepository(ABC):
+    @abstractmethod
+    async def save_jobs(self, jobs: List[ImageJob]) -> None:
+        """
+        이미지 작업 상태를 저장합니다.
+
+        :param jobs: 저장할 작업 리스트
+        :return: 없음
+        """
+        ...
+
+    @abstractmethod
+    async def get_jobs(self, image_ids: List[str]) -> List[ImageJob]:
+        """
+        이미지 ID 목록으로 작업 상태를 조회합니다.
+
+        :param image_ids: 조회할 이미지 ID 리스트
+        :return: 작업 리스트
+        """
+        ...
+
+    @abstractmethod
+    async def get_unfinished_jobs(self) -> List[ImageJob]:
+        """
+        아직 완료되지 않은(대기 중이거나 처리 중인) 작업을 조회합니다.
+
+        :return: 작업 리스트
+        """
+        ...
@@ -0,0 +1,99 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+from browser.core.entity.image_manifest import ImageManifestEntry
+
+
+class ImageManifestRepository(ABC):
+    @abstractmethod
+    async def save_entries(self, entries: List[ImageManifestEntry]) -> None:
+        """
+        저장된 이미지 기록을 추가하거나 갱신합니다.
+
+        :param entries: 저장할 기록 리스트
+        :return: 없음
+        """
+        ...
+
+    @abstractmethod
+    async def get_entry(self, image_id: str, variant: str) -> Optional[ImageManifestEntry]:
+        """
+        이미지 ID와 변형으로 기록을 조회합니다.
+
+        :param image_id: 이미지 ID
+        :param variant: 이미지 변형 (original, no-bg)
+        :return: 기록 (없으면 None)
+        """
+        ...
+
+    @abstractmethod
+    async def get_existing_image_ids(self, image_ids: List[str], variant: str) -> Set[str]:
+        """
+        이미지 ID 목록 중 기록이 있는 ID를 한 번에 조회합니다.
+
+        :param image_ids: 확인할 이미지 ID 리스트
+        :param variant: 이미지 변형 (original, no-bg)
+        :return: 기록이 있는 이미지 ID 집합
+        """
+        ...
+
+    @abstractmethod
+    async def get_s3_keys(self, variant: str) -> Set[str]:
+        """
+        변형별로 기록된 모든 객체 키를 조회합니다. (정합성 맞춤용)
+
+        :param variant: 이미지 변형 (original, no-bg)
+        :return: 객체 키 집합
+        """
+        ...
+
+    @abstractmethod
+    async def delete_entries(self, s3_keys: List[str]) -> None:
+        """
+        객체 키에 해당하는 기록을 삭제합니다.
+
+        :param s3_keys: 삭제할 객체 키 리스트
+        :return: 없음
+        """
+        ...
+
+    @abstractmethod
+    async def is_complete(self) -> bool:
+        """
+        기록이 S3 객체를 빠짐없이 반영하는지 여부를 조회합니다.
+
+        정합성 맞춤을 마친 뒤 기록 누락이 없었을 때만 True이며, False면 기록이 없는 이미지도
+        S3에는 있을 수 있습니다.
+
+        :return: 기록이 완전한지 여부
+        """
+        ...
+
+    @abstractmethod
+    async def get_generation(self) -> int:
+        """
+        기록 누락이 생길 때마다(mark_incomplete) 늘어나는 번호를 조회합니다. (정합성 맞춤 시작 시 사용)
+
+        :return: 현재 번호
+        """
+        ...
+
+    @abstractmethod
+    async def mark_complete(self, generation: int) -> bool:
+        """
+        정합성 맞춤을 마쳤음을 기록합니다.
+
+        맞추는 동안 기록 누락이 생겼다면(번호가 바뀌었다면) 완전하다고 기록하지 않습니다.
+
+        :param generation: 정합성 맞춤을 시작할 때 get_generation으로 조회한 번호
+        :return: 완전하다고 기록했는지 여부
+        """
+        ...
+
+    @abstractmethod
+    async def mark_incomplete(self) -> None:
+        """
+        S3에 저장했지만 기록하지 못한 객체가 생겼음을 기록합니다. (다음 정합성 맞춤까지 불완전)
+
+        :return: 없음
+        """
+        ...
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Set
 
 
 class ImageRepository(ABC):
     @abstractmethod
-    def save_image(self, image_url: str) -> bool:
+    def save_image(self, image_url: str, remove_background: bool = True, original_exists: Optional[bool] = None) -> bool:
         """
         이미지를 저장합니다.
 
         :param image_url: 저장할 이미지의 URL
+        :param remove_background: 배경 제거 이미지도 저장할지 여부
+        :param original_exists: get_existing_image_ids로 이미 확인한 원본 저장 여부 (None이면 직접 확인)
         :return: 저장 성공 여부
         """
         ...
@@ -20,4 +23,25 @@ class ImageRepository(ABC):
         :param image_id: 검색할 이미지의 ID
         :return: 이미지의 URL
         """
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    def get_image_id(self, image_url: str) -> str:
+        """
+        이미지 URL로 저장소에서 사용하는 이미지 ID를 계산합니다.
+
+        :param image_url: 원본 이미지 URL
+        :return: 이미지 ID
+        """
+        ...
+
+    @abstractmethod
+    async def get_existing_image_ids(self, image_ids: List[str], with_background: bool = True) -> Set[str]:
+        """
+        이미지 ID 목록 중 이미 저장된 이미지의 ID를 한 번에 조회합니다.
+
+        :param image_ids: 확인할 이미지 ID 리스트
+        :param with_background: True면 원본, False면 배경 제거 이미지 기준으로 확인
+        :return: 이미 저장된 이미지 ID 집합
+        """
+        ...
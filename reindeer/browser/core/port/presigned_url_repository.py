@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class PresignedUrlRepository(ABC):
+    @abstractmethod
+    async def get_url(self, cache_key: str) -> Optional[Tuple[str, float]]:
+        """
+        공유 저장소에서 아직 유효한 presigned URL을 조회합니다.
+
+        :param cache_key: 캐시 키
+        :return: (URL, 남은 유효 시간(초)) (없거나 만료되었으면 None)
+        """
+        ...
+
+    @abstractmethod
+    async def save_url(self, cache_key: str, url: str, ttl_seconds: float) -> None:
+        """
+        presigned URL을 공유 저장소에 저장합니다.
+
+        :param cache_key: 캐시 키
+        :param url: presigned URL
+        :param ttl_seconds: 캐시 유효 시간 (초)
+        :return: 없음
+        """
+        ...
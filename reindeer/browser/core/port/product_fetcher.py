@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Optional
 from browser.core.entity.product import Product
 
 
+class ProductFetchError(Exception):
+    """
+    외부 제품 API에서 결과를 가져오지 못했을 때 발생합니다. (검색 결과가 없는 것과 구분)
+
+    속성:
+        retry_after (float | None): 다시 시도하기까지 권장 대기 시간(초)
+        retryable (bool): 잠시 후 다시 시도하면 성공할 수 있는지 여부
+            (False면 잘못된 요청이나 키 설정처럼 다시 시도해도 실패하는 오류)
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, retryable: bool = True):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+
 class ProductFetcher(ABC):
     @abstractmethod
     async def fetch_product(self, query: str, display: int = 10, start: int = 1, sort: str = "sim") -> List[Product]:
@@ -13,6 +29,20 @@ class ProductFetcher(ABC):
         :param display: 표시할 결과 수 (1-100)
         :param start: 시작 인덱스
         :param sort: 정렬 방식 (sim, date, asc, dsc)
-        :return: 제품 객체 리스트
+        :return: 제품 객체 리스트 (검색 결과가 없으면 빈 리스트)
+        :raises ProductFetchError: 재시도 후에도 API 요청이 실패한 경우
+        """
+        ...
+
+    @abstractmethod
+    def iter_products(self, query: str, max_results: int = 1000, sort: str = "sim") -> AsyncIterator[List[Product]]:
+        """
+        여러 페이지에 걸친 검색 결과를 페이지가 도착하는 대로 가져옵니다. (제품 ID 기준 중복 제거)
+
+        :param query: 검색할 제품의 검색어
+        :param max_results: 가져올 최대 결과 수
+        :param sort: 정렬 방식 (sim, date, asc, dsc)
+        :return: 페이지별 제품 리스트를 내보내는 비동기 이터레이터
+        :raises ProductFetchError: 첫 페이지 요청이 실패한 경우 (이후 페이지는 실패하면 건너뜀)
         """
         ...
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 from abc import ABC, abstractmethod
 from browser.core.entity.product import Product
+from browser.core.entity.product_page import ProductPage
 
 
 class ProductRepository(ABC):
@@ -14,6 +15,16 @@ class ProductRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def save_products(self, products: List[Product]) -> None:
+        """
+        여러 제품 정보를 한 번에 저장합니다.
+
+        :param products: 저장할 제품 리스트
+        :return: 없음
+        """
+        ...
+
     @abstractmethod
     def get_product(self, product_id: str) -> Product:
         """
@@ -25,8 +36,21 @@ class ProductRepository(ABC):
         ...
 
     @abstractmethod
-    def search_products(self, query: str, limit: int = 50, offset: int = 0) -> List[Product]:
+    def get_products(self, product_ids: List[str]) -> List[Product]:
         """
-        제품명으로 제품을 검색합니다.
+        여러 제품 ID로 제품 정보를 한 번에 가져옵니다. (순서는 보장하지 않음)
+
+        :param product_ids: 조회할 제품 ID 리스트
+        :return: 제품 리스트
         """
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    def get_product_page(self, product_ids: List[str]) -> ProductPage:
+        """
+        여러 제품 ID로 제품 정보와 갱신 시각을 가져옵니다. (product_ids 순서 유지, 없는 ID는 제외)
+
+        :param product_ids: 조회할 제품 ID 리스트 (페이지 순서)
+        :return: 제품 페이지 (next_cursor 없음, 제품별 갱신 시각 updated_at 포함)
+        """
+        ...
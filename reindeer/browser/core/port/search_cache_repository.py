@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from browser.core.entity.search_cache import SearchCacheEntry
+
+
+class SearchCacheRepository(ABC):
+    @abstractmethod
+    async def get_entry(self, query: str) -> Optional[SearchCacheEntry]:
+        """
+        정규화된 검색어의 유효한 캐시를 조회합니다.
+
+        :param query: 정규화된 검색어
+        :return: 캐시 (없거나 만료되었으면 None)
+        """
+        ...
+
+    @abstractmethod
+    async def save_entry(self, entry: SearchCacheEntry) -> None:
+        """
+        검색 결과 캐시를 저장합니다.
+
+        :param entry: 저장할 캐시
+        :return: 없음
+        """
+        ...
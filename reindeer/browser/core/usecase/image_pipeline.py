@@ -0,0 +1,311 @@
+from browser.core.port.image_repository import ImageRepository
+from browser.core.port.image_job_repository import ImageJobRepository
+from browser.core.entity.image_job import ImageJob, ImageJobStatus
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ImagePipeline:
+    """
+    이미지 다운로드, 배경 제거, 저장을 검색 요청과 분리해 처리하는 작업 큐입니다.
+
+    검색은 작업을 큐에 넣기만 하고 바로 응답하며, 정해진 수의 워커가
+    백그라운드에서 작업을 처리합니다. job_repository가 주어지면 작업 상태를
+    영속화해 프로세스가 재시작되어도 남은 작업을 이어서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        image_repository: ImageRepository,
+        job_repository: Optional[ImageJobRepository] = None,
+        concurrency: int = 4,
+        queue_size: int = 1000,
+        max_tracked_jobs: int = 10000,
+    ):
+        self.image_repository = image_repository
+        self.job_repository = job_repository
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.max_tracked_jobs = max_tracked_jobs
+        self._jobs: "OrderedDict[str, ImageJob]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+        # 원본만 처리 중일 때 배경 제거가 요청되어, 끝난 뒤 배경 제거 작업을 이어서 등록할 이미지 ID
+        self._remove_background_follow_ups: Set[str] = set()
+        self.created_jobs = 0
+        self.deduplicated_jobs = 0
+
+    async def start(self) -> None:
+        """워커를 시작하고 영속화된 미완료 작업을 다시 큐에 넣습니다."""
+        if self._workers:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.concurrency)
+        ]
+
+        if self.job_repository:
+            try:
+                unfinished_jobs = await self.job_repository.get_unfinished_jobs()
+            except Exception as e:
+                logger.error(f"미완료 이미지 작업 조회 실패: {e}")
+                return
+
+            for job in unfinished_jobs:
+                job.status = ImageJobStatus.PENDING
+                self._track_job(job)
+            self._dispatch(unfinished_jobs)
+
+            if unfinished_jobs:
+                logger.info(f"미완료 이미지 작업 {len(unfinished_jobs)}개를 다시 처리합니다.")
+
+    async def enqueue(self, image_urls: List[str], remove_background: bool = True) -> List[ImageJob]:
+        """
+        이미지 저장 작업을 큐에 넣고 바로 반환합니다.
+
+        이미 대기 중이거나 처리 중인 이미지, 최근에 요청한 변형까지 저장을 마친
+        이미지는 새 작업을 만들지 않습니다. 저장 여부 확인과 큐 등록은 백그라운드에서
+        이루어집니다.
+
+        :param image_urls: 저장할 이미지 URL 리스트
+        :param remove_background: 배경 제거 여부
+        :return: 요청한 이미지들의 작업 리스트
+        """
+        if not self._workers:
+            raise RuntimeError("ImagePipeline이 시작되지 않았습니다.")
+
+        jobs = []
+        new_jobs = []
+
+        for image_url in dict.fromkeys(image_urls):
+            image_id = self.image_repository.get_image_id(image_url)
+            job = self._jobs.get(image_id)
+
+            if job and job.is_active:
+                if remove_background and not job.remove_background:
+                    if job.status == ImageJobStatus.PENDING:
+                        # 아직 시작되지 않은 작업이라면 배경 제거 요청을 합쳐서 처리
+                        job.remove_background = True
+                    else:
+                        # 원본만 처리 중이면 끝난 뒤 배경 제거 작업을 이어서 등록
+                        self._remove_background_follow_ups.add(image_id)
+                self.deduplicated_jobs += 1
+                jobs.append(job)
+                continue
+
+            # 요청한 변형까지 저장을 마친 이미지는 저장 여부를 다시 확인하지 않음
+            if job and job.status == ImageJobStatus.COMPLETED and (job.remove_background or not remove_background):
+                self.deduplicated_jobs += 1
+                jobs.append(job)
+                continue
+
+            job = ImageJob(
+                image_id=image_id,
+                image_url=image_url,
+                remove_background=remove_background,
+            )
+            self._track_job(job)
+            jobs.append(job)
+            new_jobs.append(job)
+            self.created_jobs += 1
+
+        self._dispatch(new_jobs)
+        return jobs
+
+    async def get_jobs(self, image_urls: List[str]) -> List[Optional[ImageJob]]:
+        """
+        이미지 URL 목록의 작업 상태를 조회합니다.
+
+        :param image_urls: 조회할 이미지 URL 리스트
+        :return: 요청 순서대로 정렬된 작업 리스트 (알 수 없는 이미지는 None)
+        """
+        image_ids = [self.image_repository.get_image_id(url) for url in image_urls]
+        jobs: Dict[str, ImageJob] = {
+            image_id: self._jobs[image_id]
+            for image_id in image_ids
+            if image_id in self._jobs
+        }
+
+        missing_ids = [image_id for image_id in image_ids if image_id not in jobs]
+        if missing_ids and self.job_repository:
+            for job in await self.job_repository.get_jobs(missing_ids):
+                jobs[job.image_id] = job
+
+        return [jobs.get(image_id) for image_id in image_ids]
+
+    def stats(self) -> Dict[str, Any]:
+        """작업 생성/중복 제거 통계를 반환합니다."""
+        return {
+            "tracked_jobs": len(self._jobs),
+            "queued_jobs": self._queue.qsize() if self._queue else 0,
+            "created_jobs": self.created_jobs,
+            "deduplicated_jobs": self.deduplicated_jobs,
+        }
+
+    async def join(self) -> None:
+        """등록된 모든 작업이 끝날 때까지 기다립니다. (처리 중에 이어서 등록된 작업 포함)"""
+        while True:
+            while self._dispatch_tasks:
+                await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+            if self._queue:
+                await self._queue.join()
+            if not self._dispatch_tasks:
+                return
+
+    def _dispatch(self, jobs: List[ImageJob]) -> None:
+        """작업 분배를 백그라운드 태스크로 시작합니다."""
+        if not jobs:
+            return
+
+        task = asyncio.create_task(self._dispatch_jobs(jobs))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch_jobs(self, jobs: List[ImageJob]) -> None:
+        """이미 저장된 이미지를 한 번에 걸러내고 나머지 작업만 큐에 넣습니다."""
+        try:
+            original_ids, stored_ids = await self._find_stored_image_ids(jobs)
+        except Exception as e:
+            logger.warning(f"이미지 저장 여부 일괄 확인 실패: {e}")
+            original_ids, stored_ids = None, set()
+
+        pending_jobs = []
+        for job in jobs:
+            if job.image_id in stored_ids:
+                job.status = ImageJobStatus.COMPLETED
+            else:
+                # 워커가 이미지마다 저장 여부를 다시 확인하지 않도록 확인 결과를 넘김
+                job.original_stored = job.image_id in original_ids if original_ids is not None else None
+                pending_jobs.append(job)
+
+        # 워커가 먼저 끝내고 저장한 완료 상태를 대기 상태로 덮어쓰지 않도록 저장한 뒤 큐에 넣음
+        await self._persist(jobs)
+
+        for job in pending_jobs:
+            self._put_job(job)
+        await self._persist([job for job in pending_jobs if job.status == ImageJobStatus.FAILED])
+
+    async def _find_stored_image_ids(self, jobs: List[ImageJob]) -> Tuple[Set[str], Set[str]]:
+        """
+        원본이 저장된 이미지 ID와, 요청한 변형(원본/배경 제거)이 모두 저장된 이미지 ID를 조회합니다.
+
+        :return: (원본이 저장된 이미지 ID 집합, 요청한 변형이 모두 저장된 이미지 ID 집합)
+        """
+        original_ids, no_bg_ids = await asyncio.gather(
+            self.image_repository.get_existing_image_ids(
+                [job.image_id for job in jobs],
+                with_background=True
+            ),
+            self.image_repository.get_existing_image_ids(
+                [job.image_id for job in jobs if job.remove_background],
+                with_background=False
+            ),
+        )
+        return original_ids, {
+            job.image_id for job in jobs
+            if job.image_id in original_ids
+            and (not job.remove_background or job.image_id in no_bg_ids)
+        }
+
+    def _put_job(self, job: ImageJob) -> None:
+        """작업을 처리 큐에 넣습니다."""
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            job.status = ImageJobStatus.FAILED
+            job.error = "이미지 작업 큐가 가득 찼습니다."
+            logger.warning(f"이미지 작업 큐가 가득 차 작업을 건너뜁니다: {job.image_url}")
+
+    def _track_job(self, job: ImageJob) -> None:
+        """작업 상태를 추적 목록에 등록합니다."""
+        self._jobs[job.image_id] = job
+        self._jobs.move_to_end(job.image_id)
+        self._evict_finished_jobs()
+
+    def _evict_finished_jobs(self) -> None:
+        """추적 중인 작업 수가 한도를 넘으면 오래된 완료 작업부터 제거합니다."""
+        if len(self._jobs) <= self.max_tracked_jobs:
+            return
+
+        for image_id in list(self._jobs):
+            if len(self._jobs) <= self.max_tracked_jobs:
+                break
+            if not self._jobs[image_id].is_active:
+                del self._jobs[image_id]
+
+    async def _worker(self) -> None:
+        """큐에서 작업을 꺼내 처리합니다."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except Exception as e:
+                logger.error(f"이미지 작업 처리 중 오류 발생: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: ImageJob) -> None:
+        """하나의 이미지 작업을 처리하고 결과 상태를 기록합니다."""
+        job.status = ImageJobStatus.PROCESSING
+        job.attempts += 1
+
+        try:
+            saved = await self.image_repository.save_image(
+                job.image_url,
+                remove_background=job.remove_background,
+                original_exists=job.original_stored,
+            )
+            job.status = ImageJobStatus.COMPLETED if saved else ImageJobStatus.FAILED
+            job.error = None if saved else "이미지 저장에 실패했습니다."
+        except Exception as e:
+            job.status = ImageJobStatus.FAILED
+            job.error = str(e)
+
+        await self._persist([job])
+
+        if job.image_id in self._remove_background_follow_ups:
+            self._remove_background_follow_ups.discard(job.image_id)
+            self._enqueue_remove_background_follow_up(job)
+
+    def _enqueue_remove_background_follow_up(self, job: ImageJob) -> None:
+        """원본만 처리한 작업이 끝난 뒤, 처리 중에 요청된 배경 제거 작업을 등록합니다."""
+        # 그 사이 새 요청이 이미 다음 작업을 만들었다면 그 작업이 처리함
+        if self._jobs.get(job.image_id) is not job:
+            return
+
+        follow_up = ImageJob(
+            image_id=job.image_id,
+            image_url=job.image_url,
+            remove_background=True,
+        )
+        self._track_job(follow_up)
+        self.created_jobs += 1
+        self._dispatch([follow_up])
+
+    async def _persist(self, jobs: List[ImageJob]) -> None:
+        """작업 상태를 영속화합니다. 실패해도 이미지 처리는 계속합니다."""
+        if not jobs or not self.job_repository:
+            return
+
+        try:
+            await self.job_repository.save_jobs(jobs)
+        except Exception as e:
+            logger.error(f"이미지 작업 상태 저장 실패: {e}")
+
+    async def close(self) -> None:
+        """워커를 정리합니다. 남은 작업은 영속화된 경우 다음 시작 시 이어서 처리됩니다."""
+        tasks = [*self._dispatch_tasks, *self._workers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+
+        if self._queue and not self._queue.empty():
+            logger.warning(f"처리되지 않은 이미지 작업 {self._queue.qsize()}개가 남아 있습니다.")
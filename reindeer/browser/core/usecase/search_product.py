@@ -1,22 +1,60 @@
-from browser.core.port.product_fetcher import ProductFetcher
+from browser.core.port.product_fetcher import ProductFetcher, ProductFetchError
 from browser.core.port.product_repository import ProductRepository
-from browser.core.port.image_repository import ImageRepository
+from browser.core.port.search_cache_repository import SearchCacheRepository
 from browser.core.entity.product import Product
+from browser.core.entity.product_page import ProductPage, SearchResultCursor
+from browser.core.entity.search_cache import SearchCacheEntry
+from browser.core.infra.ttl_cache import TTLCache
+from browser.core.infra.single_flight import SingleFlight
+from browser.core.usecase.image_pipeline import ImagePipeline
+from datetime import datetime, timezone
 from typing import List, Optional
 import asyncio
 import hashlib
+import logging
+import unicodedata
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키로 사용할 수 있도록 검색어를 정규화합니다.
+
+    유니코드 호환 문자(전각 문자 등)를 통일하고, 대소문자와 공백 차이를 무시합니다.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).lower().split())
+
+
 class SearchProductRequest(BaseModel):
     query: str
     use_cache: bool = True
     remove_background: bool = True
 
 class SearchProduct:
-    def __init__(self, product_fetcher: ProductFetcher, product_repository: ProductRepository, image_repository: ImageRepository):
+    def __init__(
+        self,
+        product_fetcher: ProductFetcher,
+        product_repository: ProductRepository,
+        image_pipeline: ImagePipeline,
+        search_cache: Optional[SearchCacheRepository] = None,
+        local_search_cache: Optional[TTLCache] = None,
+        search_cache_ttl: int = 3600,
+        single_flight: Optional[SingleFlight] = None,
+        search_result_limit: int = 100,
+    ):
+        """
+        :param search_result_limit: 검색어마다 외부 API에서 가져와 캐시할 결과 수 (1-100, 한 번의 요청)
+        """
         self.product_fetcher = product_fetcher
         self.product_repository = product_repository
-        self.image_repository = image_repository
+        self.image_pipeline = image_pipeline
+        self.search_cache = search_cache
+        self.local_search_cache = local_search_cache
+        self.search_cache_ttl = search_cache_ttl
+        self.single_flight = single_flight or SingleFlight()
+        self.search_result_limit = max(1, min(100, search_result_limit))
     
     async def search_product(self, query: str, use_cache: bool = True, remove_background: bool = True) -> List[Product]:
         """
@@ -26,73 +64,221 @@ class SearchProduct:
         :param use_cache: 캐시 사용 여부
         :param remove_background: 배경 제거 여부
         :return: 제품 리스트
+        :raises ProductFetchError: 캐시 미스이고 외부 API 요청이 실패한 경우
         """
+        normalized_query = normalize_query(query)
         
         # 1. 캐시 확인 (선택적)
         if use_cache:
-            cached_product = await self.product_repository.search_products(query)
-            if cached_product:
-                return cached_product
+            cached_products = await self._get_cached_products(normalized_query)
+            if cached_products:
+                return cached_products
         
-        # 2. 외부 API에서 제품 정보 가져오기
+        # 2. 외부 API에서 가져오기 (같은 검색이 진행 중이면 그 결과를 함께 사용)
+        products = await self.single_flight.do(
+            (normalized_query, remove_background),
+            lambda: self._fetch_products(query, normalized_query, remove_background),
+        )
+        return list(products)
+    
+    async def search_product_page(
+        self,
+        query: str,
+        limit: int = 10,
+        cursor: Optional[SearchResultCursor] = None,
+        use_cache: bool = True,
+        remove_background: bool = True,
+    ) -> ProductPage:
+        """
+        search_product와 같은 검색 결과(외부 API 결과 순서)를 한 페이지씩 가져옵니다.
+        
+        검색어별로 캐시한 제품 ID 순서에서 이 페이지의 ID만 잘라 저장소에서 조회하므로,
+        페이지마다 전체 결과를 읽지 않습니다. 첫 페이지(cursor 없음)는 search_product처럼
+        캐시 미스(또는 use_cache=false)면 외부 API로 결과를 갱신하고, 다음 페이지는 첫 페이지가
+        캐시한 결과 순서를 그대로 이어 읽습니다.
+        
+        :param query: 검색 쿼리
+        :param limit: 페이지 크기
+        :param cursor: 이전 페이지가 반환한 다음 페이지 위치
+        :param use_cache: 캐시 사용 여부 (첫 페이지에만 적용)
+        :param remove_background: 배경 제거 여부
+        :return: 제품 페이지
+        :raises ProductFetchError: 캐시 미스이고 외부 API 요청이 실패한 경우
+        """
+        normalized_query = normalize_query(query)
+        product_ids = await self._get_result_product_ids(
+            query,
+            normalized_query,
+            use_cache=use_cache or cursor is not None,
+            remove_background=remove_background,
+        )
+        
+        offset = 0
+        if cursor is not None:
+            offset = cursor.offset
+            # 캐시가 만료되어 결과를 다시 조회했다면 이전 페이지 마지막 제품 다음부터 이어 읽음
+            if not 0 < offset <= len(product_ids) or product_ids[offset - 1] != cursor.id:
+                if cursor.id in product_ids:
+                    offset = product_ids.index(cursor.id) + 1
+        
+        page_ids = product_ids[offset:offset + limit]
+        page = await self.product_repository.get_product_page(page_ids)
+        if offset + limit < len(product_ids):
+            page.next_cursor = SearchResultCursor(offset=offset + limit, id=page_ids[-1])
+        return page
+    
+    async def _fetch_products(self, query: str, normalized_query: str, remove_background: bool = True) -> List[Product]:
+        """
+        외부 API에서 제품을 search_result_limit개까지 가져와 저장하고 검색 결과 캐시를 갱신합니다.
+        
+        :param query: 검색 쿼리
+        :param normalized_query: 정규화된 검색어
+        :param remove_background: 배경 제거 여부
+        :return: 제품 리스트
+        :raises ProductFetchError: 외부 API 요청이 실패한 경우 (빈 결과와 구분해 호출자에게 전달)
+        """
         try:
-            products = await self.product_fetcher.fetch_product(query)
+            # 다음 페이지도 캐시한 결과 순서에서 이어 읽을 수 있도록 한 페이지보다 깊게 가져옴
+            products = await self.product_fetcher.fetch_product(query, display=self.search_result_limit)
             
             if not products:
                 return []
             
-            # 3. 배치 처리로 이미지 저장 및 제품 정보 저장
+            # 3. 제품 정보 저장 및 이미지 작업 등록 (이미지는 백그라운드에서 처리)
             await self._save_products_batch(products, remove_background=remove_background)
             
-            # 4. 캐시 저장 (첫 번째 제품을 캐시로 저장)
-            if products and use_cache:
-                await self.product_repository.save_product(products[0])
+            # 4. 검색 결과 캐시 저장 (캐시를 사용하지 않은 요청도 다음 요청을 위해 갱신)
+            await self._save_search_cache(normalized_query, products)
             
             return products
-            
+        
+        except ProductFetchError:
+            raise
         except Exception as e:
             print(f"제품 검색 중 오류 발생: {e}")
             return []
     
+    async def _get_result_product_ids(
+        self,
+        query: str,
+        normalized_query: str,
+        use_cache: bool = True,
+        remove_background: bool = True,
+    ) -> List[str]:
+        """
+        검색 결과의 제품 ID 목록을 외부 API 결과 순서대로 가져옵니다.
+        
+        캐시에 있으면 제품 정보는 조회하지 않고 ID 목록만 반환하고,
+        없으면 search_product와 같이 외부 API에서 가져와 저장합니다.
+        """
+        if use_cache:
+            product_ids = await self._get_cached_product_ids(normalized_query)
+            if product_ids:
+                return product_ids
+        
+        products = await self.single_flight.do(
+            (normalized_query, remove_background),
+            lambda: self._fetch_products(query, normalized_query, remove_background),
+        )
+        return [product.id for product in products]
+    
+    async def _get_cached_products(self, normalized_query: str) -> List[Product]:
+        """
+        검색 결과 캐시에서 외부 API 결과와 같은 순서의 제품 목록을 가져옵니다.
+        
+        제품 ID 목록은 _get_cached_product_ids로 찾고, 제품 정보는 get_products 한 번으로 조회합니다.
+        
+        :param normalized_query: 정규화된 검색어
+        :return: 제품 리스트 (캐시 미스면 빈 리스트)
+        """
+        product_ids = await self._get_cached_product_ids(normalized_query)
+        if not product_ids:
+            return []
+        
+        products = {
+            product.id: product
+            for product in await self.product_repository.get_products(product_ids)
+        }
+        return [products[product_id] for product_id in product_ids if product_id in products]
+    
+    async def _get_cached_product_ids(self, normalized_query: str) -> List[str]:
+        """
+        프로세스 내 캐시, 검색 캐시 테이블 순으로 검색 결과의 제품 ID 목록을 찾습니다.
+        
+        :param normalized_query: 정규화된 검색어
+        :return: 제품 ID 리스트 (캐시 미스면 빈 리스트)
+        """
+        product_ids = None
+        if self.local_search_cache is not None:
+            product_ids = self.local_search_cache.get(normalized_query)
+        
+        if product_ids is None and self.search_cache:
+            try:
+                entry = await self.search_cache.get_entry(normalized_query)
+            except Exception as e:
+                logger.warning(f"검색 캐시 조회 실패: {e}")
+                entry = None
+            
+            if entry:
+                product_ids = entry.product_ids
+                self._set_local_cache(normalized_query, product_ids, entry.fetched_at)
+        
+        return product_ids or []
+    
+    async def _save_search_cache(self, normalized_query: str, products: List[Product]) -> None:
+        """검색 결과의 제품 ID 순서를 캐시에 기록합니다."""
+        product_ids = [product.id for product in products]
+        self._set_local_cache(normalized_query, product_ids)
+        
+        if self.search_cache:
+            try:
+                await self.search_cache.save_entry(
+                    SearchCacheEntry(query=normalized_query, product_ids=product_ids)
+                )
+            except Exception as e:
+                logger.warning(f"검색 캐시 저장 실패: {e}")
+    
+    def _set_local_cache(
+        self,
+        normalized_query: str,
+        product_ids: List[str],
+        fetched_at: Optional[datetime] = None,
+    ) -> None:
+        """프로세스 내 캐시에 제품 ID 목록을 기록합니다. (남은 TTL만큼만 유지)"""
+        if self.local_search_cache is None:
+            return
+        
+        ttl_seconds = self.search_cache_ttl
+        if fetched_at:
+            if fetched_at.tzinfo is None:
+                fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+            ttl_seconds -= (datetime.now(timezone.utc) - fetched_at).total_seconds()
+        
+        self.local_search_cache.set(normalized_query, product_ids, ttl_seconds=ttl_seconds)
+    
     async def _save_products_batch(self, products: List[Product], remove_background: bool = True) -> None:
         """
-        제품들을 배치로 저장합니다.
+        제품들을 한 번에 저장하고 이미지 저장 작업을 큐에 등록합니다.
+        
+        이미지 다운로드, 배경 제거, 업로드는 ImagePipeline이 백그라운드에서 처리하므로
+        검색 응답 시간에 영향을 주지 않습니다.
         
         :param products: 저장할 제품 리스트
         :param remove_background: 배경 제거 여부
         """
         try:
-            # 이미지 저장 작업들을 병렬로 실행
-            image_tasks = []
-            for product in products:
-                if product.image_url:
-                    # S3Repository의 save_image 메서드를 사용 (배경 제거 옵션 포함)
-                    if hasattr(self.image_repository, 'save_image'):
-                        image_tasks.append(
-                            self.image_repository.save_image(
-                                product.image_url, 
-                                remove_background=remove_background
-                            )
-                        )
-                    else:
-                        # 기본 save_image 메서드 사용
-                        image_tasks.append(
-                            self.image_repository.save_image(product.image_url)
-                        )
+            # 이미지 작업은 큐에 등록만 하고 처리 완료를 기다리지 않음
+            image_urls = [product.image_url for product in products if product.image_url]
+            image_task = self.image_pipeline.enqueue(image_urls, remove_background=remove_background)
             
-            # 제품 정보 저장 작업들을 병렬로 실행
-            product_tasks = [
-                self.product_repository.save_product(product)
-                for product in products
-            ]
+            # 제품 정보는 커넥션 하나로 한 번에 저장
+            product_task = self.product_repository.save_products(products)
             
-            # 모든 작업을 병렬로 실행
             await asyncio.gather(
-                *image_tasks,
-                *product_tasks,
+                image_task,
+                product_task,
                 return_exceptions=True
             )
-            
+        
         except Exception as e:
             print(f"배치 저장 중 오류 발생: {e}")
-    
@@ -1,13 +1,24 @@
 from dependency_injector import providers
 from dependency_injector.containers import DeclarativeContainer
 from browser.di.config import Settings
-from browser.core.infra.postgresql_client import create_postgresql_pool
-from browser.core.infra.s3_client import get_s3_client, get_s3_config, create_http_session
+from browser.core.infra.postgresql_client import create_postgresql_pool, create_postgresql_replica_pools
+from browser.core.infra.s3_client import create_s3_client, get_s3_config
+from browser.core.infra.http_client import HttpClientStats, create_http_connector, create_http_client
 from browser.core.infra.naver_client import create_naver_client
+from browser.core.infra.background_removal_pool import create_background_removal_pool
+from browser.core.infra.ttl_cache import TTLCache
+from browser.core.infra.http_cache import HttpCachePolicy
+from browser.core.infra.single_flight import SingleFlight
+from browser.core.infra.naver_credential_pool import create_naver_credential_pool
 from browser.adapter.repository.postgresql_repository import PostgreSQLRepository
 from browser.adapter.repository.s3_repository import S3Repository
+from browser.adapter.repository.postgresql_image_job_repository import PostgreSQLImageJobRepository
+from browser.adapter.repository.postgresql_image_manifest_repository import PostgreSQLImageManifestRepository
+from browser.adapter.repository.postgresql_presigned_url_repository import PostgreSQLPresignedUrlRepository
+from browser.adapter.repository.postgresql_search_cache_repository import PostgreSQLSearchCacheRepository
 from browser.adapter.product_fetcher.naver_fetcher import NaverFetcher
 from browser.core.usecase.search_product import SearchProduct
+from browser.core.usecase.image_pipeline import ImagePipeline
 import aiohttp
 
 
@@ -22,34 +33,128 @@ class BaseContainer(DeclarativeContainer):
         db_user=config.db_user,
         db_password=config.db_password,
         db_name=config.db_name,
+        min_size=config.db_pool_min_size,
+        max_size=config.db_pool_max_size,
+        statement_cache_size=config.db_statement_cache_size,
+        max_inactive_connection_lifetime=config.db_max_inactive_connection_lifetime,
     )
     
-    # S3 clients
-    s3_client = providers.Singleton(
-        get_s3_client,
+    # 읽기 복제본 풀 목록 (DB_REPLICA_HOSTS가 비어 있으면 빈 목록)
+    postgresql_replica_pools = providers.Resource(
+        create_postgresql_replica_pools,
+        db_replica_hosts=config.db_replica_hosts,
+        db_port=config.db_port,
+        db_user=config.db_user,
+        db_password=config.db_password,
+        db_name=config.db_name,
+        min_size=config.db_pool_min_size,
+        max_size=config.db_pool_max_size,
+        statement_cache_size=config.db_statement_cache_size,
+        max_inactive_connection_lifetime=config.db_max_inactive_connection_lifetime,
+    )
+    
+    # S3 clients (하나의 비동기 클라이언트와 커넥션 풀을 공유하는 Resource)
+    s3_client = providers.Resource(
+        create_s3_client,
+        aws_access_key_id=config.aws_access_key_id,
+        aws_secret_access_key=config.aws_secret_access_key,
+        region=config.aws_region,
+        endpoint_url=config.s3_endpoint_url,
+        max_pool_connections=config.s3_max_pool_connections,
+        timeout=config.s3_timeout,
     )
     
     s3_config = providers.Singleton(
         get_s3_config,
     )
     
+    # 네이버 API와 이미지 다운로드 세션이 함께 쓰는 TCP 커넥션 풀 (keep-alive, DNS 캐시)
+    http_connector = providers.Resource(
+        create_http_connector,
+        limit=config.http_connector_limit,
+        limit_per_host=config.http_connector_limit_per_host,
+        keepalive_timeout=config.http_keepalive_timeout,
+        ttl_dns_cache=config.http_dns_cache_ttl,
+    )
+    
+    # 세션별 요청/커넥션 재사용 통계
+    http_session_stats = providers.Singleton(HttpClientStats, name="image_download")
+    naver_client_stats = providers.Singleton(HttpClientStats, name="naver")
+    
     # HTTP session resources (generator 함수를 사용한 Resource)
     http_session = providers.Resource(
-        create_http_session,
+        create_http_client,
+        connector=http_connector,
         timeout=config.s3_timeout,
+        client_stats=http_session_stats,
     )
     
     # Naver client resource (generator 함수를 사용한 Resource)
     naver_client = providers.Resource(
         create_naver_client,
+        connector=http_connector,
         base_url=config.naver_base_url,
         timeout=config.naver_timeout,
+        client_stats=naver_client_stats,
+    )
+    
+    # Background removal worker pool resource
+    background_remover = providers.Resource(
+        create_background_removal_pool,
+        model_name=config.rembg_model,
+        max_workers=config.rembg_workers,
+        max_batch_size=config.rembg_batch_size,
+        max_batch_wait_ms=config.rembg_batch_wait_ms,
+    )
+    
+    # Caches
+    presigned_url_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.presigned_url_cache_size,
+        ttl_seconds=config.presigned_url_expires,
     )
     
+    search_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.search_cache_size,
+        ttl_seconds=config.cache_expire_time,
+    )
+    
+    # 검색 API 응답 본문(JSON bytes) 캐시
+    search_response_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.search_response_cache_size,
+        ttl_seconds=config.search_response_cache_ttl,
+    )
+    
+    # 검색 API 응답의 HTTP 캐시 헤더(Cache-Control, ETag)와 304 처리
+    search_http_cache_policy = providers.Singleton(
+        HttpCachePolicy,
+        max_age=config.search_http_cache_max_age,
+        stale_while_revalidate=config.search_http_stale_while_revalidate,
+    )
+    
+    # 동시에 들어온 같은 검색을 하나의 외부 API 호출로 합침
+    search_single_flight = providers.Singleton(SingleFlight)
+    
     # Repositories
     postgresql_repository = providers.Singleton(
         PostgreSQLRepository,
         connection_pool=postgresql_pool,
+        copy_threshold=config.product_copy_threshold,
+        replica_pools=postgresql_replica_pools,
+        replica_strategy=config.db_replica_strategy,
+        read_after_write_seconds=config.db_read_after_write_seconds,
+    )
+    
+    image_manifest_repository = providers.Singleton(
+        PostgreSQLImageManifestRepository,
+        connection_pool=postgresql_pool,
+    )
+    
+    presigned_url_repository = providers.Singleton(
+        PostgreSQLPresignedUrlRepository,
+        connection_pool=postgresql_pool,
     )
     
     s3_repository = providers.Singleton(
@@ -57,21 +162,82 @@ class BaseContainer(DeclarativeContainer):
         s3_client=s3_client,
         bucket_name=config.s3_bucket_name,
         http_session=http_session,
+        background_remover=background_remover,
+        image_manifest=providers.Selector(
+            config.image_manifest_store,
+            none=providers.Object(None),
+            postgresql=image_manifest_repository,
+        ),
+        presigned_url_cache=presigned_url_cache,
+        presigned_url_repository=providers.Selector(
+            config.presigned_url_store,
+            memory=providers.Object(None),
+            postgresql=presigned_url_repository,
+        ),
+        presigned_url_expires=config.presigned_url_expires,
+        presigned_url_refresh_ratio=config.presigned_url_refresh_ratio,
+    )
+    
+    search_cache_repository = providers.Singleton(
+        PostgreSQLSearchCacheRepository,
+        connection_pool=postgresql_pool,
+        ttl_seconds=config.cache_expire_time,
+    )
+    
+    image_job_repository = providers.Singleton(
+        PostgreSQLImageJobRepository,
+        connection_pool=postgresql_pool,
+    )
+    
+    # 네이버 API 키 풀 (프로세스 안의 모든 요청이 키별 요청 한도와 일일 사용량을 공유)
+    naver_credential_pool = providers.Singleton(
+        create_naver_credential_pool,
+        client_id=config.naver_client_id,
+        client_secret=config.naver_client_secret,
+        credentials=config.naver_credentials,
+        rate_limit_qps=config.naver_rate_limit_qps,
+        rate_limit_burst=config.naver_rate_limit_burst,
+        daily_quota=config.naver_daily_quota,
     )
     
     # Product fetchers
     naver_fetcher = providers.Singleton(
         NaverFetcher,
         naver_client=naver_client,
-        client_id=config.naver_client_id,
-        client_secret=config.naver_client_secret,
+        credential_pool=naver_credential_pool,
+        max_concurrency=config.naver_fetch_concurrency,
+        max_retries=config.naver_max_retries,
+        retry_base_delay=config.naver_retry_base_delay,
+        retry_max_delay=config.naver_retry_max_delay,
+        request_deadline=config.naver_request_deadline,
     )
     
     # Usecases
+    image_pipeline = providers.Singleton(
+        ImagePipeline,
+        image_repository=s3_repository,
+        job_repository=providers.Selector(
+            config.image_job_store,
+            memory=providers.Object(None),
+            postgresql=image_job_repository,
+        ),
+        concurrency=config.image_pipeline_concurrency,
+        queue_size=config.image_pipeline_queue_size,
+    )
+    
     search_product = providers.Singleton(
         SearchProduct,
         product_fetcher=naver_fetcher,
         product_repository=postgresql_repository,
-        image_repository=s3_repository,
+        image_pipeline=image_pipeline,
+        search_cache=providers.Selector(
+            config.search_cache_store,
+            memory=providers.Object(None),
+            postgresql=search_cache_repository,
+        ),
+        local_search_cache=search_cache,
+        search_cache_ttl=config.cache_expire_time,
+        single_flight=search_single_flight,
+        search_result_limit=config.search_result_limit,
     )
 
@@ -13,6 +13,15 @@ class Settings(BaseSettings):
     db_user: str
     db_password: str
     db_name: str
+    db_pool_min_size: int = 5
+    db_pool_max_size: int = 20
+    db_statement_cache_size: int = 100
+    db_max_inactive_connection_lifetime: float = 300.0
+    db_migrate_on_startup: bool = True
+    db_replica_hosts: str = ""
+    db_replica_strategy: str = "round_robin"
+    db_read_after_write_seconds: float = 1.0
+    product_copy_threshold: int = 1000
     
     # S3 settings
     aws_access_key_id: str = ""
@@ -20,9 +29,54 @@ class Settings(BaseSettings):
     aws_region: str = "us-east-1"
     s3_bucket_name: str = "product-images"
     s3_timeout: int = 20
+    s3_endpoint_url: str | None = None
+    s3_max_pool_connections: int = 50
+    
+    # Presigned URL cache settings
+    presigned_url_expires: int = 3600
+    presigned_url_refresh_ratio: float = 0.8
+    presigned_url_cache_size: int = 10000
+    presigned_url_store: str = "memory"
+    
+    # Search cache settings
+    cache_expire_time: int = 3600
+    search_cache_size: int = 1000
+    search_cache_store: str = "postgresql"
+    search_result_limit: int = 100
+    search_response_cache_size: int = 1000
+    search_response_cache_ttl: int = 60
+    search_http_cache_max_age: int = 30
+    search_http_stale_while_revalidate: int = 60
+    
+    # HTTP client settings (네이버 API, 이미지 다운로드 공유 커넥션 풀)
+    http_connector_limit: int = 100
+    http_connector_limit_per_host: int = 20
+    http_keepalive_timeout: float = 30.0
+    http_dns_cache_ttl: int = 300
     
     # Naver API settings
-    naver_client_id: str
-    naver_client_secret: str
+    naver_client_id: str = ""
+    naver_client_secret: str = ""
+    naver_credentials: str = ""
     naver_base_url: str
     naver_timeout: int = 10
+    naver_fetch_concurrency: int = 4
+    naver_rate_limit_qps: float = 10.0
+    naver_rate_limit_burst: int = 10
+    naver_daily_quota: int = 25000
+    naver_max_retries: int = 3
+    naver_retry_base_delay: float = 0.2
+    naver_retry_max_delay: float = 5.0
+    naver_request_deadline: float = 10.0
+    
+    # Background removal settings
+    rembg_model: str = "u2net"
+    rembg_workers: int = 2
+    rembg_batch_size: int = 8
+    rembg_batch_wait_ms: int = 20
+    
+    # Image pipeline settings
+    image_pipeline_concurrency: int = 4
+    image_pipeline_queue_size: int = 1000
+    image_job_store: str = "memory"
+    image_manifest_store: str = "postgresql"
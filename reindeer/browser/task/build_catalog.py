@@ -0,0 +1,54 @@
+import argparse
+import asyncio
+import time
+from browser.adapter.repository.postgresql_migrations import migrate
+from browser.core.port.product_fetcher import ProductFetchError
+from browser.di.base import BaseContainer
+from browser.di.config import Settings
+
+
+async def build_catalog(queries, max_results: int = 1000):
+    """검색어마다 네이버 검색 결과를 여러 페이지 가져와 제품 테이블에 저장합니다."""
+    container = BaseContainer()
+    config = Settings()
+    container.config.from_pydantic(config)
+    
+    try:
+        if config.db_migrate_on_startup:
+            await migrate(await container.postgresql_pool())
+        naver_fetcher = await container.naver_fetcher()
+        product_repository = await container.postgresql_repository()
+        
+        for query in queries:
+            started = time.perf_counter()
+            saved = 0
+            try:
+                # 페이지가 도착하는 대로 저장해 마지막 페이지를 기다리지 않음
+                async for products in naver_fetcher.iter_products(query, max_results=max_results):
+                    await product_repository.save_products(products)
+                    saved += len(products)
+            except ProductFetchError as e:
+                print(f"❌ '{query}': 검색 실패 ({e})")
+                if not e.retryable:
+                    # 키 설정 문제는 다른 검색어에서도 똑같이 실패하므로 중단
+                    break
+                continue
+            print(f"✅ '{query}': 제품 {saved}개 저장 ({time.perf_counter() - started:.2f}s)")
+        
+        print(f"📦 저장 통계: {product_repository.stats()}")
+        print(f"🌐 네이버 API 통계: {naver_fetcher.stats()}")
+    finally:
+        await container.shutdown_resources()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 검색 결과로 제품 카탈로그 구축")
+    parser.add_argument("queries", nargs="+", help="검색어 목록")
+    parser.add_argument("--max-results", type=int, default=1000, help="검색어별 최대 결과 수 (최대 1000)")
+    args = parser.parse_args()
+    
+    asyncio.run(build_catalog(args.queries, max_results=args.max_results))
+
+
+if __name__ == "__main__":
+    main()
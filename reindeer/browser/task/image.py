@@ -0,0 +1,14 @@
+from dependency_injector.wiring import Provide, inject
+from browser.di.base import BaseContainer
+from browser.core.usecase.image_pipeline import ImagePipeline
+
+
+@inject
+async def get_image_jobs(
+    image_urls: list[str],
+    image_pipeline: ImagePipeline = Provide[BaseContainer.image_pipeline]
+):
+    """
+    이미지 처리 상태 조회 함수
+    """
+    return await image_pipeline.get_jobs(image_urls)
@@ -0,0 +1,41 @@
+from dependency_injector.wiring import Provide, inject
+from browser.di.base import BaseContainer
+from browser.core.infra.ttl_cache import TTLCache
+from browser.core.infra.http_cache import HttpCachePolicy
+from browser.core.infra.single_flight import SingleFlight
+from browser.core.infra.http_client import HttpClientStats
+from browser.core.usecase.image_pipeline import ImagePipeline
+from browser.adapter.repository.postgresql_repository import PostgreSQLRepository
+from browser.adapter.product_fetcher.naver_fetcher import NaverFetcher
+
+
+@inject
+async def get_metrics(
+    presigned_url_cache: TTLCache = Provide[BaseContainer.presigned_url_cache],
+    search_cache: TTLCache = Provide[BaseContainer.search_cache],
+    search_response_cache: TTLCache = Provide[BaseContainer.search_response_cache],
+    search_http_cache_policy: HttpCachePolicy = Provide[BaseContainer.search_http_cache_policy],
+    search_single_flight: SingleFlight = Provide[BaseContainer.search_single_flight],
+    image_pipeline: ImagePipeline = Provide[BaseContainer.image_pipeline],
+    product_repository: PostgreSQLRepository = Provide[BaseContainer.postgresql_repository],
+    naver_fetcher: NaverFetcher = Provide[BaseContainer.naver_fetcher],
+    naver_client_stats: HttpClientStats = Provide[BaseContainer.naver_client_stats],
+    http_session_stats: HttpClientStats = Provide[BaseContainer.http_session_stats],
+):
+    """
+    컴포넌트별 캐시/처리 통계 조회 함수
+    """
+    return {
+        "presigned_url_cache": presigned_url_cache.stats(),
+        "search_cache": search_cache.stats(),
+        "search_response_cache": search_response_cache.stats(),
+        "search_http_cache": search_http_cache_policy.stats(),
+        "search_single_flight": search_single_flight.stats(),
+        "image_pipeline": image_pipeline.stats(),
+        "product_repository": product_repository.stats(),
+        "naver_fetcher": naver_fetcher.stats(),
+        "http_clients": {
+            naver_client_stats.name: naver_client_stats.stats(),
+            http_session_stats.name: http_session_stats.stats(),
+        },
+    }
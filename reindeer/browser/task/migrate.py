@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+from browser.adapter.repository.postgresql_migrations import MIGRATIONS, get_schema_version, migrate
+from browser.di.base import BaseContainer
+from browser.di.config import Settings
+
+
+async def run_migrations(show_status: bool = False):
+    """적용되지 않은 스키마 마이그레이션을 적용합니다. (show_status면 현재 버전만 출력)"""
+    container = BaseContainer()
+    container.config.from_pydantic(Settings())
+    
+    try:
+        connection_pool = await container.postgresql_pool()
+        if not show_status:
+            applied_versions = await migrate(connection_pool)
+            print(f"✅ 마이그레이션 적용 완료: {applied_versions or '변경 없음'}")
+        
+        latest_version = max(migration.version for migration in MIGRATIONS)
+        print(f"📦 스키마 버전: {await get_schema_version(connection_pool)} (최신: {latest_version})")
+    finally:
+        await container.shutdown_resources()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PostgreSQL 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용하지 않고 현재 스키마 버전만 출력")
+    args = parser.parse_args()
+    
+    asyncio.run(run_migrations(show_status=args.status))
+
+
+if __name__ == "__main__":
+    main()
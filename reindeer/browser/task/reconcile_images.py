@@ -0,0 +1,29 @@
+import asyncio
+from dependency_injector import providers
+from browser.di.base import BaseContainer
+from browser.di.config import Settings
+
+
+async def reconcile_images():
+    """S3 객체 목록을 기준으로 이미지 매니페스트를 맞춥니다."""
+    container = BaseContainer()
+    container.config.from_pydantic(Settings())
+    # 정합성 맞춤에는 배경 제거가 필요 없으므로 워커 풀을 띄우지 않습니다
+    container.background_remover.override(providers.Object(None))
+    
+    try:
+        s3_repository = await container.s3_repository()
+        result = await s3_repository.reconcile_manifest()
+        print(f"✅ 이미지 매니페스트 정합성 맞춤 완료: 추가 {result['added']}건, 삭제 {result['removed']}건")
+        if not result["complete"]:
+            print("⚠️ 맞추는 동안 기록하지 못한 이미지가 있어, 매니페스트에 없는 이미지는 계속 S3에서 확인합니다. 다시 실행하세요.")
+    finally:
+        await container.shutdown_resources()
+
+
+def main():
+    asyncio.run(reconcile_images())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,11 @@ from dependency_injector.wiring import Provide, inject
 from browser.di.base import BaseContainer
 from browser.di.config import Settings
 from browser.core.usecase.search_product import SearchProduct
+from browser.core.entity.product_page import ProductPage, SearchResultCursor
+from browser.core.port.product_fetcher import ProductFetchError
+from browser.core.infra.ttl_cache import TTLCache
+from browser.core.infra.http_cache import HttpCachePolicy
+from browser.adapter.repository.postgresql_migrations import migrate
 
 # 전역 컨테이너 인스턴스
 container = None
@@ -10,18 +15,41 @@ container = None
 async def init():
     global container
     container = BaseContainer()
-    container.wire(modules=[__name__])
+    container.wire(modules=[__name__, "browser.task.image", "browser.task.metrics"])
     config = Settings()
     container.config.from_pydantic(config)
     await container.init_resources()
+    if config.db_migrate_on_startup:
+        applied_versions = await migrate(await container.postgresql_pool())
+        if applied_versions:
+            print(f"📦 스키마 마이그레이션 적용: {applied_versions}")
+    if config.presigned_url_store == "postgresql":
+        presigned_url_repository = await container.presigned_url_repository()
+        await presigned_url_repository.delete_expired()
+    await _warmup_background_remover()
+    image_pipeline = await container.image_pipeline()
+    await image_pipeline.start()
     print("container initialized")
 
 
+async def _warmup_background_remover():
+    """배경 제거 워커들의 rembg 세션을 미리 로드하고 로드 정보를 출력합니다."""
+    background_remover = await container.background_remover()
+    for stats in await background_remover.warmup():
+        print(
+            f"🧠 rembg 세션 로드됨: model={stats.model_name}, pid={stats.pid}, "
+            f"load={stats.load_seconds:.2f}s, memory=+{stats.memory_mb:.1f}MB, "
+            f"peak_rss={stats.peak_rss_mb:.1f}MB"
+        )
+
+
 async def cleanup():
     """컨테이너와 리소스를 정리합니다."""
     global container
     if container:
         try:
+            image_pipeline = await container.image_pipeline()
+            await image_pipeline.close()
             await container.shutdown_resources()
             print("container resources cleaned up")
         except Exception as e:
@@ -49,6 +77,55 @@ async def search_product(
         )
         
         return products
+    except ProductFetchError:
+        raise
     except Exception as e:
         print(f"❌ 제품 검색 중 오류: {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+@inject
+async def search_product_page(
+    query: str,
+    limit: int = 10,
+    cursor: SearchResultCursor = None,
+    use_cache: bool = True,
+    remove_background: bool = True,
+    search_usecase: SearchProduct = Provide[BaseContainer.search_product]
+) -> ProductPage:
+    """
+    제품 검색 함수 (커서 기반 페이지 단위)
+    """
+    try:
+        return await search_usecase.search_product_page(
+            query=query,
+            limit=limit,
+            cursor=cursor,
+            use_cache=use_cache,
+            remove_background=remove_background
+        )
+    except ProductFetchError:
+        raise
+    except Exception as e:
+        print(f"❌ 제품 검색 중 오류: {e}")
+        return ProductPage(products=[])
+
+
+@inject
+async def get_search_response_cache(
+    response_cache: TTLCache = Provide[BaseContainer.search_response_cache]
+) -> TTLCache:
+    """
+    검색 API 응답 본문 캐시를 반환합니다.
+    """
+    return response_cache
+
+
+@inject
+async def get_search_http_cache_policy(
+    http_cache_policy: HttpCachePolicy = Provide[BaseContainer.search_http_cache_policy]
+) -> HttpCachePolicy:
+    """
+    검색 API 응답의 HTTP 캐시 정책을 반환합니다.
+    """
+    return http_cache_policy
@@ -0,0 +1,143 @@
+"""
+네이버 쇼핑 검색 응답 파싱 마이크로벤치마크
+
+응답 본문(bytes)을 Product 목록으로 변환하는 시간을 비교합니다.
+- legacy: 표준 json 디코딩 + 매번 컴파일하는 re.sub 태그/공백 정리 + unescape
+- fast: orjson 디코딩 + 미리 컴파일한 패턴, 태그/엔티티가 없으면 바로 반환 (NaverFetcher._parse_response)
+--responses로 저장해 둔 네이버 응답(JSON 파일)을 지정하지 않으면 같은 형태의 응답을 만들어 사용합니다.
+
+사용법:
+    uv run python -m scripts.benchmark_naver_parse --pages 10
+    uv run python -m scripts.benchmark_naver_parse --responses recorded/*.json
+"""
+import argparse
+import json
+import random
+import re
+import statistics
+import time
+from html import unescape
+from pathlib import Path
+from typing import List
+
+from browser.adapter.product_fetcher.naver_fetcher import NaverFetcher
+from browser.core.entity.product import Product
+
+_MAKERS = ["Apple", "삼성전자", "LG전자", "", "샤오미"]
+_MALLS = ["네이버", "쿠팡", "11번가", "G마켓", "하이마트 &amp; 전자랜드"]
+_CATEGORIES = ["디지털/가전", "휴대폰", "스마트폰", "아이폰"]
+
+
+def _make_response(page: int, display: int = 100) -> bytes:
+    """네이버 쇼핑 검색 응답과 같은 형태의 응답 본문을 만듭니다. (검색어 강조 태그, 엔티티 포함)"""
+    rng = random.Random(page)
+    items = []
+    for index in range(display):
+        product_id = f"{page:03d}{index:05d}"
+        items.append({
+            "title": f"<b>아이폰</b> 15 Pro {rng.choice(['128GB', '256GB', '512GB'])} 자급제 &quot;정품&quot;  {product_id}",
+            "link": f"https://search.shopping.naver.com/catalog/{product_id}",
+            "image": f"https://shopping-phinf.pstatic.net/main_{product_id}/{product_id}.jpg",
+            "lprice": str(rng.randint(100, 2000) * 1000),
+            "hprice": "",
+            "mallName": rng.choice(_MALLS),
+            "productId": product_id,
+            "productType": "1",
+            "brand": "Apple",
+            "maker": rng.choice(_MAKERS),
+            **{f"category{depth + 1}": category for depth, category in enumerate(_CATEGORIES)},
+        })
+    return json.dumps({
+        "lastBuildDate": "Mon, 01 Jan 2024 00:00:00 +0900",
+        "total": 735,
+        "start": page * display + 1,
+        "display": display,
+        "items": items,
+    }, ensure_ascii=False).encode()
+
+
+def _legacy_clean_html_tags(text: str) -> str:
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = unescape(text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _legacy_parse_price(price_str: str) -> float:
+    if not price_str:
+        return 0.0
+    try:
+        price_str = re.sub(r'[^\d.]', '', price_str)
+        return float(price_str) if price_str else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _legacy_parse(body: bytes) -> List[Product]:
+    """변경 전 방식으로 응답을 Product 목록으로 변환합니다."""
+    data = json.loads(body.decode())
+    products = []
+    for item in data.get("items", []):
+        categories = []
+        for i in range(1, 5):
+            category = item.get(f"category{i}")
+            if not category:
+                break
+            categories.append(_legacy_clean_html_tags(category))
+        products.append(Product(
+            id=item.get("productId", ""),
+            name=_legacy_clean_html_tags(item.get("title", "")),
+            price=_legacy_parse_price(item.get("lprice", "0")),
+            image_url=item.get("image", ""),
+            url=item.get("link", ""),
+            mall_name=_legacy_clean_html_tags(item.get("mallName", "")),
+            product_type=item.get("productType", ""),
+            maker=_legacy_clean_html_tags(item.get("maker", "")),
+            categories=categories,
+        ))
+    return products
+
+
+def _measure(func, repeat: int) -> float:
+    """함수를 여러 번 실행해 실행 시간 중앙값을 반환합니다. (ms)"""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def main(pages: int, repeat: int, responses: List[str]):
+    if responses:
+        bodies = [Path(path).read_bytes() for path in responses]
+    else:
+        bodies = [_make_response(page) for page in range(pages)]
+
+    fetcher = NaverFetcher(naver_client=None, credential_pool=None)
+
+    # 두 방식의 결과가 같은지 먼저 확인
+    legacy_products = [product for body in bodies for product in _legacy_parse(body)]
+    fast_products = [product for body in bodies for product in fetcher._parse_response(body)[0]]
+    assert legacy_products == fast_products, "파싱 결과가 다릅니다"
+
+    legacy_ms = _measure(lambda: [_legacy_parse(body) for body in bodies], repeat)
+    fast_ms = _measure(lambda: [fetcher._parse_response(body) for body in bodies], repeat)
+
+    items = len(fast_products)
+    print(f"응답 {len(bodies)}개 ({items}개 아이템, {sum(map(len, bodies)) / 1024:.0f}KB), {repeat}회 중앙값")
+    print(f"{'mode':>8} {'total(ms)':>10} {'per item(µs)':>13}")
+    for mode, elapsed in (("legacy", legacy_ms), ("fast", fast_ms)):
+        print(f"{mode:>8} {elapsed:>10.2f} {elapsed * 1000 / items:>13.2f}")
+    print(f"{'speedup':>8} {legacy_ms / fast_ms:>10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 쇼핑 검색 응답 파싱 마이크로벤치마크")
+    parser.add_argument("--pages", type=int, default=10, help="만들 응답 수 (응답당 100개 아이템)")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--responses", nargs="*", default=[], help="저장해 둔 네이버 응답 JSON 파일 (지정하면 --pages 무시)")
+    args = parser.parse_args()
+
+    main(pages=args.pages, repeat=args.repeat, responses=args.responses)
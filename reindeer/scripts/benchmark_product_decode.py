@@ -0,0 +1,135 @@
+"""
+제품 조회 결과 디코딩 마이크로벤치마크
+
+10k행을 조회해 Product 객체로 변환하는 시간을 비교합니다.
+- legacy: 기본 코덱(JSONB를 문자열로 수신) + dict(result) + json.loads
+- codec: orjson 기반 JSONB 바이너리 코덱 + Record에서 바로 Product 생성
+운영 테이블을 건드리지 않도록 별도 스키마에 테이블을 만들고 끝나면 삭제합니다.
+
+사용법:
+    uv run python -m scripts.benchmark_product_decode --rows 10000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import asyncpg
+
+from browser.adapter.repository.postgresql_migrations import migrate
+from browser.adapter.repository.postgresql_repository import PostgreSQLRepository
+from browser.core.entity.product import Product
+from browser.core.infra.postgresql_client import create_postgresql_pool
+from browser.di.config import Settings
+
+SELECT_QUERY = """
+SELECT id, name, price, image_url, url, mall_name,
+       product_type, maker, categories
+FROM products
+"""
+
+
+def _legacy_decode(results):
+    """변경 전 방식으로 Product 목록을 만듭니다."""
+    products = []
+    for result in results:
+        result = dict(result)
+        categories = json.loads(result['categories']) if result['categories'] else []
+        products.append(Product(
+            id=result['id'],
+            name=result['name'],
+            price=result['price'],
+            image_url=result['image_url'],
+            url=result['url'],
+            mall_name=result['mall_name'],
+            product_type=result['product_type'],
+            maker=result['maker'],
+            categories=categories,
+        ))
+    return products
+
+
+def _measure(func, repeat: int):
+    """함수를 여러 번 실행해 실행 시간 중앙값을 반환합니다. (ms)"""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+async def _measure_fetch(pool: asyncpg.Pool, repeat: int):
+    """조회(네트워크 + 컬럼 디코딩) 시간 중앙값과 결과를 반환합니다. (ms)"""
+    durations = []
+    async with pool.acquire() as conn:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            results = await conn.fetch(SELECT_QUERY)
+            durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations), results
+
+
+async def main(rows: int, repeat: int, schema: str):
+    settings = Settings()
+    connect_args = dict(
+        host=settings.db_host, port=settings.db_port, user=settings.db_user,
+        password=settings.db_password, database=settings.db_name,
+        server_settings={"search_path": f"{schema},public"},
+    )
+    admin = await asyncpg.connect(**{k: v for k, v in connect_args.items() if k != "server_settings"})
+    await admin.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    legacy_pool = await asyncpg.create_pool(**connect_args, min_size=1, max_size=1)
+    codec_pool = await create_postgresql_pool(
+        settings.db_host, settings.db_port, settings.db_user, settings.db_password, settings.db_name,
+        min_size=1, max_size=1, server_settings=connect_args["server_settings"],
+    )
+
+    try:
+        await migrate(codec_pool)
+        repository = PostgreSQLRepository(codec_pool, copy_threshold=0)
+        await repository.save_products([
+            Product(
+                id=f"bench-{index}",
+                name=f"벤치마크 제품 {index} 256GB 블랙",
+                price=float(1000 + index),
+                image_url=f"https://example.com/{index}.jpg",
+                url=f"https://example.com/products/{index}",
+                mall_name="벤치마크몰",
+                product_type="1",
+                maker="Reindeer",
+                categories=["디지털/가전", "휴대폰", "스마트폰", "아이폰"],
+            )
+            for index in range(rows)
+        ])
+
+        legacy_fetch_ms, legacy_results = await _measure_fetch(legacy_pool, repeat)
+        codec_fetch_ms, codec_results = await _measure_fetch(codec_pool, repeat)
+
+        legacy_decode_ms = _measure(lambda: _legacy_decode(legacy_results), repeat)
+        codec_decode_ms = _measure(
+            lambda: [repository._create_product_from_record(result) for result in codec_results],
+            repeat,
+        )
+
+        print(f"{rows}행, {repeat}회 중앙값")
+        print(f"{'mode':>8} {'fetch(ms)':>10} {'decode(ms)':>11} {'total(ms)':>10}")
+        print(f"{'legacy':>8} {legacy_fetch_ms:>10.2f} {legacy_decode_ms:>11.2f} {legacy_fetch_ms + legacy_decode_ms:>10.2f}")
+        print(f"{'codec':>8} {codec_fetch_ms:>10.2f} {codec_decode_ms:>11.2f} {codec_fetch_ms + codec_decode_ms:>10.2f}")
+    finally:
+        await legacy_pool.close()
+        await codec_pool.close()
+        await admin.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await admin.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="제품 조회 결과 디코딩 마이크로벤치마크")
+    parser.add_argument("--rows", type=int, default=10000, help="조회할 행 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--schema", default="bench_product_decode", help="벤치마크용 스키마 이름")
+    args = parser.parse_args()
+
+    asyncio.run(main(rows=args.rows, repeat=args.repeat, schema=args.schema))
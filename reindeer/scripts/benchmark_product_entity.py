@@ -0,0 +1,107 @@
+"""
+Product 표현 방식별 생성 비용 마이크로벤치마크
+
+제품 1k개를 만드는 CPU 시간과 메모리(할당 후 남는 크기)를 비교합니다.
+- pydantic: 변경 전 Product (BaseModel, 생성할 때마다 검증)
+- construct: 같은 BaseModel을 model_construct로 검증 없이 생성
+- dataclass: 현재 Product (slots dataclass)
+API 응답 경로(외부 API/DB에서 만든 Product를 ProductResponse로 검증)까지 합친 시간도 함께 출력합니다.
+
+사용법:
+    uv run python -m scripts.benchmark_product_entity --count 1000
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Callable, List
+
+from pydantic import BaseModel
+
+from app.dto.product_dto import ProductResponse
+from browser.core.entity.product import Product
+
+
+class PydanticProduct(BaseModel):
+    """변경 전 Product (검증하는 BaseModel)"""
+    id: str
+    name: str
+    price: float
+    image_url: str
+    url: str
+    mall_name: str
+    product_type: str
+    maker: str
+    categories: list[str]
+
+
+def _rows(count: int) -> List[dict]:
+    return [
+        {
+            "id": f"bench-{index}",
+            "name": f"벤치마크 제품 {index} 256GB 블랙",
+            "price": float(1000 + index),
+            "image_url": f"https://example.com/{index}.jpg",
+            "url": f"https://example.com/products/{index}",
+            "mall_name": "벤치마크몰",
+            "product_type": "1",
+            "maker": "Reindeer",
+            "categories": ["디지털/가전", "휴대폰", "스마트폰", "아이폰"],
+        }
+        for index in range(count)
+    ]
+
+
+def _measure(func: Callable[[], object], repeat: int) -> float:
+    """함수를 여러 번 실행해 실행 시간 중앙값을 반환합니다. (ms)"""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def _retained_bytes(func: Callable[[], object]) -> int:
+    """함수가 만든 객체가 살아 있는 동안 남아 있는 할당 크기를 반환합니다. (입력 값은 제외)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main(count: int, repeat: int):
+    rows = _rows(count)
+    modes = {
+        "pydantic": lambda: [PydanticProduct(**row) for row in rows],
+        "construct": lambda: [PydanticProduct.model_construct(**row) for row in rows],
+        "dataclass": lambda: [Product(**row) for row in rows],
+    }
+
+    print(f"제품 {count}개, {repeat}회 중앙값")
+    print(f"{'mode':>10} {'create(ms)':>11} {'memory(KB)':>11} {'bytes/item':>11} {'+response(ms)':>14}")
+    for mode, create in modes.items():
+        products = create()
+        create_ms = _measure(create, repeat)
+        retained = _retained_bytes(create)
+        # API 경계 검증까지 포함 (변경 전에는 생성 시 검증 + 응답 검증을 모두 거침)
+        response_ms = _measure(
+            lambda: [ProductResponse.model_validate(product) for product in create()],
+            repeat,
+        )
+        print(
+            f"{mode:>10} {create_ms:>11.2f} {retained / 1024:>11.1f} "
+            f"{retained / len(products):>11.0f} {response_ms:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Product 표현 방식별 생성 비용 마이크로벤치마크")
+    parser.add_argument("--count", type=int, default=1000, help="만들 제품 수")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    main(count=args.count, repeat=args.repeat)
@@ -0,0 +1,130 @@
+"""
+제품 저장(upsert) 방식별 처리 시간 벤치마크
+
+같은 제품 묶음을 방식별로 신규 저장(insert), 내용이 바뀐 재저장(update),
+내용이 같은 재저장(noop) 순으로 수행해 처리 시간을 비교합니다.
+- per-row: 제품마다 save_product를 병렬 호출 (기존 방식, 제품 수만큼 커넥션 사용)
+- unnest: 배열 파라미터 unnest + INSERT ... ON CONFLICT 한 번
+- copy: COPY로 임시 스테이징 테이블 적재 후 INSERT ... ON CONFLICT 한 번
+운영 테이블을 건드리지 않도록 별도 스키마에 테이블을 만들고 끝나면 삭제합니다.
+
+사용법:
+    uv run python -m scripts.benchmark_product_upsert --sizes 10,1000,100000
+"""
+import argparse
+import asyncio
+import time
+
+import asyncpg
+
+from browser.adapter.repository.postgresql_migrations import migrate
+from browser.adapter.repository.postgresql_repository import PostgreSQLRepository
+from browser.core.entity.product import Product
+from browser.core.infra.postgresql_client import create_postgresql_pool
+from browser.di.config import Settings
+
+MODES = ("per-row", "unnest", "copy")
+
+# per-row는 제품 수만큼 쿼리를 보내므로 이 크기를 넘으면 측정하지 않습니다
+MAX_PER_ROW_SIZE = 10000
+
+
+def _make_products(size: int, revision: int = 0):
+    """벤치마크용 제품 목록을 생성합니다."""
+    return [
+        Product(
+            id=f"bench-{index}",
+            name=f"벤치마크 제품 {index} 256GB 블랙",
+            price=float(1000 + index + revision),
+            image_url=f"https://example.com/{index}.jpg",
+            url=f"https://example.com/products/{index}",
+            mall_name="벤치마크몰",
+            product_type="1",
+            maker="Reindeer",
+            categories=["디지털/가전", "휴대폰"],
+        )
+        for index in range(size)
+    ]
+
+
+async def _reset_table(pool: asyncpg.Pool):
+    """제품 테이블을 비웁니다."""
+    async with pool.acquire() as conn:
+        await conn.execute("TRUNCATE products")
+
+
+async def _save(repository: PostgreSQLRepository, mode: str, products):
+    """방식별로 제품을 저장합니다."""
+    if mode == "per-row":
+        await asyncio.gather(*(repository.save_product(product) for product in products))
+    else:
+        # copy_threshold로 unnest/copy 경로를 고정합니다
+        repository.copy_threshold = 0 if mode == "copy" else len(products) + 1
+        await repository.save_products(products)
+
+
+async def main(sizes, modes, schema: str):
+    settings = Settings()
+    admin = await asyncpg.connect(
+        host=settings.db_host, port=settings.db_port, user=settings.db_user,
+        password=settings.db_password, database=settings.db_name,
+    )
+    await admin.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    pool = await create_postgresql_pool(
+        settings.db_host, settings.db_port, settings.db_user, settings.db_password, settings.db_name,
+        min_size=settings.db_pool_min_size, max_size=settings.db_pool_max_size,
+        server_settings={"search_path": f"{schema},public"},
+    )
+    await migrate(pool)
+    repository = PostgreSQLRepository(pool)
+    # 커넥션 생성 비용이 측정에 섞이지 않도록 풀을 미리 채웁니다
+    await asyncio.gather(*(pool.execute("SELECT 1") for _ in range(pool.get_max_size())))
+
+    print(f"{'rows':>8} {'mode':>8} {'insert(ms)':>11} {'update(ms)':>11} {'noop(ms)':>11} {'rows/s':>10}")
+    try:
+        for size in sizes:
+            inserted = _make_products(size)
+            updated = _make_products(size, revision=1)
+
+            for mode in modes:
+                if mode == "per-row" and size > MAX_PER_ROW_SIZE:
+                    print(f"{size:>8} {mode:>8} {'skip':>11} {'skip':>11} {'skip':>11} {'-':>10}")
+                    continue
+
+                await _reset_table(pool)
+                started = time.perf_counter()
+                await _save(repository, mode, inserted)
+                insert_ms = (time.perf_counter() - started) * 1000
+
+                started = time.perf_counter()
+                await _save(repository, mode, updated)
+                update_ms = (time.perf_counter() - started) * 1000
+
+                started = time.perf_counter()
+                await _save(repository, mode, updated)
+                noop_ms = (time.perf_counter() - started) * 1000
+
+                print(
+                    f"{size:>8} {mode:>8} {insert_ms:>11.1f} {update_ms:>11.1f} {noop_ms:>11.1f} "
+                    f"{size / (insert_ms / 1000):>10.0f}"
+                )
+        print(f"저장 통계: {repository.stats()}")
+    finally:
+        await pool.close()
+        await admin.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await admin.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="제품 저장 방식별 처리 시간 벤치마크")
+    parser.add_argument("--sizes", default="10,1000,100000", help="저장할 제품 수 목록 (쉼표 구분)")
+    parser.add_argument("--modes", default=",".join(MODES), help="저장 방식 목록 (쉼표 구분)")
+    parser.add_argument("--schema", default="bench_product_upsert", help="벤치마크용 스키마 이름")
+    args = parser.parse_args()
+
+    asyncio.run(main(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        modes=args.modes.split(","),
+        schema=args.schema,
+    ))
@@ -0,0 +1,175 @@
+"""
+검색 API 응답 경로 처리량 벤치마크
+
+검색 결과(제품 N개)를 돌려주는 비용만 비교하도록 검색은 고정된 페이지를 반환하는 함수로 바꾸고,
+uvicorn 서버 프로세스를 띄워 로컬 부하 생성기(aiohttp, 동시 요청 C개)로 처리량과 지연 시간을 잽니다.
+- legacy: Product -> ProductResponse -> SearchResponse 생성 후 response_model로 다시 검증/직렬화 (변경 전)
+- encoded: dataclass를 orjson으로 바로 인코딩 (use_cache=false, 매번 검색 + 인코딩)
+- cached: 같은 요청의 인코딩된 본문을 캐시에서 그대로 반환 (use_cache=true)
+- revalidate: 이전 응답의 ETag를 If-None-Match로 보내 본문 없는 304를 받음 (CDN/클라이언트 재검증)
+
+사용법:
+    uv run python -m scripts.benchmark_search_endpoint --products 10 --concurrency 32 --duration 5
+"""
+import argparse
+import asyncio
+import importlib
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import aiohttp
+
+
+def _create_app(products: int, latency_ms: float):
+    """검색을 고정 페이지로 바꾼 벤치마크용 앱을 만듭니다."""
+    from fastapi import FastAPI, Query
+
+    from app.dto.product_dto import ProductResponse, SearchResponse
+    from browser.core.entity.product import Product
+    from browser.core.entity.product_page import ProductPage
+    from browser.core.infra.http_cache import HttpCachePolicy
+    from browser.core.infra.ttl_cache import TTLCache
+
+    # app.router 패키지가 같은 이름의 APIRouter를 내보내므로 모듈은 importlib로 가져옴
+    product_router = importlib.import_module("app.router.product_router")
+    page = ProductPage(products=[
+        Product(
+            id=f"bench-{index}",
+            name=f"벤치마크 제품 {index} 256GB 블랙",
+            price=float(1000 + index),
+            image_url=f"https://example.com/{index}.jpg",
+            url=f"https://example.com/products/{index}",
+            mall_name="벤치마크몰",
+            product_type="1",
+            maker="Reindeer",
+            categories=["디지털/가전", "휴대폰", "스마트폰", "아이폰"],
+        )
+        for index in range(products)
+    ], updated_at=[datetime(2024, 1, 1)] * products)
+    response_cache = TTLCache(max_size=1000, ttl_seconds=60)
+    http_cache_policy = HttpCachePolicy(max_age=30, stale_while_revalidate=60)
+
+    async def search_product_page(**kwargs):
+        # 저장소 조회 시간을 흉내 냄
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return page
+
+    async def get_search_response_cache():
+        return response_cache
+
+    async def get_search_http_cache_policy():
+        return http_cache_policy
+
+    product_router.search_product_page = search_product_page
+    product_router.get_search_response_cache = get_search_response_cache
+    product_router.get_search_http_cache_policy = get_search_http_cache_policy
+
+    app = FastAPI()
+    app.include_router(product_router.router)
+
+    @app.get("/legacy/search", response_model=SearchResponse)
+    async def legacy_search(query: str = Query(...), use_cache: bool = True, remove_background: bool = True):
+        result = await search_product_page(query=query)
+        product_responses = [ProductResponse.model_validate(product) for product in result.products]
+        return SearchResponse(
+            products=product_responses,
+            total_count=len(product_responses),
+            next_cursor=None,
+            query=query,
+            use_cache=use_cache,
+            remove_background=remove_background,
+        )
+
+    return app
+
+
+async def _load(url: str, concurrency: int, duration: float, headers: dict = None, status: int = 200):
+    """duration초 동안 동시 요청 concurrency개로 url을 호출하고 (요청 수, 지연 시간 목록)을 반환합니다."""
+    latencies = []
+    deadline = time.perf_counter() + duration
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+        async def worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                async with session.get(url, headers=headers) as response:
+                    await response.read()
+                    assert response.status == status, response.status
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return len(latencies), latencies
+
+
+async def _wait_ready(base_url: str, server: subprocess.Popen, timeout: float = 30.0):
+    started = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        while time.perf_counter() - started < timeout and server.poll() is None:
+            try:
+                async with session.get(f"{base_url}/docs") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("벤치마크 서버가 시작되지 않았습니다")
+
+
+async def main(port: int, products: int, latency_ms: float, concurrency: int, duration: float):
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen([
+        sys.executable, "-m", "scripts.benchmark_search_endpoint", "--serve",
+        "--port", str(port), "--products", str(products), "--latency-ms", str(latency_ms),
+    ])
+    try:
+        await _wait_ready(base_url, server)
+        search_url = f"{base_url}/api/v1/products/search?query=bench"
+        async with aiohttp.ClientSession() as session:
+            async with session.get(search_url) as response:
+                etag = response.headers["ETag"]
+
+        # (url, 요청 헤더, 기대 상태 코드)
+        scenarios = {
+            "legacy": (f"{base_url}/legacy/search?query=bench", None, 200),
+            "encoded": (f"{search_url}&use_cache=false", None, 200),
+            "cached": (search_url, None, 200),
+            "revalidate": (search_url, {"If-None-Match": etag}, 304),
+        }
+
+        print(f"제품 {products}개/응답, 조회 지연 {latency_ms}ms, 동시 요청 {concurrency}개, {duration}s")
+        print(f"{'mode':>10} {'req/s':>9} {'p50(ms)':>8} {'p99(ms)':>8}")
+        for mode, (url, headers, status) in scenarios.items():
+            await _load(url, concurrency, 1.0, headers, status)  # 워밍업
+            count, latencies = await _load(url, concurrency, duration, headers, status)
+            latencies.sort()
+            p50 = statistics.median(latencies) * 1000
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+            print(f"{mode:>10} {count / duration:>9.0f} {p50:>8.2f} {p99:>8.2f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="검색 API 응답 경로 처리량 벤치마크")
+    parser.add_argument("--port", type=int, default=8765, help="벤치마크 서버 포트")
+    parser.add_argument("--products", type=int, default=10, help="응답 하나의 제품 수")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="검색 한 번의 흉내 지연 시간 (ms)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        import uvicorn
+
+        uvicorn.run(
+            _create_app(args.products, args.latency_ms),
+            host="127.0.0.1", port=args.port, log_level="warning", access_log=False,
+        )
+    else:
+        asyncio.run(main(args.port, args.products, args.latency_ms, args.concurrency, args.duration))
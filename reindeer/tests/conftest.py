@@ -0,0 +1,131 @@
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from browser.adapter.product_fetcher.naver_fetcher import NaverFetcher
+from browser.core.infra.naver_credential_pool import NaverCredential, NaverCredentialPool
+from browser.core.infra.rate_limiter import TokenBucket
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def naver_api_response() -> Dict[str, Any]:
+    """네이버 쇼핑 검색 API의 정상 응답 본문"""
+    return json.loads((FIXTURES_DIR / "naver_api_response.json").read_text(encoding="utf-8"))
+
+
+class FakeNaverApi:
+    """
+    네이버 쇼핑 검색 API(/v1/search/shop.json)를 흉내 내는 가짜 서버입니다.
+
+    respond()로 넣어 둔 응답을 요청 순서대로 돌려주고, 다 쓰면 default_body로 200을 응답합니다.
+    받은 요청의 쿼리와 헤더는 requests에 남습니다.
+    """
+
+    def __init__(self, default_body: Dict[str, Any]):
+        self.default_body = default_body
+        self.responses: List[web.Response] = []
+        self.requests: List[Dict[str, Any]] = []
+
+    def respond(self, status: int = 200, body: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> None:
+        """다음 요청에 돌려줄 응답을 추가합니다."""
+        self.responses.append(web.json_response(body if body is not None else self.default_body, status=status, headers=headers))
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append({"query": dict(request.query), "headers": dict(request.headers)})
+        if self.responses:
+            return self.responses.pop(0)
+        return web.json_response(self.default_body)
+
+
+@pytest_asyncio.fixture
+async def naver_api(naver_api_response):
+    """가짜 네이버 API 서버"""
+    api = FakeNaverApi(naver_api_response)
+    app = web.Application()
+    app.router.add_get("/v1/search/shop.json", api.handle)
+    server = TestServer(app)
+    await server.start_server()
+    api.url = str(server.make_url("/"))
+    yield api
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def naver_client(naver_api):
+    """가짜 네이버 API 서버로 요청하는 aiohttp 세션 (실제 네이버 클라이언트처럼 base_url 사용)"""
+    async with aiohttp.ClientSession(base_url=naver_api.url) as session:
+        yield session
+
+
+@pytest.fixture
+def make_naver_fetcher(naver_client):
+    """가짜 서버로 요청하는 NaverFetcher를 만듭니다. (기본값: 키 1개, 속도 제한 없음, 짧은 백오프)"""
+
+    def make(keys: int = 1, rate: float = 0, burst: int = 1, **kwargs) -> NaverFetcher:
+        pool = NaverCredentialPool([
+            NaverCredential(f"client-{index}", f"secret-{index}", TokenBucket(rate, burst))
+            for index in range(keys)
+        ])
+        kwargs.setdefault("retry_base_delay", 0.01)
+        kwargs.setdefault("retry_max_delay", 0.1)
+        return NaverFetcher(naver_client, pool, **kwargs)
+
+    return make
+
+
+class FakeConnection:
+    """FakePool이 빌려 주는 커넥션 (제품 조회는 풀의 rows에서, 병합은 입력 행 수를 돌려줌)"""
+
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    async def fetch(self, query: str, product_ids: List[str]) -> List[tuple]:
+        self.pool.queries.append("fetch")
+        return [self.pool.rows[product_id] for product_id in product_ids if product_id in self.pool.rows]
+
+    async def fetchrow(self, query: str, product_id: str) -> Optional[tuple]:
+        self.pool.queries.append("fetchrow")
+        return self.pool.rows.get(product_id)
+
+    async def fetchval(self, query: str, *columns: Any) -> int:
+        self.pool.queries.append("fetchval")
+        return len(columns[0])
+
+
+class FakePool:
+    """
+    asyncpg.Pool 대신 쓰는 가짜 풀입니다.
+
+    빌려 간 커넥션에서 실행한 쿼리 종류를 queries에 남기고, fail이면 커넥션을 빌려 주지 않습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows: Dict[str, tuple] = {}
+        self.queries: List[str] = []
+        self.fail = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self.fail:
+            raise ConnectionRefusedError(f"{self.name} 연결 실패")
+        yield FakeConnection(self)
+
+
+@pytest.fixture
+def primary_pool() -> FakePool:
+    return FakePool("primary")
+
+
+@pytest.fixture
+def replica_pools() -> List[FakePool]:
+    return [FakePool("replica-0"), FakePool("replica-1")]
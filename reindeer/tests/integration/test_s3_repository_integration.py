@@ -0,0 +1,145 @@
+from typing import List
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from moto.server import ThreadedMotoServer
+
+from browser.adapter.repository.s3_repository import S3Repository
+from browser.core.infra.s3_client import create_s3_client
+from browser.core.infra.ttl_cache import TTLCache
+
+pytestmark = pytest.mark.integration
+
+BUCKET_NAME = "reindeer-test-images"
+IMAGE_BYTES = b"\xff\xd8\xff\xe0original-image"
+NO_BACKGROUND_BYTES = b"\x89PNGno-background-image"
+
+
+class FakeBackgroundRemover:
+    """입력 대신 고정된 PNG 바이트를 돌려주는 배경 제거기"""
+
+    def __init__(self):
+        self.calls: List[bytes] = []
+
+    async def remove_background(self, image_data: bytes) -> bytes:
+        self.calls.append(image_data)
+        return NO_BACKGROUND_BYTES
+
+
+@pytest.fixture(scope="module")
+def moto_endpoint():
+    """로컬 S3 호환 서버 (moto server)"""
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
+
+
+@pytest_asyncio.fixture
+async def s3_client(moto_endpoint):
+    """애플리케이션과 같은 방식으로 만든 공유 aioboto3 클라이언트 (테스트마다 빈 버킷)"""
+    client_gen = create_s3_client("testing", "testing", "us-east-1", moto_endpoint)
+    client = await client_gen.__anext__()
+    await client.create_bucket(Bucket=BUCKET_NAME)
+    yield client
+    listed = await client.list_objects_v2(Bucket=BUCKET_NAME)
+    for item in listed.get("Contents", []):
+        await client.delete_object(Bucket=BUCKET_NAME, Key=item["Key"])
+    await client.delete_bucket(Bucket=BUCKET_NAME)
+    await client_gen.aclose()
+
+
+@pytest_asyncio.fixture
+async def image_url():
+    """원본 이미지를 내려주는 가짜 쇼핑몰 서버의 이미지 URL"""
+
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(body=IMAGE_BYTES, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/a.jpg", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/a.jpg"))
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def http_session():
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+@pytest.fixture
+def background_remover():
+    return FakeBackgroundRemover()
+
+
+@pytest.fixture
+def repository(s3_client, http_session, background_remover):
+    return S3Repository(
+        s3_client,
+        BUCKET_NAME,
+        http_session,
+        background_remover,
+        presigned_url_cache=TTLCache(max_size=100, ttl_seconds=60),
+    )
+
+
+class TestS3RepositoryWithMotoServer:
+    @pytest.mark.asyncio
+    async def test_save_image_puts_both_variants_to_bucket(self, repository, s3_client, image_url, background_remover):
+        # Act
+        saved = await repository.save_image(image_url, remove_background=True)
+
+        # Assert
+        image_id = repository.get_image_id(image_url)
+        original = await s3_client.head_object(Bucket=BUCKET_NAME, Key=f"images/original/{image_id}.jpg")
+        no_background = await s3_client.head_object(Bucket=BUCKET_NAME, Key=f"images/no-bg/{image_id}.png")
+        assert saved is True
+        assert original["ContentType"] == "image/jpeg"
+        assert no_background["ContentType"] == "image/png"
+        assert background_remover.calls == [IMAGE_BYTES]
+
+    @pytest.mark.asyncio
+    async def test_get_existing_image_ids_with_new_repository_checks_bucket(self, repository, s3_client, http_session, image_url):
+        # Arrange: 다른 인스턴스가 저장해 로컬에 기록이 없는 상태
+        await repository.save_image(image_url, remove_background=False)
+        fresh_repository = S3Repository(s3_client, BUCKET_NAME, http_session, FakeBackgroundRemover())
+        image_id = fresh_repository.get_image_id(image_url)
+
+        # Act
+        original_ids = await fresh_repository.get_existing_image_ids([image_id, "missing"])
+        no_background_ids = await fresh_repository.get_existing_image_ids([image_id], with_background=False)
+
+        # Assert: head_object의 404는 없는 것으로 처리
+        assert original_ids == {image_id}
+        assert no_background_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_get_image_returns_presigned_url_serving_stored_object(self, repository, http_session, image_url):
+        # Arrange
+        await repository.save_image(image_url, remove_background=False)
+        image_id = repository.get_image_id(image_url)
+
+        # Act
+        url = await repository.get_image(image_id)
+        cached_url = await repository.get_image(image_id)
+
+        # Assert: 서명한 URL로 실제 객체를 내려받고, 두 번째 조회는 캐시된 URL을 재사용
+        async with http_session.get(url) as response:
+            assert response.status == 200
+            assert await response.read() == IMAGE_BYTES
+        assert cached_url == url
+
+    @pytest.mark.asyncio
+    async def test_get_image_with_missing_object_returns_none(self, repository):
+        # Act
+        url = await repository.get_image("missing")
+
+        # Assert
+        assert url is None
@@ -0,0 +1,197 @@
+import asyncio
+import time
+
+import pytest
+
+from browser.adapter.product_fetcher import naver_fetcher
+from browser.core.port.product_fetcher import ProductFetchError
+
+
+class TestNaverFetcher:
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_success_returns_products(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher()
+
+        # Act
+        products = await fetcher.fetch_product("아이폰 14")
+
+        # Assert
+        assert [product.id for product in products] == ["1001", "1002"]
+        assert products[0].name == "아이폰 14 128GB"
+        assert products[0].categories == ["디지털/가전", "휴대폰", "자급제폰"]
+        assert naver_api.requests[0]["query"]["query"] == "아이폰 14"
+        assert naver_api.requests[0]["headers"]["X-Naver-Client-Id"] == "client-0"
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_429_then_success_retries_and_slows_key(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher(rate=100, burst=10)
+        naver_api.respond(429, {"errorCode": "012", "errorMessage": "Rate limit exceeded"})
+
+        # Act
+        products = await fetcher.fetch_product("아이폰")
+
+        # Assert
+        assert len(products) == 2
+        assert len(naver_api.requests) == 2
+        assert fetcher.stats()["retries"] == 1
+        assert fetcher.stats()["throttled"] == 1
+        assert fetcher.credential_pool.credentials[0].rate_limiter.paused == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_5xx_retries_with_jittered_exponential_backoff(self, naver_api, make_naver_fetcher, monkeypatch):
+        # Arrange
+        fetcher = make_naver_fetcher(retry_base_delay=0.01, retry_max_delay=0.03)
+        for status in (500, 502, 503):
+            naver_api.respond(status, {"errorMessage": "server error"})
+        backoff_ranges = []
+
+        def uniform(low, high):
+            backoff_ranges.append((low, high))
+            return high / 2
+
+        monkeypatch.setattr(naver_fetcher.random, "uniform", uniform)
+
+        # Act
+        products = await fetcher.fetch_product("아이폰")
+
+        # Assert: 0 ~ min(최대, 기본 * 2^시도) 사이에서 무작위로 기다림
+        assert len(products) == 2
+        assert len(naver_api.requests) == 4
+        assert backoff_ranges == [(0, 0.01), (0, 0.02), (0, 0.03)]
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_retry_after_header_waits_that_long(self, naver_api, make_naver_fetcher, monkeypatch):
+        # Arrange
+        fetcher = make_naver_fetcher()
+        naver_api.respond(503, {"errorMessage": "unavailable"}, headers={"Retry-After": "0.2"})
+        monkeypatch.setattr(naver_fetcher.random, "uniform", pytest.fail)
+
+        # Act
+        started = time.monotonic()
+        products = await fetcher.fetch_product("아이폰")
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert len(products) == 2
+        assert elapsed >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_retries_exhausted_raises_retryable_error(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher(max_retries=2)
+        for _ in range(3):
+            naver_api.respond(503, {"errorMessage": "unavailable"}, headers={"Retry-After": "0.01"})
+
+        # Act
+        with pytest.raises(ProductFetchError) as exc_info:
+            await fetcher.fetch_product("아이폰")
+
+        # Assert
+        assert exc_info.value.retryable is True
+        assert exc_info.value.retry_after == pytest.approx(0.01)
+        assert len(naver_api.requests) == 3
+        assert fetcher.stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_quota_exceeded_rotates_to_other_key_without_waiting(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher(keys=2, retry_base_delay=1.0, retry_max_delay=1.0)
+        naver_api.respond(429, {"errorCode": "010", "errorMessage": "Quota exceeded"})
+
+        # Act
+        started = time.monotonic()
+        products = await fetcher.fetch_product("아이폰")
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert len(products) == 2
+        assert elapsed < 0.5
+        used_keys = [request["headers"]["X-Naver-Client-Id"] for request in naver_api.requests]
+        assert len(set(used_keys)) == 2
+        assert fetcher.stats()["quota_exceeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_client_error_raises_non_retryable_error_without_retry(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher()
+        naver_api.respond(400, {"errorCode": "SE01", "errorMessage": "Incorrect query request"})
+
+        # Act
+        with pytest.raises(ProductFetchError) as exc_info:
+            await fetcher.fetch_product("아이폰")
+
+        # Assert
+        assert exc_info.value.retryable is False
+        assert exc_info.value.retry_after is None
+        assert len(naver_api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_all_keys_invalid_raises_non_retryable_error(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher(keys=2)
+        for _ in range(2):
+            naver_api.respond(401, {"errorCode": "024", "errorMessage": "Authentication failed"})
+
+        # Act
+        with pytest.raises(ProductFetchError) as exc_info:
+            await fetcher.fetch_product("아이폰")
+
+        # Assert
+        assert exc_info.value.retryable is False
+        assert len(naver_api.requests) == 2
+        assert all(credential.disabled for credential in fetcher.credential_pool.credentials)
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_queued_caller_past_deadline_fails_without_request(self, naver_api, make_naver_fetcher):
+        # Arrange: 초당 1번만 보낼 수 있는데 대기 기한은 0.3초
+        fetcher = make_naver_fetcher(rate=1, burst=1, request_deadline=0.3)
+        await fetcher.fetch_product("첫 요청")
+
+        # Act
+        started = time.monotonic()
+        with pytest.raises(ProductFetchError) as exc_info:
+            await fetcher.fetch_product("대기 요청")
+        elapsed = time.monotonic() - started
+
+        # Assert: 토큰을 기다리지 않고 바로 실패하며, 언제 다시 시도할지 알려 줌
+        assert elapsed < 0.1
+        assert exc_info.value.retryable is True
+        assert 0 < exc_info.value.retry_after <= 1.0
+        assert len(naver_api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_concurrent_callers_fails_only_those_past_deadline(self, naver_api, make_naver_fetcher):
+        # Arrange: 0.1초마다 1번, 대기 기한 0.25초 -> 처음 3개만 기한 안에 보낼 수 있음
+        fetcher = make_naver_fetcher(rate=10, burst=1, request_deadline=0.25)
+
+        # Act
+        results = await asyncio.gather(
+            *(fetcher.fetch_product(f"검색어 {index}") for index in range(5)),
+            return_exceptions=True,
+        )
+
+        # Assert
+        succeeded = [result for result in results if not isinstance(result, Exception)]
+        failed = [result for result in results if isinstance(result, ProductFetchError)]
+        assert len(succeeded) == 3
+        assert len(failed) == 2
+        assert len(naver_api.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_product_with_retry_after_beyond_deadline_stops_retrying(self, naver_api, make_naver_fetcher):
+        # Arrange
+        fetcher = make_naver_fetcher(request_deadline=0.5)
+        naver_api.respond(503, {"errorMessage": "unavailable"}, headers={"Retry-After": "5"})
+
+        # Act
+        started = time.monotonic()
+        with pytest.raises(ProductFetchError) as exc_info:
+            await fetcher.fetch_product("아이폰")
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert elapsed < 0.1
+        assert exc_info.value.retry_after == 5
+        assert len(naver_api.requests) == 1
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from browser.adapter.repository.postgresql_repository import PostgreSQLRepository
+from browser.core.entity.product import Product
+
+UPDATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_product(product_id: str) -> Product:
+    return Product(
+        id=product_id,
+        name=f"제품 {product_id}",
+        price=1000.0,
+        image_url=f"https://example.com/{product_id}.jpg",
+        url=f"https://example.com/{product_id}",
+        mall_name="테스트몰",
+        product_type="1",
+        maker="",
+        categories=[],
+    )
+
+
+def make_row(product_id: str) -> tuple:
+    """_GET_PRODUCTS 조회 결과와 같은 컬럼 순서의 행"""
+    product = make_product(product_id)
+    return (
+        product.id, product.name, product.price, product.image_url, product.url,
+        product.mall_name, product.product_type, product.maker, product.categories, UPDATED_AT,
+    )
+
+
+@pytest.fixture
+def repository(primary_pool, replica_pools):
+    for pool in (primary_pool, *replica_pools):
+        pool.rows = {product_id: make_row(product_id) for product_id in ("a", "b")}
+    return PostgreSQLRepository(primary_pool, replica_pools=replica_pools)
+
+
+class TestPostgreSQLRepositoryRouting:
+    @pytest.mark.asyncio
+    async def test_get_products_without_recent_write_reads_from_replica(self, repository, primary_pool, replica_pools):
+        # Act
+        products = await repository.get_products(["a", "b"])
+
+        # Assert
+        assert {product.id for product in products} == {"a", "b"}
+        assert replica_pools[0].queries == ["fetch"]
+        assert primary_pool.queries == []
+
+    @pytest.mark.asyncio
+    async def test_save_products_writes_to_primary_and_reads_after_write_from_primary(self, repository, primary_pool, replica_pools):
+        # Act
+        await repository.save_products([make_product("a")])
+        await repository.get_products(["a"])
+
+        # Assert: 복제 지연을 피해 방금 쓴 프로세스는 주 풀에서 읽음
+        assert primary_pool.queries == ["fetchval", "fetch"]
+        assert all(pool.queries == [] for pool in replica_pools)
+
+    @pytest.mark.asyncio
+    async def test_get_products_after_read_after_write_window_reads_from_replica(self, primary_pool, replica_pools):
+        # Arrange
+        replica_pools[0].rows["a"] = make_row("a")
+        repository = PostgreSQLRepository(primary_pool, replica_pools=replica_pools, read_after_write_seconds=0)
+        await repository.save_products([make_product("a")])
+
+        # Act
+        await repository.get_products(["a"])
+
+        # Assert
+        assert primary_pool.queries == ["fetchval"]
+        assert replica_pools[0].queries == ["fetch"]
+
+    @pytest.mark.asyncio
+    async def test_get_products_with_rows_missing_on_replica_reads_missing_from_primary(self, repository, primary_pool, replica_pools):
+        # Arrange: 다른 워커가 방금 저장해 복제본에 아직 없는 제품
+        primary_pool.rows["c"] = make_row("c")
+
+        # Act
+        products = await repository.get_products(["a", "c"])
+
+        # Assert
+        assert {product.id for product in products} == {"a", "c"}
+        assert primary_pool.queries == ["fetch"]
+        assert repository.primary_fallbacks == 1
+
+    @pytest.mark.asyncio
+    async def test_get_products_with_failing_replica_falls_back_to_primary(self, repository, primary_pool, replica_pools):
+        # Arrange
+        replica_pools[0].fail = True
+
+        # Act
+        products = await repository.get_products(["a", "b"])
+
+        # Assert
+        assert {product.id for product in products} == {"a", "b"}
+        assert primary_pool.queries == ["fetch"]
+        assert repository.primary_fallbacks == 1
+        assert repository.stats()["pools"]["replica-0"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_product_with_failing_replica_falls_back_to_primary(self, repository, primary_pool, replica_pools):
+        # Arrange
+        replica_pools[0].fail = True
+
+        # Act
+        product = await repository.get_product("a")
+
+        # Assert
+        assert product.id == "a"
+        assert primary_pool.queries == ["fetchrow"]
+        assert repository.primary_fallbacks == 1
@@ -0,0 +1,104 @@
+from typing import List, Optional, Set
+
+import pytest
+from botocore.exceptions import ClientError
+
+from browser.adapter.repository.s3_repository import S3Repository
+from browser.core.entity.image_manifest import ImageManifestEntry
+
+
+class FakeS3Client:
+    """객체 키만 기억하는 S3 클라이언트 (head_object/put_object 호출을 기록)"""
+
+    def __init__(self, keys: Optional[Set[str]] = None):
+        self.keys = set(keys or ())
+        self.head_calls: List[str] = []
+
+    async def head_object(self, Bucket: str, Key: str) -> dict:
+        self.head_calls.append(Key)
+        if Key not in self.keys:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    async def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType: str) -> dict:
+        self.keys.add(Key)
+        return {}
+
+
+class FakeImageManifest:
+    """메모리 매니페스트 (fail_writes면 기록에 실패)"""
+
+    def __init__(self, complete: bool = False):
+        self.entries = {}
+        self.complete = complete
+        self.generation = 0
+        self.fail_writes = False
+
+    async def save_entries(self, entries: List[ImageManifestEntry]) -> None:
+        if self.fail_writes:
+            raise ConnectionError("manifest unavailable")
+        self.entries.update(((entry.image_id, entry.variant), entry) for entry in entries)
+
+    async def get_existing_image_ids(self, image_ids: List[str], variant: str) -> Set[str]:
+        return {image_id for image_id in image_ids if (image_id, variant) in self.entries}
+
+    async def is_complete(self) -> bool:
+        return self.complete
+
+    async def mark_incomplete(self) -> None:
+        self.complete = False
+        self.generation += 1
+
+
+def make_repository(s3_client, manifest) -> S3Repository:
+    return S3Repository(s3_client, "test-bucket", http_session=None, background_remover=None, image_manifest=manifest)
+
+
+class TestS3RepositoryManifest:
+    @pytest.mark.asyncio
+    async def test_get_existing_image_ids_before_reconcile_checks_s3_for_manifest_misses(self):
+        # Arrange: 매니페스트에 없는 기존 S3 이미지
+        s3_client = FakeS3Client({"images/original/old.jpg"})
+        repository = make_repository(s3_client, FakeImageManifest(complete=False))
+
+        # Act
+        existing_ids = await repository.get_existing_image_ids(["old", "new"])
+
+        # Assert
+        assert existing_ids == {"old"}
+        assert sorted(s3_client.head_calls) == ["images/original/new.jpg", "images/original/old.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_get_existing_image_ids_after_reconcile_trusts_manifest(self):
+        # Arrange
+        s3_client = FakeS3Client({"images/original/recorded.jpg"})
+        manifest = FakeImageManifest(complete=True)
+        await manifest.save_entries([
+            ImageManifestEntry(image_id="recorded", variant="original", s3_key="images/original/recorded.jpg")
+        ])
+        repository = make_repository(s3_client, manifest)
+
+        # Act
+        existing_ids = await repository.get_existing_image_ids(["recorded", "new"])
+
+        # Assert: 매니페스트가 완전하면 S3에 확인하지 않음
+        assert existing_ids == {"recorded"}
+        assert s3_client.head_calls == []
+
+    @pytest.mark.asyncio
+    async def test_put_object_with_manifest_write_failure_falls_back_to_s3_checks(self):
+        # Arrange
+        s3_client = FakeS3Client()
+        manifest = FakeImageManifest(complete=True)
+        manifest.fail_writes = True
+        repository = make_repository(s3_client, manifest)
+        await repository._put_object("unrecorded", b"image", "https://example.com/a.jpg")
+        repository._known_keys.clear()
+
+        # Act
+        existing_ids = await repository.get_existing_image_ids(["unrecorded"])
+
+        # Assert: 기록하지 못한 이미지도 S3에서 찾음
+        assert existing_ids == {"unrecorded"}
+        assert manifest.complete is False
+        assert s3_client.head_calls == ["images/original/unrecorded.jpg"]
@@ -0,0 +1,90 @@
+import importlib
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from browser.core.entity.product_page import ProductPage
+from browser.core.infra.http_cache import HttpCachePolicy
+from browser.core.infra.ttl_cache import TTLCache
+
+# app.router는 같은 이름의 APIRouter를 내보내므로 모듈은 따로 가져옴
+product_router = importlib.import_module("app.router.product_router")
+
+
+@pytest.fixture
+def search_app(monkeypatch):
+    """제품 라우터만 등록하고 캐시 의존성을 테스트용 인스턴스로 바꾼 앱"""
+    response_cache = TTLCache(max_size=100, ttl_seconds=60)
+    http_cache = HttpCachePolicy()
+
+    async def get_search_response_cache():
+        return response_cache
+
+    async def get_search_http_cache_policy():
+        return http_cache
+
+    monkeypatch.setattr(product_router, "get_search_response_cache", get_search_response_cache)
+    monkeypatch.setattr(product_router, "get_search_http_cache_policy", get_search_http_cache_policy)
+    app = FastAPI()
+    app.include_router(product_router.router)
+    return app
+
+
+def use_fetcher(monkeypatch, fetcher) -> None:
+    """검색이 가짜 서버로 요청하는 NaverFetcher 결과를 그대로 쓰도록 바꿈"""
+
+    async def search_product_page(query, limit=10, cursor=None, use_cache=True, remove_background=True):
+        return ProductPage(products=await fetcher.fetch_product(query, display=limit))
+
+    monkeypatch.setattr(product_router, "search_product_page", search_product_page)
+
+
+async def get(app: FastAPI, path: str, **params) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, params=params)
+
+
+class TestSearchProductsRouter:
+    @pytest.mark.asyncio
+    async def test_search_with_success_returns_products(self, search_app, naver_api, make_naver_fetcher, monkeypatch):
+        # Arrange
+        use_fetcher(monkeypatch, make_naver_fetcher())
+
+        # Act
+        response = await get(search_app, "/api/v1/products/search", query="아이폰", use_cache=False)
+
+        # Assert
+        assert response.status_code == 200
+        assert [product["id"] for product in response.json()["products"]] == ["1001", "1002"]
+        assert response.headers["ETag"]
+
+    @pytest.mark.asyncio
+    async def test_search_with_naver_429_exhausted_returns_503_with_retry_after(self, search_app, naver_api, make_naver_fetcher, monkeypatch):
+        # Arrange
+        use_fetcher(monkeypatch, make_naver_fetcher(max_retries=1))
+        for _ in range(2):
+            naver_api.respond(429, {"errorCode": "012", "errorMessage": "Rate limit exceeded"}, headers={"Retry-After": "0.01"})
+
+        # Act
+        response = await get(search_app, "/api/v1/products/search", query="아이폰", use_cache=False)
+
+        # Assert: 빈 결과가 아니라 잠시 후 다시 시도하라는 응답
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert len(naver_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_search_with_naver_client_error_returns_500_without_retry_after(self, search_app, naver_api, make_naver_fetcher, monkeypatch):
+        # Arrange
+        use_fetcher(monkeypatch, make_naver_fetcher())
+        naver_api.respond(400, {"errorCode": "SE01", "errorMessage": "Incorrect query request"})
+
+        # Act
+        response = await get(search_app, "/api/v1/products/search", query="아이폰", use_cache=False)
+
+        # Assert
+        assert response.status_code == 500
+        assert "Retry-After" not in response.headers
+        assert len(naver_api.requests) == 1
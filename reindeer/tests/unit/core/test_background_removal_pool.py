@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from browser.core.infra.background_removal_pool import BackgroundRemovalPool
+
+
+class TestBackgroundRemovalPool:
+    def test_init_with_unsupported_model_raises_value_error(self):
+        # Act & Assert: 워커 프로세스를 띄우기 전에 설정 오류를 알림
+        with pytest.raises(ValueError, match="지원하지 않는 배경 제거 모델"):
+            BackgroundRemovalPool(model_name="isnet-general-use")
+
+    @pytest.mark.asyncio
+    async def test_close_with_batch_waiting_for_worker_cancels_waiting_callers(self):
+        # Arrange: 빈 워커가 없어 디스패처가 꺼낸 배치를 넘기지 못하고 기다리는 상태
+        pool = BackgroundRemovalPool(max_workers=1, max_batch_wait_ms=0)
+        await pool.start()
+        pool._batch_slots = asyncio.Semaphore(0)
+        request = asyncio.create_task(pool.remove_background(b"image"))
+        await asyncio.sleep(0.01)
+        assert pool._queue.empty()
+
+        # Act
+        await pool.close()
+
+        # Assert: 요청이 결과를 영원히 기다리지 않음
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(request, timeout=1)
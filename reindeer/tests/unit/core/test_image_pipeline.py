@@ -0,0 +1,128 @@
+import asyncio
+from typing import List, Set
+
+import pytest
+import pytest_asyncio
+
+from browser.core.entity.image_job import ImageJobStatus
+from browser.core.usecase.image_pipeline import ImagePipeline
+
+
+class FakeImageRepository:
+    """저장한 이미지 변형을 메모리에 기록하는 저장소 (gate를 닫으면 해당 호출이 열릴 때까지 멈춤)"""
+
+    def __init__(self):
+        self.stored = {True: set(), False: set()}
+        self.saved = []
+        self.original_exists_args = []
+        self.save_gate = asyncio.Event()
+        self.save_gate.set()
+        self.check_gate = asyncio.Event()
+        self.check_gate.set()
+
+    def get_image_id(self, image_url: str) -> str:
+        return image_url
+
+    async def get_existing_image_ids(self, image_ids: List[str], with_background: bool = True) -> Set[str]:
+        await self.check_gate.wait()
+        return set(image_ids) & self.stored[with_background]
+
+    async def save_image(self, image_url: str, remove_background: bool = True, original_exists=None) -> bool:
+        await self.save_gate.wait()
+        self.original_exists_args.append(original_exists)
+        self.saved.append((image_url, remove_background))
+        self.stored[True].add(image_url)
+        if remove_background:
+            self.stored[False].add(image_url)
+        return True
+
+
+@pytest_asyncio.fixture
+async def image_repository():
+    return FakeImageRepository()
+
+
+@pytest_asyncio.fixture
+async def pipeline(image_repository):
+    pipeline = ImagePipeline(image_repository, concurrency=1)
+    await pipeline.start()
+    yield pipeline
+    await pipeline.close()
+
+
+class TestImagePipeline:
+    @pytest.mark.asyncio
+    async def test_enqueue_with_same_image_deduplicates_active_job(self, pipeline, image_repository):
+        # Act
+        first = await pipeline.enqueue(["https://example.com/a.jpg"])
+        second = await pipeline.enqueue(["https://example.com/a.jpg"])
+        await pipeline.join()
+
+        # Assert
+        assert first[0] is second[0]
+        assert image_repository.saved == [("https://example.com/a.jpg", True)]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_remove_background_while_original_processing_queues_follow_up(self, pipeline, image_repository):
+        # Arrange: 원본만 요청한 작업이 처리 중
+        image_url = "https://example.com/a.jpg"
+        image_repository.save_gate.clear()
+        await pipeline.enqueue([image_url], remove_background=False)
+        while (await pipeline.get_jobs([image_url]))[0].status != ImageJobStatus.PROCESSING:
+            await asyncio.sleep(0)
+
+        # Act
+        await pipeline.enqueue([image_url], remove_background=True)
+        image_repository.save_gate.set()
+        await pipeline.join()
+
+        # Assert: 원본 작업이 끝난 뒤 배경 제거 작업을 이어서 처리
+        assert image_repository.saved == [(image_url, False), (image_url, True)]
+        job = (await pipeline.get_jobs([image_url]))[0]
+        assert job.remove_background is True
+        assert job.status == ImageJobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_enqueue_remove_background_while_checking_storage_is_not_marked_completed(self, pipeline, image_repository):
+        # Arrange: 원본은 이미 저장되어 있고, 원본만 요청한 작업의 저장 여부를 확인하는 중
+        image_url = "https://example.com/a.jpg"
+        image_repository.stored[True].add(image_url)
+        image_repository.check_gate.clear()
+        await pipeline.enqueue([image_url], remove_background=False)
+        await asyncio.sleep(0)
+
+        # Act
+        await pipeline.enqueue([image_url], remove_background=True)
+        image_repository.check_gate.set()
+        await pipeline.join()
+
+        # Assert: 합쳐진 배경 제거 요청을 빠뜨리지 않음
+        assert image_repository.saved == [(image_url, True)]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_with_stored_image_completes_without_processing(self, pipeline, image_repository):
+        # Arrange
+        image_url = "https://example.com/a.jpg"
+        image_repository.stored[True].add(image_url)
+        image_repository.stored[False].add(image_url)
+
+        # Act
+        jobs = await pipeline.enqueue([image_url])
+        await pipeline.join()
+
+        # Assert
+        assert jobs[0].status == ImageJobStatus.COMPLETED
+        assert image_repository.saved == []
+
+    @pytest.mark.asyncio
+    async def test_enqueue_passes_checked_original_state_to_save_image(self, pipeline, image_repository):
+        # Arrange: 원본만 저장된 이미지와 아무것도 저장되지 않은 이미지
+        image_repository.stored[True].add("https://example.com/a.jpg")
+
+        # Act
+        await pipeline.enqueue(["https://example.com/a.jpg", "https://example.com/b.jpg"])
+        await pipeline.join()
+
+        # Assert: 워커는 일괄 확인한 결과를 넘겨 이미지마다 다시 확인하지 않음
+        assert image_repository.saved == [("https://example.com/a.jpg", True), ("https://example.com/b.jpg", True)]
+        assert image_repository.original_exists_args == [True, False]
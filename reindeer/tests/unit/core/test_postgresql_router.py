@@ -0,0 +1,103 @@
+import pytest
+
+from browser.core.infra.postgresql_router import PoolLatency, PostgreSQLPoolRouter
+
+
+async def acquired_pool_name(router: PostgreSQLPoolRouter, read_only: bool = False) -> str:
+    async with router.acquire(read_only=read_only) as conn:
+        return conn.pool.name
+
+
+class TestPostgreSQLPoolRouter:
+    def test_init_with_unknown_strategy_raises_value_error(self, primary_pool, replica_pools):
+        # Act & Assert
+        with pytest.raises(ValueError, match="지원하지 않는 복제본 라우팅 방식"):
+            PostgreSQLPoolRouter(primary_pool, replica_pools, strategy="random")
+
+    @pytest.mark.asyncio
+    async def test_acquire_read_only_with_round_robin_alternates_replicas(self, primary_pool, replica_pools):
+        # Arrange
+        router = PostgreSQLPoolRouter(primary_pool, replica_pools, strategy="round_robin")
+
+        # Act
+        names = [await acquired_pool_name(router, read_only=True) for _ in range(4)]
+
+        # Assert
+        assert names == ["replica-0", "replica-1", "replica-0", "replica-1"]
+
+    @pytest.mark.asyncio
+    async def test_acquire_read_only_with_least_busy_skips_replica_in_use(self, primary_pool, replica_pools):
+        # Arrange
+        router = PostgreSQLPoolRouter(primary_pool, replica_pools, strategy="least_busy")
+
+        # Act: replica-0의 커넥션을 빌린 채로 읽기
+        async with router.acquire(read_only=True) as busy_conn:
+            name_while_busy = await acquired_pool_name(router, read_only=True)
+        name_after_release = await acquired_pool_name(router, read_only=True)
+
+        # Assert
+        assert busy_conn.pool.name == "replica-0"
+        assert name_while_busy == "replica-1"
+        assert name_after_release == "replica-0"
+
+    @pytest.mark.asyncio
+    async def test_acquire_for_write_uses_primary(self, primary_pool, replica_pools):
+        # Arrange
+        router = PostgreSQLPoolRouter(primary_pool, replica_pools)
+
+        # Act & Assert
+        assert await acquired_pool_name(router) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_acquire_read_only_without_replicas_uses_primary(self, primary_pool):
+        # Arrange
+        router = PostgreSQLPoolRouter(primary_pool)
+
+        # Act & Assert
+        assert await acquired_pool_name(router, read_only=True) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_failing_pool_records_error(self, primary_pool, replica_pools):
+        # Arrange
+        router = PostgreSQLPoolRouter(primary_pool, replica_pools)
+        replica_pools[0].fail = True
+
+        # Act
+        with pytest.raises(ConnectionRefusedError):
+            await acquired_pool_name(router, read_only=True)
+
+        # Assert
+        stats = router.stats()["replica-0"]
+        assert (stats["queries"], stats["errors"], stats["in_flight"]) == (1, 1, 0)
+
+
+class TestPoolLatency:
+    def test_stats_reports_mean_p50_and_p95_in_milliseconds(self):
+        # Arrange: 10ms 쿼리 19번과 500ms 쿼리 1번
+        latency = PoolLatency()
+        for _ in range(19):
+            latency.record(0.010)
+        latency.record(0.500)
+
+        # Act
+        stats = latency.stats()
+
+        # Assert
+        assert stats["queries"] == 20
+        assert stats["mean_ms"] == 34.5
+        assert stats["p50_ms"] == 10.0
+        assert stats["p95_ms"] == 500.0
+
+    def test_stats_keeps_only_recent_window_for_percentiles(self):
+        # Arrange: 창 밖으로 밀려난 느린 쿼리는 백분위에서 빠짐
+        latency = PoolLatency(window=2)
+        latency.record(1.0)
+        latency.record(0.002)
+        latency.record(0.002)
+
+        # Act
+        stats = latency.stats()
+
+        # Assert
+        assert stats["p95_ms"] == 2.0
+        assert stats["queries"] == 3
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import pytest
+
+from browser.core.infra.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_acquire_with_burst_tokens_returns_immediately(self):
+        # Arrange
+        bucket = TokenBucket(rate=10, burst=3)
+
+        # Act
+        started = time.monotonic()
+        results = [await bucket.acquire() for _ in range(3)]
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert results == [True, True, True]
+        assert elapsed < 0.05
+        assert bucket.delayed == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_concurrent_callers_paces_at_rate(self):
+        # Arrange
+        bucket = TokenBucket(rate=20, burst=2)
+        finished = []
+
+        async def call(index: int) -> None:
+            await bucket.acquire()
+            finished.append((index, time.monotonic()))
+
+        # Act
+        started = time.monotonic()
+        await asyncio.gather(*(call(index) for index in range(6)))
+
+        # Assert: 처음 burst개는 바로, 나머지는 1/rate(0.05초) 간격으로 예약한 순서대로 나감
+        assert [index for index, _ in finished] == list(range(6))
+        assert finished[-1][1] - started >= (6 - 2) / 20 - 0.01
+        assert bucket.acquired == 6
+        assert bucket.delayed == 4
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_wait_longer_than_timeout_returns_false_without_reserving(self):
+        # Arrange
+        bucket = TokenBucket(rate=2, burst=1)
+        await bucket.acquire()
+
+        # Act
+        started = time.monotonic()
+        acquired = await bucket.acquire(timeout=0.1)
+        elapsed = time.monotonic() - started
+
+        # Assert: 기다리지 않고 거절하며, 다음 호출의 대기 시간도 늘리지 않음
+        assert acquired is False
+        assert elapsed < 0.05
+        assert bucket.rejected == 1
+        assert bucket.estimated_wait() <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_pause_delays_next_acquire(self):
+        # Arrange
+        bucket = TokenBucket(rate=100, burst=5)
+
+        # Act
+        bucket.pause(0.2)
+        started = time.monotonic()
+        await bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert elapsed >= 0.19
+        assert bucket.paused == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_zero_rate_never_waits(self):
+        # Arrange
+        bucket = TokenBucket(rate=0)
+
+        # Act
+        results = [await bucket.acquire(timeout=0) for _ in range(100)]
+
+        # Assert
+        assert all(results)
+        assert bucket.estimated_wait() == 0.0
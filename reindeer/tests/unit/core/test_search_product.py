@@ -0,0 +1,91 @@
+from typing import List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from browser.core.entity.product import Product
+from browser.core.entity.product_page import ProductPage
+from browser.core.infra.ttl_cache import TTLCache
+from browser.core.usecase.search_product import SearchProduct
+
+
+def make_product(product_id: str) -> Product:
+    return Product(
+        id=product_id,
+        name=f"제품 {product_id}",
+        price=1000.0,
+        image_url=f"https://example.com/{product_id}.jpg",
+        url=f"https://example.com/{product_id}",
+        mall_name="테스트몰",
+        product_type="1",
+        maker="",
+        categories=[],
+    )
+
+
+class FakeProductRepository:
+    """저장한 제품을 메모리에 두고 ID 순서대로 돌려주는 저장소"""
+
+    def __init__(self):
+        self.products = {}
+
+    async def save_products(self, products: List[Product]) -> None:
+        self.products.update((product.id, product) for product in products)
+
+    async def get_products(self, product_ids: List[str]) -> List[Product]:
+        return [self.products[product_id] for product_id in product_ids if product_id in self.products]
+
+    async def get_product_page(self, product_ids: List[str]) -> ProductPage:
+        return ProductPage(products=await self.get_products(product_ids))
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = AsyncMock()
+    fetcher.fetch_product.side_effect = lambda query, display=10, start=1, sort="sim": [
+        make_product(f"p{index:02d}") for index in range(min(display, 25))
+    ]
+    return fetcher
+
+
+@pytest.fixture
+def search_usecase(fetcher):
+    return SearchProduct(
+        fetcher,
+        FakeProductRepository(),
+        AsyncMock(),
+        local_search_cache=TTLCache(max_size=10, ttl_seconds=60),
+        search_result_limit=50,
+    )
+
+
+class TestSearchProductPage:
+    @pytest.mark.asyncio
+    async def test_search_product_page_fetches_result_limit_once_and_pages_through_it(self, search_usecase, fetcher):
+        # Arrange
+        pages = []
+        cursor = None
+
+        # Act
+        while True:
+            page = await search_usecase.search_product_page("아이폰", limit=10, cursor=cursor)
+            pages.append([product.id for product in page.products])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        # Assert: 외부 API는 첫 페이지에서 한 번만, 결과 수만큼 요청
+        assert [len(ids) for ids in pages] == [10, 10, 5]
+        assert pages[1][0] == "p10"
+        fetcher.fetch_product.assert_awaited_once_with("아이폰", display=50)
+
+    @pytest.mark.asyncio
+    async def test_search_product_page_with_result_limit_above_api_max_clamps_display(self, fetcher):
+        # Arrange
+        search_usecase = SearchProduct(fetcher, FakeProductRepository(), AsyncMock(), search_result_limit=1000)
+
+        # Act
+        await search_usecase.search_product_page("아이폰", limit=10)
+
+        # Assert
+        fetcher.fetch_product.assert_awaited_once_with("아이폰", display=100)